@@ -0,0 +1,450 @@
+"""
+回测框架 - 用 BacktestEngine 离线回放录制的 Polymarket 数据
+
+核心原则：
+1. 策略代码不做任何修改，与实盘同一个 MarketMakingStrategy
+2. 完全离线：数据来自本地 ParquetDataCatalog，不访问网络
+3. 结果可复现：同样的数据和参数得到同样的成交和盈亏
+
+报告：盈亏、成交、最大回撤、库存周转、挂单→确认延迟、挂单→成交时长
+"""
+
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.backtest.models import FillModel, LatencyModel
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.data import OrderBookDelta, OrderBookDeltas
+from nautilus_trader.model.enums import AccountType, BookType, OmsType, OrderSide, RecordFlag
+from nautilus_trader.model.identifiers import InstrumentId, TraderId, Venue
+from nautilus_trader.model.objects import Money
+
+from strategies.market_making_strategy import MarketMakingStrategy
+
+
+POLYMARKET_VENUE = Venue("POLYMARKET")
+
+_NANOS_PER_MS = 1_000_000
+_F_LAST = int(RecordFlag.F_LAST)
+
+
+# ========== 数据准备 ==========
+
+def group_deltas(deltas: Iterable[OrderBookDelta]) -> List[OrderBookDeltas]:
+    """
+    把逐条 OrderBookDelta 合并为 OrderBookDeltas 批次
+
+    以 F_LAST 标记为批次边界（品种或时间戳变化时也会切分），
+    与实盘适配器推送的批次一致，策略不会看到半更新的订单簿
+    """
+    batches = []
+    pending = []
+
+    for delta in deltas:
+        if pending and (
+            delta.instrument_id != pending[-1].instrument_id
+            or delta.ts_event != pending[-1].ts_event
+        ):
+            batches.append(OrderBookDeltas(pending[-1].instrument_id, pending))
+            pending = []
+
+        pending.append(delta)
+
+        if delta.flags & _F_LAST:
+            batches.append(OrderBookDeltas(delta.instrument_id, pending))
+            pending = []
+
+    if pending:
+        batches.append(OrderBookDeltas(pending[-1].instrument_id, pending))
+
+    return batches
+
+
+def load_catalog(
+    path: str,
+    instrument_ids: Optional[Sequence[str]] = None,
+    start=None,
+    end=None,
+):
+    """
+    从 ParquetDataCatalog 读取品种、订单簿增量和成交
+
+    Args:
+        path: catalog 目录
+        instrument_ids: 品种列表（None 表示 catalog 中的全部品种）
+        start / end: 时间范围（可选）
+
+    Returns:
+        (instruments, data)
+    """
+    from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+    catalog = ParquetDataCatalog(path)
+    instruments = load_instruments(path, instrument_ids, catalog=catalog)
+
+    ids = [str(instrument.id) for instrument in instruments]
+    deltas = catalog.order_book_deltas(instrument_ids=ids, start=start, end=end)
+    trades = catalog.trade_ticks(instrument_ids=ids, start=start, end=end)
+
+    return instruments, group_deltas(deltas) + list(trades)
+
+
+def load_instruments(path: str, instrument_ids: Optional[Sequence[str]] = None, catalog=None):
+    """从 ParquetDataCatalog 读取品种定义（None 表示全部品种）"""
+    if catalog is None:
+        from nautilus_trader.persistence.catalog import ParquetDataCatalog
+        catalog = ParquetDataCatalog(path)
+
+    instruments = catalog.instruments(instrument_ids=list(instrument_ids) if instrument_ids else None)
+    if not instruments:
+        raise ValueError(f"catalog 中没有找到品种: {path}")
+    return instruments
+
+
+# ========== 结果 ==========
+
+def _percentiles(values: List[int]) -> Dict[str, float]:
+    """纳秒样本 → 毫秒分位数"""
+    if not values:
+        return {}
+
+    values = sorted(values)
+    last = len(values) - 1
+    return {
+        name: values[min(last, int(q * len(values)))] / _NANOS_PER_MS
+        for name, q in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99))
+    } | {"max": values[-1] / _NANOS_PER_MS}
+
+
+@dataclass
+class BacktestResult:
+    """回测结果"""
+
+    instrument_ids: List[str]
+    events: int                  # 回放的数据条数（订单簿增量逐条计数，见 count_events）
+    orders: int                  # 提交的订单数
+    filled_orders: int           # 有成交的订单数
+    fills: int                   # 成交笔数
+    filled_qty: float            # 成交总数量
+    starting_balance: float
+    ending_balance: float        # 期末现金
+    inventory_value: float       # 期末持仓按中间价估值
+    wall_seconds: float          # 实际耗时
+    sim_seconds: float = 0.0     # 回放覆盖的行情时长
+    max_drawdown: float = 0.0    # 逐笔成交盯市权益的最大回撤
+    turnover: float = 0.0        # 库存周转（成交量 / 平均绝对持仓）
+    ack_latency_ms: Dict[str, float] = field(default_factory=dict)
+    fill_latency_ms: Dict[str, float] = field(default_factory=dict)
+    positions: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def pnl(self) -> float:
+        """总盈亏（现金变化 + 持仓估值）"""
+        return self.ending_balance + self.inventory_value - self.starting_balance
+
+    @property
+    def fill_rate(self) -> float:
+        """有成交的订单占比"""
+        return self.filled_orders / self.orders if self.orders else 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """回放速度（行情时长 / 实际耗时）"""
+        return self.sim_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        """格式化报告"""
+        lines = [
+            "=" * 60,
+            "回测结果",
+            "=" * 60,
+            f"品种数: {len(self.instrument_ids)}",
+            f"回放事件: {self.events}  ({self.events_per_second:,.0f} 条/秒, {self.wall_seconds:.2f}s)",
+            f"行情时长: {self.sim_seconds:.1f}s  ({self.speedup:,.1f}x 实时)",
+            f"订单: {self.orders}  有成交: {self.filled_orders}  成交率: {self.fill_rate:.1%}",
+            f"成交: {self.fills} 笔, 共 {self.filled_qty:g} 个",
+            f"期初资金: {self.starting_balance:.2f}",
+            f"期末现金: {self.ending_balance:.2f}  持仓估值: {self.inventory_value:.2f}",
+            f"总盈亏: {self.pnl:+.4f}  最大回撤: {self.max_drawdown:.4f}  库存周转: {self.turnover:.1f}",
+        ]
+        for instrument_id, qty in self.positions.items():
+            lines.append(f"  持仓 {instrument_id}: {qty:g}")
+        if self.ack_latency_ms:
+            lines.append("挂单→确认 (ms): " + _format_percentiles(self.ack_latency_ms))
+        if self.fill_latency_ms:
+            lines.append("挂单→成交 (ms): " + _format_percentiles(self.fill_latency_ms))
+        lines.append("=" * 60)
+        return "\n".join(lines)
+
+
+def _format_percentiles(stats: Dict[str, float]) -> str:
+    return "  ".join(f"{name}={value:.1f}" for name, value in stats.items())
+
+
+# ========== 回测 ==========
+
+def build_engine(
+    instruments,
+    starting_balance: Decimal = Decimal("1000"),
+    latency_ms: float = 0.0,
+    fill_model: Optional[FillModel] = None,
+    modules: Optional[list] = None,
+    trade_execution: bool = True,
+    log_level: str = "ERROR",
+    trader_id: str = "BACKTEST-001",
+) -> BacktestEngine:
+    """
+    创建带模拟 Polymarket 交易所的 BacktestEngine
+
+    账户币种取自品种的计价货币，避免回测中出现汇率换算
+
+    Args:
+        modules: 交易所模拟模块（例如排队位置模型）
+        trade_execution: 成交数据是否参与撮合
+    """
+    engine = BacktestEngine(
+        config=BacktestEngineConfig(
+            trader_id=TraderId(trader_id),
+            logging=LoggingConfig(log_level=log_level),
+        ),
+    )
+
+    currency = instruments[0].quote_currency
+    latency_ns = int(latency_ms * _NANOS_PER_MS)
+
+    engine.add_venue(
+        venue=POLYMARKET_VENUE,
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.CASH,
+        base_currency=currency,
+        starting_balances=[Money(starting_balance, currency)],
+        fill_model=fill_model,
+        latency_model=LatencyModel(base_latency_nanos=latency_ns) if latency_ns else None,
+        modules=modules,
+        book_type=BookType.L2_MBP,
+        trade_execution=trade_execution,
+    )
+
+    for instrument in instruments:
+        engine.add_instrument(instrument)
+
+    return engine
+
+
+def run_backtest(
+    instruments,
+    data,
+    strategy_config,
+    starting_balance: Decimal = Decimal("1000"),
+    latency_ms: float = 0.0,
+    fill_model: Optional[FillModel] = None,
+    modules: Optional[list] = None,
+    trade_execution: bool = True,
+    actors: Sequence = (),
+    log_level: str = "ERROR",
+) -> BacktestResult:
+    """
+    运行一次回测
+
+    Args:
+        instruments: 品种列表
+        data: 订单簿增量批次 / 成交等数据（按时间排序与否均可），
+              或 RecordingReader（分块流式读取，内存不随数据量增长）
+        strategy_config: MarketMakingStrategy 的配置
+        starting_balance: 期初资金
+        latency_ms: 模拟的交易所往返延迟
+        fill_model: 成交模型（None 使用默认）
+        modules: 交易所模拟模块
+        trade_execution: 成交数据是否参与撮合
+        actors: 额外的 Actor（统计、监控等）
+        log_level: 引擎日志级别
+
+    Returns:
+        BacktestResult
+    """
+    engine = build_engine(
+        instruments,
+        starting_balance=starting_balance,
+        latency_ms=latency_ms,
+        fill_model=fill_model,
+        modules=modules,
+        trade_execution=trade_execution,
+        log_level=log_level,
+    )
+
+    try:
+        for actor in actors:
+            engine.add_actor(actor)
+
+        if hasattr(data, "chunks"):
+            # 录制文件分块流式送入（backtest.reader.RecordingReader）
+            engine.add_data_iterator("recordings", data.chunks())
+            sim_ns = data.time_span()
+        else:
+            engine.add_data(data)
+            sim_ns = _time_span(data)
+        engine.add_strategy(MarketMakingStrategy(strategy_config))
+
+        started = time.perf_counter()
+        engine.run()
+        wall_seconds = time.perf_counter() - started
+
+        return collect_result(
+            engine,
+            instruments,
+            events=count_events(data),
+            starting_balance=float(starting_balance),
+            wall_seconds=wall_seconds,
+            sim_seconds=sim_ns / 1e9,
+        )
+    finally:
+        engine.dispose()
+
+
+def collect_result(
+    engine: BacktestEngine,
+    instruments,
+    events: int,
+    starting_balance: float,
+    wall_seconds: float,
+    sim_seconds: float = 0.0,
+) -> BacktestResult:
+    """从引擎 Cache / Portfolio 汇总回测结果"""
+    cache = engine.cache
+    currency = instruments[0].quote_currency
+
+    orders = cache.orders()
+    ack_latency = []
+    fill_latency = []
+    fills = 0
+    filled_orders = 0
+    filled_qty = 0.0
+    fill_events = []
+
+    for order in orders:
+        submitted_ns = order.init_event.ts_init
+        filled = False
+
+        for event in order.events:
+            name = type(event).__name__
+            if name == "OrderAccepted":
+                ack_latency.append(event.ts_event - submitted_ns)
+            elif name == "OrderFilled":
+                fills += 1
+                filled = True
+                fill_events.append(event)
+                fill_latency.append(event.ts_event - submitted_ns)
+
+        if filled:
+            filled_orders += 1
+            filled_qty += order.filled_qty.as_double()
+
+    account = engine.portfolio.account(POLYMARKET_VENUE)
+    ending_balance = account.balance_total(currency).as_double()
+
+    inventory_value = 0.0
+    positions = {}
+    for instrument in instruments:
+        qty = engine.portfolio.net_position(instrument.id)
+        if not qty:
+            continue
+
+        qty = float(qty)
+        positions[str(instrument.id)] = qty
+        inventory_value += qty * _mark_price(cache, instrument.id)
+
+    max_drawdown, turnover = _fill_stats(fill_events)
+
+    return BacktestResult(
+        instrument_ids=[str(instrument.id) for instrument in instruments],
+        events=events,
+        orders=len(orders),
+        filled_orders=filled_orders,
+        fills=fills,
+        filled_qty=filled_qty,
+        starting_balance=starting_balance,
+        ending_balance=ending_balance,
+        inventory_value=inventory_value,
+        wall_seconds=wall_seconds,
+        sim_seconds=sim_seconds,
+        max_drawdown=max_drawdown,
+        turnover=turnover,
+        ack_latency_ms=_percentiles(ack_latency),
+        fill_latency_ms=_percentiles(fill_latency),
+        positions=positions,
+    )
+
+
+def _fill_stats(fill_events) -> tuple:
+    """
+    按时间顺序重放成交，得到 (最大回撤, 库存周转)
+
+    权益 = 现金流 + 各品种持仓 × 该品种最近成交价；
+    库存周转 = 成交总量 / 每笔成交后绝对持仓的均值
+    """
+    cash = 0.0
+    positions: Dict[InstrumentId, float] = {}
+    marks: Dict[InstrumentId, float] = {}
+    peak = 0.0
+    max_drawdown = 0.0
+    traded = 0.0
+    abs_inventory = 0.0
+
+    for event in sorted(fill_events, key=lambda e: e.ts_event):
+        px = event.last_px.as_double()
+        qty = event.last_qty.as_double()
+        signed = qty if event.order_side == OrderSide.BUY else -qty
+
+        cash -= signed * px
+        positions[event.instrument_id] = positions.get(event.instrument_id, 0.0) + signed
+        marks[event.instrument_id] = px
+        traded += qty
+
+        equity = cash + sum(pos * marks[iid] for iid, pos in positions.items())
+        peak = max(peak, equity)
+        max_drawdown = max(max_drawdown, peak - equity)
+        abs_inventory += sum(abs(pos) for pos in positions.values())
+
+    if not fill_events or abs_inventory == 0:
+        return max_drawdown, 0.0
+    return max_drawdown, traded / (abs_inventory / len(fill_events))
+
+
+def count_events(data) -> int:
+    """
+    数据条数：订单簿增量逐条计数，成交 / 报价等每条计 1
+
+    列表中的增量按批次（OrderBookDeltas）存放，录制文件按记录逐条存放，
+    统一按增量计数后两种输入的 events_per_second 可以直接比较
+    """
+    if hasattr(data, "chunks"):
+        # RecordingReader：一条记录即一个增量 / 成交 / 报价
+        return len(data)
+    return sum(len(item.deltas) if isinstance(item, OrderBookDeltas) else 1 for item in data)
+
+
+def _time_span(data) -> int:
+    """数据覆盖的时间范围（纳秒）"""
+    if not data:
+        return 0
+    timestamps = [item.ts_init for item in data]
+    return max(timestamps) - min(timestamps)
+
+
+def _mark_price(cache, instrument_id: InstrumentId) -> float:
+    """期末估值价格：订单簿中间价，没有订单簿时用最后成交价"""
+    book = cache.order_book(instrument_id)
+    if book is not None:
+        mid = book.midpoint()
+        if mid is not None:
+            return float(mid)
+
+    trade = cache.trade_tick(instrument_id)
+    return trade.price.as_double() if trade is not None else 0.0
@@ -0,0 +1,77 @@
+"""
+Paper Trading - 本地模拟 Polymarket 交易所 + 录制行情回放
+
+与回测共用 BacktestEngine，区别在于撮合更保守：
+1. 成交数据不直接撮合，由排队位置模型（QueuePositionModule）决定挂单何时轮到
+2. 订单/仓位事件实时转发给统计（EventTap），统计来自真实的成交事件
+
+回放不受墙钟限制，数小时的行情可以在几秒到几分钟内跑完
+"""
+
+from decimal import Decimal
+from typing import Callable, Optional
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.config import ActorConfig
+
+from .harness import BacktestResult, run_backtest
+from .queue_model import QueuePositionModule
+
+
+class EventTap(Actor):
+    """
+    订单和仓位事件转发器
+
+    订阅消息总线上所有策略的订单事件和仓位事件，逐条交给 handler
+    """
+
+    TOPICS = ("events.order.*", "events.position.*")
+
+    def __init__(self, handler: Callable, config: Optional[ActorConfig] = None):
+        super().__init__(config or ActorConfig(component_id="EventTap"))
+        self._handler = handler
+
+    def on_start(self):
+        for topic in self.TOPICS:
+            self.msgbus.subscribe(topic=topic, handler=self._handler)
+
+    def on_stop(self):
+        for topic in self.TOPICS:
+            self.msgbus.unsubscribe(topic=topic, handler=self._handler)
+
+
+def run_paper_trading(
+    instruments,
+    data,
+    strategy_config,
+    on_event: Optional[Callable] = None,
+    starting_balance: Decimal = Decimal("1000"),
+    latency_ms: float = 0.0,
+    log_level: str = "ERROR",
+) -> BacktestResult:
+    """
+    在本地模拟交易所上运行一次 Paper Trading
+
+    Args:
+        instruments: 品种列表
+        data: 录制的订单簿增量批次和成交
+        strategy_config: MarketMakingStrategy 的配置
+        on_event: 订单/仓位事件回调（None 表示不转发）
+        starting_balance: 期初资金
+        latency_ms: 模拟的交易所往返延迟
+        log_level: 引擎日志级别
+
+    Returns:
+        BacktestResult
+    """
+    return run_backtest(
+        instruments,
+        data,
+        strategy_config,
+        starting_balance=starting_balance,
+        latency_ms=latency_ms,
+        modules=[QueuePositionModule()],
+        trade_execution=False,
+        actors=[EventTap(on_event)] if on_event else (),
+        log_level=log_level,
+    )
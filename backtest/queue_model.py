@@ -0,0 +1,281 @@
+"""
+排队位置模型 - 模拟交易所中被动挂单的成交顺序
+
+默认的撮合只在价格穿过挂单时成交，价格停在挂单价位时要么全成、
+要么按概率成交，忽略了同价位排在我们前面的数量。这里按价位排队建模：
+
+1. 挂单到达时，前方排队量 = 该价位当时的可见数量
+2. 该价位的成交先消耗前方排队量，剩余部分才成交我们的挂单
+3. 非成交导致的数量减少（撤单）按比例分摊到我们前后
+
+数量全部使用 Quantity raw 整数，避免浮点误差
+"""
+
+from typing import Dict, List, Tuple
+
+from nautilus_trader.backtest.config import SimulationModuleConfig
+from nautilus_trader.backtest.modules import SimulationModule
+from nautilus_trader.model.data import OrderBookDeltas, TradeTick
+from nautilus_trader.model.enums import (
+    AggressorSide,
+    BookAction,
+    LiquiditySide,
+    OrderSide,
+)
+from nautilus_trader.model.objects import Quantity
+
+
+class _QueueEntry:
+    """单个挂单的排队状态"""
+
+    __slots__ = ("side", "price_raw", "ahead", "leaves")
+
+    def __init__(self, side: OrderSide, price_raw: int, ahead: int, leaves: int):
+        self.side = side
+        self.price_raw = price_raw
+        self.ahead = ahead      # 前方排队量（raw）
+        self.leaves = leaves    # 剩余未成交量（raw）
+
+
+class QueueTracker:
+    """
+    挂单排队跟踪（与撮合引擎无关，可单独测试）
+
+    买单被卖方主动成交（SELLER）消耗，卖单被买方主动成交（BUYER）消耗；
+    成交价优于挂单价时同样会轮到挂单（价格穿过）
+    """
+
+    def __init__(self):
+        self._entries: Dict[object, _QueueEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, order_id) -> bool:
+        return order_id in self._entries
+
+    def track(self, order_id, side: OrderSide, price_raw: int, ahead: int, leaves: int):
+        """开始跟踪挂单"""
+        self._entries[order_id] = _QueueEntry(side, price_raw, max(ahead, 0), leaves)
+
+    def forget(self, order_id):
+        """停止跟踪（订单结束）"""
+        self._entries.pop(order_id, None)
+
+    def ahead(self, order_id) -> int:
+        """挂单前方排队量"""
+        return self._entries[order_id].ahead
+
+    def order_ids(self) -> List[object]:
+        return list(self._entries)
+
+    # ========== 市场事件 ==========
+
+    def on_level_reduced(self, side: OrderSide, price_raw: int, old_size: int, reduced: int):
+        """
+        价位数量因撤单减少
+
+        撤单可能来自我们前方或后方，按前方排队量占价位数量的比例分摊
+        """
+        if reduced <= 0 or old_size <= 0:
+            return
+
+        for entry in self._entries.values():
+            if entry.side != side or entry.price_raw != price_raw or entry.ahead <= 0:
+                continue
+            share = min(entry.ahead, old_size)
+            entry.ahead -= min(reduced, old_size) * share // old_size
+
+    def on_trade(self, aggressor: AggressorSide, price_raw: int, size: int) -> List[Tuple[object, int]]:
+        """
+        处理一笔成交
+
+        Returns:
+            [(order_id, fill_raw)]：轮到的挂单及其成交量
+        """
+        if aggressor == AggressorSide.SELLER:
+            side = OrderSide.BUY
+        elif aggressor == AggressorSide.BUYER:
+            side = OrderSide.SELL
+        else:
+            return []
+
+        fills = []
+        remaining = size
+
+        # 价格更优的挂单先成交
+        entries = sorted(
+            (
+                (order_id, entry)
+                for order_id, entry in self._entries.items()
+                if entry.side == side and self._reached(entry, price_raw)
+            ),
+            key=lambda item: -item[1].price_raw if side == OrderSide.BUY else item[1].price_raw,
+        )
+
+        for order_id, entry in entries:
+            if remaining <= 0:
+                break
+
+            consumed = min(entry.ahead, remaining)
+            entry.ahead -= consumed
+            remaining -= consumed
+
+            fill = min(remaining, entry.leaves)
+            if fill > 0:
+                entry.leaves -= fill
+                remaining -= fill
+                fills.append((order_id, fill))
+
+        return fills
+
+    @staticmethod
+    def _reached(entry: _QueueEntry, price_raw: int) -> bool:
+        """成交价是否达到挂单价"""
+        if entry.side == OrderSide.BUY:
+            return price_raw <= entry.price_raw
+        return price_raw >= entry.price_raw
+
+
+class QueuePositionModule(SimulationModule):
+    """
+    排队位置撮合模块（挂到 SimulatedExchange 上）
+
+    在交易所处理每条行情之前（pre_process）：
+    - 发现新挂单时按当前可见数量初始化前方排队量
+    - 订单簿增量：非成交导致的价位减少按比例推进队列
+    - 成交：按队列顺序成交轮到的挂单（MAKER，挂单价）
+
+    价格穿过挂单的情况仍由撮合引擎按订单簿成交；
+    使用本模块时交易所应关闭 trade_execution，避免成交被重复处理
+    """
+
+    def __init__(self, config: SimulationModuleConfig = None):
+        super().__init__(config or SimulationModuleConfig())
+
+        # 每个品种一个队列：{instrument_id: QueueTracker}
+        self._trackers: Dict[object, QueueTracker] = {}
+        # 每个品种的价位数量：{instrument_id: {(side, price_raw): size_raw}}
+        self._levels: Dict[object, Dict[Tuple[OrderSide, int], int]] = {}
+        # 已由成交消耗、尚未在订单簿增量中体现的数量
+        self._traded: Dict[Tuple[object, OrderSide, int], int] = {}
+
+        self.queue_fills = 0
+
+    def tracker(self, instrument_id) -> QueueTracker:
+        """品种的排队跟踪器"""
+        tracker = self._trackers.get(instrument_id)
+        if tracker is None:
+            tracker = self._trackers[instrument_id] = QueueTracker()
+        return tracker
+
+    # ========== SimulationModule 接口 ==========
+
+    def pre_process(self, data):
+        if isinstance(data, OrderBookDeltas):
+            self._sync_orders(data.instrument_id)
+            self._on_deltas(data)
+        elif isinstance(data, TradeTick):
+            self._sync_orders(data.instrument_id)
+            self._on_trade(data)
+
+    def process(self, ts_now: int):
+        pass
+
+    def log_diagnostics(self, logger):
+        tracked = sum(len(tracker) for tracker in self._trackers.values())
+        logger.info(f"QueuePositionModule: {self.queue_fills} 笔排队成交, 跟踪 {tracked} 个挂单")
+
+    def reset(self):
+        self._trackers.clear()
+        self._levels.clear()
+        self._traded.clear()
+        self.queue_fills = 0
+
+    # ========== 内部 ==========
+
+    def _sync_orders(self, instrument_id):
+        """同步交易所上的挂单（新挂单入队，结束的出队）"""
+        tracker = self.tracker(instrument_id)
+        levels = self._levels.setdefault(instrument_id, {})
+        open_ids = set()
+
+        for order in self.exchange.get_open_orders(instrument_id):
+            order_id = order.client_order_id
+            open_ids.add(order_id)
+            if order_id in tracker or not order.has_price:
+                continue
+
+            price_raw = order.price.raw
+            ahead = levels.get((order.side, price_raw), 0)
+            tracker.track(order_id, order.side, price_raw, ahead, order.leaves_qty.raw)
+
+        for order_id in tracker.order_ids():
+            if order_id not in open_ids:
+                tracker.forget(order_id)
+
+    def _on_deltas(self, deltas: OrderBookDeltas):
+        """应用一批增量，比较批次前后的价位数量"""
+        instrument_id = deltas.instrument_id
+        tracker = self.tracker(instrument_id)
+        levels = self._levels.setdefault(instrument_id, {})
+        before = dict(levels)
+        touched = set()
+
+        for delta in deltas.deltas:
+            action = delta.action
+            if action == BookAction.CLEAR:
+                touched.update(levels)
+                levels.clear()
+                continue
+
+            order = delta.order
+            key = (order.side, order.price.raw)
+            touched.add(key)
+
+            if action == BookAction.DELETE or order.size.raw == 0:
+                levels.pop(key, None)
+            else:
+                levels[key] = order.size.raw
+
+        for key in touched:
+            old = before.get(key, 0)
+            reduced = old - levels.get(key, 0)
+            if reduced <= 0:
+                continue
+
+            # 先扣除成交已消耗的部分，剩余才视为撤单
+            traded = self._traded.pop((instrument_id,) + key, 0)
+            tracker.on_level_reduced(key[0], key[1], old, reduced - min(traded, reduced))
+
+    def _on_trade(self, tick: TradeTick):
+        """成交：按排队顺序成交挂单"""
+        instrument_id = tick.instrument_id
+        fills = self.tracker(instrument_id).on_trade(
+            tick.aggressor_side, tick.price.raw, tick.size.raw,
+        )
+
+        # 记录被消耗的价位数量（随后的增量会体现同样的减少）
+        hit_side = OrderSide.BUY if tick.aggressor_side == AggressorSide.SELLER else OrderSide.SELL
+        traded_key = (instrument_id, hit_side, tick.price.raw)
+        self._traded[traded_key] = self._traded.get(traded_key, 0) + tick.size.raw
+
+        if not fills:
+            return
+
+        matching_engine = self.exchange.get_matching_engine(instrument_id)
+
+        for order_id, fill_raw in fills:
+            order = self.cache.order(order_id)
+            if order is None or order.is_closed:
+                continue
+
+            positions = self.cache.positions_open(instrument_id=instrument_id)
+            matching_engine.fill_order(
+                order,
+                order.price,
+                Quantity.from_raw(fill_raw, order.quantity.precision),
+                LiquiditySide.MAKER,
+                venue_position_id=positions[0].id if positions else None,
+            )
+            self.queue_fills += 1
@@ -0,0 +1,247 @@
+"""
+行情录制 - 把实盘收到的订单簿增量、报价、成交写入定长记录文件
+
+文件布局（每个市场、每个 UTC 日一个文件，只追加）：
+    <root>/<instrument_id>/<YYYY-MM-DD>.bin       记录数组（records.RECORD_DTYPE）
+    <root>/<instrument_id>/<YYYY-MM-DD>.bin.json  品种旁注（ID、精度）
+
+热路径设计：
+1. 回调里只把数据对象追加到列表，不编码、不做 IO
+2. 攒够 batch_size 条或定时器到期时整批交给后台写线程
+3. 写线程编码为 NumPy 记录数组后一次 write；队列满时丢弃批次并计数，绝不阻塞事件循环
+4. 写入出错（磁盘满、未登记品种）时记录日志并计数，写线程继续运行；停止时最多等待 close_timeout 秒
+"""
+
+import json
+import queue
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.common.component import Logger
+from nautilus_trader.config import ActorConfig
+from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.identifiers import InstrumentId
+
+from .records import InstrumentTable, encode, meta_path
+
+
+_NANOS_PER_DAY = 86_400 * 1_000_000_000
+
+
+def _day(ts_ns: int) -> str:
+    """纳秒时间戳 → UTC 日期字符串"""
+    return datetime.fromtimestamp(ts_ns // _NANOS_PER_DAY * 86_400, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def recording_path(root, instrument_id, day: str) -> Path:
+    return Path(root) / str(instrument_id) / f"{day}.bin"
+
+
+class RecordWriter:
+    """
+    后台写线程
+
+    接收数据批次，按 (品种, UTC 日) 分组编码后追加到对应文件，
+    日期变化时关闭旧文件（轮转）
+
+    Args:
+        root: 录制目录
+        max_pending: 队列中最多积压的批次数，超出后丢弃
+        close_timeout: close() 等待写线程结束的最长秒数
+    """
+
+    def __init__(self, root, max_pending: int = 256, close_timeout: float = 10.0):
+        self.root = Path(root)
+        self.close_timeout = close_timeout
+        self.records_written = 0
+        self.batches_written = 0
+        self.batches_dropped = 0
+        self.write_errors = 0
+
+        # nautilus Logger 可以在写线程中使用
+        self.log = Logger(type(self).__name__)
+
+        self._tables: Dict[InstrumentId, InstrumentTable] = {}
+        self._files: Dict[InstrumentId, Tuple[str, object]] = {}
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, instrument_id: InstrumentId, price_precision: int, size_precision: int):
+        """登记品种精度（写入前必须登记）"""
+        self._tables[instrument_id] = InstrumentTable([(instrument_id, price_precision, size_precision)])
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="record-writer", daemon=True)
+            self._thread.start()
+
+    def submit(self, batch: list) -> bool:
+        """提交一批数据（不阻塞），队列已满时返回 False"""
+        try:
+            self._queue.put_nowait(batch)
+            return True
+        except queue.Full:
+            self.batches_dropped += 1
+            return False
+
+    def close(self):
+        """
+        写完队列中剩余的批次后关闭所有文件
+
+        最多等待 close_timeout 秒，写线程卡住（例如磁盘 IO 挂起）时放弃等待，不阻塞节点停止
+        """
+        thread = self._thread
+        if thread is not None:
+            self._thread = None
+            if thread.is_alive():
+                try:
+                    self._queue.put(None, timeout=self.close_timeout)
+                    thread.join(self.close_timeout)
+                except queue.Full:
+                    pass
+
+            if thread.is_alive():
+                # 文件仍被写线程使用，不在这里关闭
+                self.log.error(f"[ERROR] 写线程 {self.close_timeout:.0f} 秒内未结束，放弃剩余批次")
+                return
+
+        for _, f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+
+            try:
+                self.write(batch)
+            except Exception as e:
+                # 单个批次失败不能终止写线程，否则队列写满后所有数据都被静默丢弃
+                self.write_errors += 1
+                self.log.error(f"[ERROR] 行情写入失败，丢弃 {len(batch)} 条: {e!r}")
+
+    def write(self, batch: list):
+        """编码并追加一批数据（写线程内调用，也可在测试中直接调用）"""
+        groups: Dict[Tuple[InstrumentId, str], list] = {}
+        for item in batch:
+            key = (item.instrument_id, _day(item.ts_init))
+            groups.setdefault(key, []).append(item)
+
+        for (instrument_id, day), items in groups.items():
+            records = encode(items, self._tables[instrument_id])
+            self._file(instrument_id, day).write(records.tobytes())
+            self.records_written += len(records)
+
+        for _, f in self._files.values():
+            f.flush()
+        self.batches_written += 1
+
+    def _file(self, instrument_id: InstrumentId, day: str):
+        current = self._files.get(instrument_id)
+        if current is not None:
+            if current[0] == day:
+                return current[1]
+            current[1].close()
+
+        path = recording_path(self.root, instrument_id, day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not meta_path(path).exists():
+            meta_path(path).write_text(json.dumps(self._tables[instrument_id].to_json()))
+
+        f = open(path, "ab")
+        self._files[instrument_id] = (day, f)
+        return f
+
+
+class MarketDataRecorder(Actor):
+    """
+    行情录制 Actor
+
+    与策略订阅相同的数据（L2_MBP 增量、报价、成交），交给 RecordWriter 落盘
+
+    Args:
+        root: 录制目录
+        instrument_ids: 要录制的品种
+        batch_size: 攒够多少条数据提交一次
+        flush_interval_ms: 定时提交间隔（低频市场也能及时落盘）
+    """
+
+    TIMER_NAME = "recorder-flush"
+
+    def __init__(
+        self,
+        root,
+        instrument_ids: Sequence,
+        batch_size: int = 1024,
+        flush_interval_ms: int = 500,
+        config: Optional[ActorConfig] = None,
+    ):
+        super().__init__(config or ActorConfig(component_id="MarketDataRecorder"))
+        self.instrument_ids = [
+            InstrumentId.from_str(iid) if isinstance(iid, str) else iid
+            for iid in instrument_ids
+        ]
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self.writer = RecordWriter(root)
+
+        self._pending: List = []
+
+    def on_start(self):
+        for instrument_id in self.instrument_ids:
+            instrument = self.cache.instrument(instrument_id)
+            if instrument is None:
+                self.log.error(f"[ERROR] 找不到品种，跳过录制: {instrument_id}")
+                continue
+
+            self.writer.register(instrument_id, instrument.price_precision, instrument.size_precision)
+            self.subscribe_order_book_deltas(instrument_id, BookType.L2_MBP)
+            self.subscribe_quote_ticks(instrument_id)
+            self.subscribe_trade_ticks(instrument_id)
+
+        self.writer.start()
+        self.clock.set_timer(
+            name=self.TIMER_NAME,
+            interval=timedelta(milliseconds=self.flush_interval_ms),
+            callback=lambda event: self.flush(),
+        )
+        self.log.info(f"[OK] 行情录制已启动: {self.writer.root}")
+
+    def on_stop(self):
+        if self.TIMER_NAME in self.clock.timer_names:
+            self.clock.cancel_timer(self.TIMER_NAME)
+
+        self.flush()
+        self.writer.close()
+        self.log.info(
+            f"[OK] 行情录制已停止: {self.writer.records_written} 条记录, "
+            f"丢弃 {self.writer.batches_dropped} 批, 写入失败 {self.writer.write_errors} 批"
+        )
+
+    # ========== 数据回调（热路径：只追加） ==========
+
+    def on_order_book_deltas(self, deltas):
+        self._append(deltas)
+
+    def on_quote_tick(self, tick):
+        self._append(tick)
+
+    def on_trade_tick(self, tick):
+        self._append(tick)
+
+    def _append(self, item):
+        pending = self._pending
+        pending.append(item)
+        if len(pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """把积攒的数据交给写线程"""
+        if self._pending:
+            self.writer.submit(self._pending)
+            self._pending = []
@@ -0,0 +1,284 @@
+"""
+行情记录格式 - 定长二进制结构体（NumPy structured dtype）
+
+订单簿增量、报价、成交统一编码为同一种定长记录：
+1. 价格/数量存为品种精度下的整数尾数（0.512 @ 3 位精度 → 512），无浮点误差
+2. 文件即记录数组本身，没有文件头，可以直接 append，也可以 np.memmap 零拷贝读取
+3. 品种信息（ID、精度）放在同名的 .json 旁注文件里
+4. 成交 ID：纯数字且放得下 u8 时原样存储，其余（Polymarket 的十六进制 ID）存 64 位哈希，
+   回放时成交 ID 唯一且稳定，但不是原始字符串
+
+文件不压缩：压缩后无法 memmap 零拷贝读取（backtest.reader），归档冷数据时再用外部工具压缩
+
+多进程共享：各进程 memmap 同一个文件时共享操作系统页缓存，数据不需要 pickle
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from nautilus_trader.model.data import BookOrder, OrderBookDelta, QuoteTick, TradeTick
+from nautilus_trader.model.enums import AggressorSide, BookAction, OrderSide
+from nautilus_trader.model.identifiers import InstrumentId, TradeId
+from nautilus_trader.model.objects import FIXED_PRECISION, Price, Quantity
+
+
+# 记录类型
+KIND_DELTA = 0
+KIND_TRADE = 1
+KIND_QUOTE = 2
+
+RECORD_DTYPE = np.dtype([
+    ("ts_event", "<u8"),
+    ("ts_init", "<u8"),
+    ("price", "<i8"),          # 增量/成交价格，报价的买价
+    ("size", "<u8"),           # 增量/成交数量，报价的买量
+    ("aux_price", "<i8"),      # 报价的卖价
+    ("aux_size", "<u8"),       # 报价的卖量
+    ("id", "<u8"),             # 增量的 order_id，成交的 trade_id
+    ("sequence", "<u4"),
+    ("instrument", "<u2"),     # 品种表中的下标
+    ("kind", "u1"),
+    ("action", "u1"),          # BookAction（仅增量）
+    ("side", "u1"),            # OrderSide / AggressorSide
+    ("flags", "u1"),           # 增量的 RecordFlag，成交的 TRADE_ID_HASHED
+])
+
+# 成交记录的 flags：id 是原始成交 ID 的哈希
+TRADE_ID_HASHED = 1
+
+_MAX_ID = 2 ** 64 - 1
+
+META_SUFFIX = ".json"
+
+
+# ========== 品种表 ==========
+
+class InstrumentTable:
+    """
+    记录中的品种下标 ↔ 品种 ID 与精度
+
+    Args:
+        entries: [(instrument_id, price_precision, size_precision), ...]
+    """
+
+    def __init__(self, entries: Sequence[tuple]):
+        self.ids: List[InstrumentId] = []
+        self.price_precisions: List[int] = []
+        self.size_precisions: List[int] = []
+        self._index: Dict[InstrumentId, int] = {}
+
+        for instrument_id, price_precision, size_precision in entries:
+            self.add(instrument_id, price_precision, size_precision)
+
+    @classmethod
+    def from_instruments(cls, instruments) -> "InstrumentTable":
+        return cls([
+            (instrument.id, instrument.price_precision, instrument.size_precision)
+            for instrument in instruments
+        ])
+
+    def add(self, instrument_id, price_precision: int, size_precision: int) -> int:
+        """登记品种，返回下标（已登记则直接返回）"""
+        if isinstance(instrument_id, str):
+            instrument_id = InstrumentId.from_str(instrument_id)
+
+        index = self._index.get(instrument_id)
+        if index is None:
+            index = len(self.ids)
+            self._index[instrument_id] = index
+            self.ids.append(instrument_id)
+            self.price_precisions.append(price_precision)
+            self.size_precisions.append(size_precision)
+        return index
+
+    def index(self, instrument_id: InstrumentId) -> int:
+        return self._index[instrument_id]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def to_json(self) -> dict:
+        return {
+            "dtype": RECORD_DTYPE.descr,
+            "instruments": [
+                [str(instrument_id), self.price_precisions[i], self.size_precisions[i]]
+                for i, instrument_id in enumerate(self.ids)
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "InstrumentTable":
+        if [tuple(field) for field in data["dtype"]] != RECORD_DTYPE.descr:
+            raise ValueError("记录格式不兼容")
+        return cls(data["instruments"])
+
+
+def _scale(precision: int) -> int:
+    """整数尾数 → raw 的倍数"""
+    return 10 ** (FIXED_PRECISION - precision)
+
+
+# ========== 编码 ==========
+
+def encode(data, table: InstrumentTable) -> np.ndarray:
+    """
+    把 OrderBookDelta(s) / TradeTick / QuoteTick 编码为记录数组
+
+    OrderBookDeltas 批次展开为逐条增量（F_LAST 保留在 flags 中）
+    """
+    rows = []
+    for item in data:
+        if hasattr(item, "deltas"):
+            for delta in item.deltas:
+                rows.append(_encode_one(delta, table))
+        else:
+            rows.append(_encode_one(item, table))
+
+    records = np.zeros(len(rows), dtype=RECORD_DTYPE)
+    if rows:
+        records[:] = rows
+    return records
+
+
+def _encode_one(item, table: InstrumentTable) -> tuple:
+    index = table.index(item.instrument_id)
+    price_scale = _scale(table.price_precisions[index])
+    size_scale = _scale(table.size_precisions[index])
+
+    if isinstance(item, OrderBookDelta):
+        order = item.order
+        return (
+            item.ts_event, item.ts_init,
+            order.price.raw // price_scale, order.size.raw // size_scale, 0, 0,
+            order.order_id, item.sequence, index,
+            KIND_DELTA, int(item.action), int(order.side), item.flags,
+        )
+
+    if isinstance(item, TradeTick):
+        record_id, flags = _encode_trade_id(item.trade_id.value)
+        return (
+            item.ts_event, item.ts_init,
+            item.price.raw // price_scale, item.size.raw // size_scale, 0, 0,
+            record_id, 0, index,
+            KIND_TRADE, 0, int(item.aggressor_side), flags,
+        )
+
+    if isinstance(item, QuoteTick):
+        return (
+            item.ts_event, item.ts_init,
+            item.bid_price.raw // price_scale, item.bid_size.raw // size_scale,
+            item.ask_price.raw // price_scale, item.ask_size.raw // size_scale,
+            0, 0, index,
+            KIND_QUOTE, 0, 0, 0,
+        )
+
+    raise TypeError(f"不支持的数据类型: {type(item).__name__}")
+
+
+def _encode_trade_id(trade_id: str) -> tuple:
+    """成交 ID → (u8, flags)：数字原样存储，其余取 64 位 BLAKE2b 哈希"""
+    if trade_id.isdigit() and int(trade_id) <= _MAX_ID and str(int(trade_id)) == trade_id:
+        return int(trade_id), 0
+    digest = hashlib.blake2b(trade_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little"), TRADE_ID_HASHED
+
+
+# ========== 解码 ==========
+
+def decode(records: np.ndarray, table: InstrumentTable) -> list:
+    """
+    记录数组 → NautilusTrader 数据对象（OrderBookDelta / TradeTick / QuoteTick）
+
+    增量按记录逐条返回，需要批次时交给 harness.group_deltas
+    """
+    price_scales = [_scale(p) for p in table.price_precisions]
+    size_scales = [_scale(p) for p in table.size_precisions]
+    price_precisions = table.price_precisions
+    size_precisions = table.size_precisions
+    ids = table.ids
+
+    out = []
+    append = out.append
+
+    # tolist() 一次性转为 Python 元组，比逐字段索引 NumPy 标量快得多
+    for (
+        ts_event, ts_init, price, size, aux_price, aux_size,
+        record_id, sequence, index, kind, action, side, flags,
+    ) in records.tolist():
+        instrument_id = ids[index]
+        pp = price_precisions[index]
+        sp = size_precisions[index]
+
+        if kind == KIND_DELTA:
+            append(OrderBookDelta(
+                instrument_id,
+                BookAction(action),
+                BookOrder(
+                    OrderSide(side),
+                    Price.from_raw(price * price_scales[index], pp),
+                    Quantity.from_raw(size * size_scales[index], sp),
+                    record_id,
+                ),
+                flags,
+                sequence,
+                ts_event,
+                ts_init,
+            ))
+        elif kind == KIND_TRADE:
+            append(TradeTick(
+                instrument_id,
+                Price.from_raw(price * price_scales[index], pp),
+                Quantity.from_raw(size * size_scales[index], sp),
+                AggressorSide(side),
+                TradeId(f"{record_id:016x}" if flags & TRADE_ID_HASHED else str(record_id)),
+                ts_event,
+                ts_init,
+            ))
+        elif kind == KIND_QUOTE:
+            append(QuoteTick(
+                instrument_id,
+                Price.from_raw(price * price_scales[index], pp),
+                Price.from_raw(aux_price * price_scales[index], pp),
+                Quantity.from_raw(size * size_scales[index], sp),
+                Quantity.from_raw(aux_size * size_scales[index], sp),
+                ts_event,
+                ts_init,
+            ))
+
+    return out
+
+
+# ========== 文件 ==========
+
+def meta_path(path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + META_SUFFIX)
+
+
+def write_records(path, records: np.ndarray, table: InstrumentTable) -> Path:
+    """写入记录文件和品种旁注文件（覆盖）"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    records.astype(RECORD_DTYPE, copy=False).tofile(path)
+    meta_path(path).write_text(json.dumps(table.to_json()))
+    return path
+
+
+def open_records(path):
+    """
+    以只读 memmap 打开记录文件
+
+    Returns:
+        (records, table)：records 是 np.memmap 视图，不占用进程私有内存
+    """
+    path = Path(path)
+    table = InstrumentTable.from_json(json.loads(meta_path(path).read_text()))
+
+    if path.stat().st_size == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE), table
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r"), table
@@ -0,0 +1,97 @@
+"""
+行情回放 - 按录制时间戳驱动策略时钟，可选 N 倍实时速度
+
+BacktestEngine 用 TestClock 把时钟推进到每条数据的时间戳，
+策略里的 self.clock.timestamp_ns()、重报调度和 time alert 都基于这个时钟，
+所以回放和实盘的时间门控行为一致，与回放速度无关
+
+速度：
+- speed = 0：尽可能快
+- speed = N：N 倍实时（由 ReplayPacer 在模拟时间上定时休眠）
+"""
+
+import time
+from datetime import timedelta
+from typing import Optional
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.config import ActorConfig
+
+from .harness import BacktestResult, run_backtest
+
+
+class ReplayPacer(Actor):
+    """
+    回放节流器
+
+    每隔固定的墙钟时间片（换算为模拟时间）检查一次进度，
+    模拟时间领先墙钟 × speed 时休眠，使回放保持在 N 倍实时
+
+    Args:
+        speed: 实时倍数（必须为正数）
+        slice_ms: 墙钟检查间隔（毫秒）
+    """
+
+    TIMER_NAME = "replay-pacer"
+
+    def __init__(self, speed: float, slice_ms: float = 5.0, config: Optional[ActorConfig] = None):
+        super().__init__(config or ActorConfig(component_id="ReplayPacer"))
+        if speed <= 0:
+            raise ValueError(f"speed 必须为正数: {speed}")
+
+        self.speed = float(speed)
+        self.slice_ms = slice_ms
+        self.sleeps = 0
+
+        self._sim_start_ns = 0
+        self._wall_start = 0.0
+
+    def on_start(self):
+        self._sim_start_ns = self.clock.timestamp_ns()
+        self._wall_start = time.perf_counter()
+
+        self.clock.set_timer(
+            name=self.TIMER_NAME,
+            interval=timedelta(milliseconds=self.slice_ms * self.speed),
+            callback=self._on_slice,
+        )
+
+    def on_stop(self):
+        if self.TIMER_NAME in self.clock.timer_names:
+            self.clock.cancel_timer(self.TIMER_NAME)
+
+    def _on_slice(self, event):
+        sim_elapsed = (event.ts_event - self._sim_start_ns) / 1e9
+        wall_target = sim_elapsed / self.speed
+        ahead = wall_target - (time.perf_counter() - self._wall_start)
+
+        if ahead > 0:
+            self.sleeps += 1
+            time.sleep(ahead)
+
+
+def run_replay(
+    instruments,
+    data,
+    strategy_config,
+    speed: float = 0.0,
+    **kwargs,
+) -> BacktestResult:
+    """
+    回放录制行情
+
+    Args:
+        instruments: 品种列表
+        data: 订单簿增量批次 / 成交
+        strategy_config: MarketMakingStrategy 的配置
+        speed: 实时倍数（0 表示尽可能快）
+        **kwargs: 传给 run_backtest（期初资金、延迟、模块等）
+
+    Returns:
+        BacktestResult（events_per_second、speedup 反映回放速度）
+    """
+    actors = list(kwargs.pop("actors", ()))
+    if speed:
+        actors.append(ReplayPacer(speed))
+
+    return run_backtest(instruments, data, strategy_config, actors=actors, **kwargs)
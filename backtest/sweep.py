@@ -0,0 +1,220 @@
+"""
+参数扫描 - 多进程并行回测 MarketMakingStrategy
+
+1. 行情只加载一次：主进程编码为定长记录文件（records.py），
+   worker 以 memmap 只读打开，共享操作系统页缓存，数据不经过 pickle
+2. 每个 worker 进程只解码一次，之后分到的参数组合复用同一份数据
+   （传入 RecordingReader 时不解码全量，每次回测分块流式读取，适合超出内存的录制数据）
+3. 结果汇总为一张可排序的表：盈亏、成交率、最大回撤、库存周转
+"""
+
+import csv
+import itertools
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from config.strategy_config import with_overrides
+
+from .harness import run_backtest
+from .reader import RecordingReader, to_engine_data
+from .records import InstrumentTable, decode, encode, open_records, write_records
+
+
+METRICS = ("pnl", "fill_rate", "max_drawdown", "turnover", "fills", "orders")
+
+# 越小越好的指标（排序时升序）
+ASCENDING_METRICS = {"max_drawdown"}
+
+
+# ========== 参数空间 ==========
+
+def grid(space: Dict[str, Sequence]) -> List[dict]:
+    """
+    网格搜索：所有取值的笛卡尔积
+
+    Example:
+        grid({"base_spread": ["0.01", "0.02"], "order_size": [5, 10]})  # 4 组
+    """
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*space.values())]
+
+
+def random_search(space: Dict[str, object], samples: int, seed: int = 0) -> List[dict]:
+    """
+    随机搜索
+
+    取值为 (low, high) 元组时在区间内均匀采样（两端都是整数则采样整数），
+    为列表时从中随机选一个
+    """
+    rng = random.Random(seed)
+    param_sets = []
+
+    for _ in range(samples):
+        params = {}
+        for name, values in space.items():
+            if isinstance(values, tuple):
+                low, high = values
+                if isinstance(low, int) and isinstance(high, int):
+                    params[name] = rng.randint(low, high)
+                else:
+                    params[name] = round(rng.uniform(float(low), float(high)), 6)
+            else:
+                params[name] = rng.choice(list(values))
+        param_sets.append(params)
+
+    return param_sets
+
+
+# ========== Worker ==========
+
+# 每个 worker 进程的共享状态（由 _init_worker 设置一次）
+_worker_state: Dict[str, object] = {}
+
+
+def _init_worker(source, instruments, base_config, backtest_kwargs):
+    if isinstance(source, RecordingReader):
+        data = source
+    else:
+        records, table = open_records(source)
+        data = to_engine_data(decode(records, table))
+
+    _worker_state.update(
+        instruments=instruments,
+        data=data,
+        base_config=base_config,
+        backtest_kwargs=backtest_kwargs,
+    )
+
+
+def _run_one(params: dict) -> dict:
+    row = dict(params)
+    try:
+        config = with_overrides(_worker_state["base_config"], **params)
+        result = run_backtest(
+            _worker_state["instruments"],
+            _worker_state["data"],
+            config,
+            **_worker_state["backtest_kwargs"],
+        )
+    except Exception as e:
+        row.update({metric: None for metric in METRICS}, error=str(e))
+        return row
+
+    row.update(
+        pnl=result.pnl,
+        fill_rate=result.fill_rate,
+        max_drawdown=result.max_drawdown,
+        turnover=result.turnover,
+        fills=result.fills,
+        orders=result.orders,
+        error=None,
+    )
+    return row
+
+
+# ========== 扫描 ==========
+
+def run_sweep(
+    instruments,
+    data,
+    base_config,
+    param_sets: Sequence[dict],
+    workers: Optional[int] = None,
+    workdir: Optional[str] = None,
+    **backtest_kwargs,
+) -> List[dict]:
+    """
+    并行运行一组参数组合
+
+    Args:
+        instruments: 品种列表（对象很小，随 worker 初始化参数传递）
+        data: 订单簿增量批次 / 成交，或 RecordingReader（录制文件，worker 直接 memmap）
+        base_config: 基础 MarketMakingConfig，每组参数在其上覆盖
+        param_sets: 参数组合列表（grid / random_search 的结果）
+        workers: 进程数（None 表示 CPU 核数，1 表示在当前进程内顺序执行）
+        workdir: 临时记录文件的目录（None 使用系统临时目录，结束后删除）
+        **backtest_kwargs: 传给 run_backtest（期初资金、延迟等）
+
+    Returns:
+        每组参数一行：参数 + METRICS + error
+    """
+    if isinstance(data, RecordingReader):
+        return _run_pool(data, instruments, base_config, param_sets, workers, backtest_kwargs)
+
+    table = InstrumentTable.from_instruments(instruments)
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        path = write_records(Path(tmp) / "sweep.bin", encode(data, table), table)
+        return _run_pool(path, instruments, base_config, param_sets, workers, backtest_kwargs)
+
+
+def _run_pool(source, instruments, base_config, param_sets, workers, backtest_kwargs) -> List[dict]:
+    workers = workers or os.cpu_count() or 1
+    init_args = (source, list(instruments), base_config, backtest_kwargs)
+
+    if workers == 1:
+        _init_worker(*init_args)
+        try:
+            return [_run_one(params) for params in param_sets]
+        finally:
+            _worker_state.clear()
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(param_sets)) or 1,
+        initializer=_init_worker,
+        initargs=init_args,
+    ) as pool:
+        return list(pool.map(_run_one, param_sets))
+
+
+# ========== 结果表 ==========
+
+def sort_rows(rows: List[dict], by: str = "pnl") -> List[dict]:
+    """按指标排序（最优在前，失败的组合排在最后）"""
+    ascending = by in ASCENDING_METRICS
+    ok = [row for row in rows if row.get(by) is not None]
+    failed = [row for row in rows if row.get(by) is None]
+    return sorted(ok, key=lambda row: row[by], reverse=not ascending) + failed
+
+
+def format_table(rows: List[dict], by: str = "pnl", limit: Optional[int] = None) -> str:
+    """格式化为文本表格"""
+    rows = sort_rows(rows, by)[:limit]
+    if not rows:
+        return "(无结果)"
+
+    params = [name for name in rows[0] if name not in METRICS and name != "error"]
+    header = params + list(METRICS)
+    lines = [_format_row(header), "-" * (14 * len(header))]
+
+    for row in rows:
+        if row.get("error"):
+            lines.append(_format_row([row[name] for name in params]) + f"  错误: {row['error']}")
+        else:
+            lines.append(_format_row([row[name] for name in header]))
+
+    return "\n".join(lines)
+
+
+def _format_row(values) -> str:
+    cells = []
+    for value in values:
+        if isinstance(value, float):
+            value = f"{value:.4f}"
+        cells.append(f"{value!s:>13}")
+    return " ".join(cells)
+
+
+def write_csv(rows: List[dict], path, by: str = "pnl") -> None:
+    """按指标排序后写入 CSV"""
+    rows = sort_rows(rows, by)
+    if not rows:
+        return
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
@@ -0,0 +1,438 @@
+"""
+合成行情 - 二元市场 L2 增量流（压测 / 基准用）
+
+行情用 NumPy 按块向量化生成，直接输出 records.RECORD_DTYPE 记录数组（与录制文件同一格式），
+每秒可生成数百万条；需要时再按块解码送入 BacktestEngine：
+1. 价格有界：中间价在 logit 空间随机游走（边界处反射），始终落在 (0, 1) 内，
+   tick 取自品种（0.01 / 0.001），价格以整数 tick 计算
+2. 深度集中在中间价附近：每档期望数量随档位指数衰减，数量为对数正态噪声
+3. 新闻冲击：随机时刻中间价跳变，之后一段时间更新频率和波动率放大（burst）
+4. 增量而非快照：中间价移动时只删除 / 新增移出 / 移入的档位，其余是单档数量更新
+5. YES / NO 互补：NO 订单簿是 YES 的镜像（价格 1 - p、买卖方向互换、数量相同）
+
+按固定的块大小生成，块之间延续中间价、时间和冲击状态：内存只与块大小有关，
+同一 seed 生成完全相同的记录
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from nautilus_trader.model.enums import AggressorSide, BookAction, OrderSide, RecordFlag
+
+from .records import KIND_DELTA, KIND_TRADE, RECORD_DTYPE, InstrumentTable, decode
+from .reader import to_engine_data
+
+
+START_NS = 1_700_000_000_000_000_000
+CHUNK_UPDATES = 32_768
+
+_BUY = int(OrderSide.BUY)
+_SELL = int(OrderSide.SELL)
+_BUYER = int(AggressorSide.BUYER)
+_SELLER = int(AggressorSide.SELLER)
+_ADD = int(BookAction.ADD)
+_UPDATE = int(BookAction.UPDATE)
+_DELETE = int(BookAction.DELETE)
+_CLEAR = int(BookAction.CLEAR)
+_F_LAST = int(RecordFlag.F_LAST)
+
+# 同一次更新内的记录顺序：先清空 / 删除、再新增、再数量更新，成交在订单簿更新之后
+_PHASE_CLEAR, _PHASE_DELETE, _PHASE_ADD, _PHASE_UPDATE, _PHASE_TRADE = range(5)
+
+
+@dataclass(frozen=True)
+class SyntheticBookConfig:
+    """
+    合成订单簿参数
+
+    每次"更新"是一批增量（一个 OrderBookDeltas），对应交易所推送的一条消息
+    """
+
+    levels: int = 20                      # 每边档位数
+    initial_price: float = 0.5
+    updates_per_second: float = 20.0      # 平静期的更新频率
+    volatility: float = 0.01              # 每次更新 logit 中间价的标准差
+    size_updates: float = 1.5             # 每次更新额外的单档数量更新（泊松均值，至少 1 条）
+    level_decay: float = 0.35             # 数量更新落在第 k 档的概率 ∝ (1 - decay)^k
+    top_size: float = 400.0               # 第 1 档期望数量
+    depth_decay_levels: float = 6.0       # 期望数量按 exp(-k / decay) 衰减
+    min_size: float = 20.0                # 远端档位的期望数量
+    size_noise: float = 0.5               # 数量的对数正态 sigma
+    news_probability: float = 0.0005      # 每次更新发生新闻冲击的概率
+    jump_volatility: float = 0.4          # 新闻冲击时 logit 中间价跳变的标准差
+    burst_updates: int = 400              # 冲击后持续放大的更新次数
+    burst_rate: float = 10.0              # 冲击期间更新频率倍数
+    burst_volatility: float = 3.0         # 冲击期间波动率倍数
+    trade_probability: float = 0.05       # 每次更新附带一笔成交的概率
+    trade_size: float = 25.0              # 成交数量均值
+    feed_latency_ms: float = 0.0          # ts_init - ts_event
+
+
+def binary_market(tick: str = "0.001", suffix: str = ""):
+    """
+    测试用 YES / NO 品种对（同一 condition，不同 token）
+
+    Args:
+        tick: 价格 tick（"0.01" / "0.001"）
+        suffix: 附加在 condition_id 上，用于生成多个不同的市场
+
+    Returns:
+        (yes, no)：BinaryOption
+    """
+    from nautilus_trader.model.instruments import BinaryOption
+    from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+    base = BinaryOption.to_dict(TestInstrumentProvider.binary_option())
+    condition, token = base["raw_symbol"].split("-", 1)
+    precision = -Decimal(tick).as_tuple().exponent
+
+    pair = []
+    for outcome, token_id in (("Yes", token), ("No", str(int(token) + 1))):
+        data = dict(base)
+        data["raw_symbol"] = f"{condition}{suffix}-{token_id}"
+        data["id"] = f"{data['raw_symbol']}.POLYMARKET"
+        data["outcome"] = outcome
+        data["description"] = f"Will the outcome of this market be '{outcome}'?"
+        data["price_increment"] = tick
+        data["price_precision"] = precision
+        data["expiration_ns"] = 0
+        pair.append(BinaryOption.from_dict(data))
+    return tuple(pair)
+
+
+def _tick_units(instrument) -> Tuple[int, int]:
+    """(1.0 对应的 tick 数, 每个 tick 对应的价格尾数)"""
+    tick = Decimal(str(instrument.price_increment))
+    top = Decimal(1) / tick
+    if top != top.to_integral_value():
+        raise ValueError(f"tick 必须整除 1: {tick}")
+    return int(top), int(tick.scaleb(instrument.price_precision))
+
+
+def _reflect(x: np.ndarray, bound: float) -> np.ndarray:
+    """把 x 反射到 [-bound, bound]（三角波折叠）"""
+    y = np.mod(x + bound, 4 * bound)
+    return np.abs(y - 2 * bound) - bound
+
+
+def _expand(counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """每个元素重复 counts 次：返回 (元素下标, 元素内序号)"""
+    index = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return index, np.arange(len(index)) - offsets
+
+
+class _Columns:
+    """按块收集记录字段，最后一次性拼接（标量字段按块长度填充）"""
+
+    FIELDS = {
+        "update": np.int64,
+        "phase": np.int64,
+        "order": np.int64,
+        "price": np.int64,
+        "size": np.int64,
+        "side": np.uint8,
+        "action": np.uint8,
+        "kind": np.uint8,
+    }
+
+    def __init__(self):
+        self.blocks = {name: [] for name in self.FIELDS}
+
+    def add(self, **columns):
+        length = len(columns["update"])
+        for name, dtype in self.FIELDS.items():
+            value = columns[name]
+            if np.ndim(value) == 0:
+                value = np.full(length, value, dtype)
+            self.blocks[name].append(value.astype(dtype, copy=False))
+
+    def concat(self) -> dict:
+        return {name: np.concatenate(blocks) for name, blocks in self.blocks.items()}
+
+
+class SyntheticMarket:
+    """
+    一个二元市场的合成增量流
+
+    第一块以初始快照（CLEAR + 每边 levels 档）开头，之后每块延续上一块的状态
+
+    Args:
+        instrument: YES 品种（提供 tick 与精度）
+        config: 订单簿参数
+        seed: 随机种子
+        start_ns: 初始快照的时间戳
+        no_instrument: NO 品种（给出时同时生成镜像订单簿）
+    """
+
+    def __init__(
+        self,
+        instrument,
+        config: SyntheticBookConfig = SyntheticBookConfig(),
+        seed: int = 0,
+        start_ns: int = START_NS,
+        no_instrument=None,
+    ):
+        self.config = config
+        self.top, self.tick_mantissa = _tick_units(instrument)
+        if self.top < 4:
+            raise ValueError(f"tick 过大: {instrument.price_increment}")
+        if no_instrument is not None and _tick_units(no_instrument) != (self.top, self.tick_mantissa):
+            raise ValueError("YES / NO 品种的 tick 必须相同")
+
+        self.instruments = [instrument] + ([no_instrument] if no_instrument is not None else [])
+        self.table = InstrumentTable.from_instruments(self.instruments)
+        self.size_mantissa = 10 ** instrument.size_precision
+
+        self._rng = np.random.default_rng(seed)
+        self._bound = np.log((self.top - 2.5) / 2.5)     # 中间价限制在 [2, top-2] tick
+        self._x = np.log(config.initial_price / (1 - config.initial_price))
+        self._mid = self._to_mid(np.array([self._x]))[0]
+        self._ts = start_ns
+        self._updates = 0
+        self._trades = 0
+        self._recent_news = np.zeros(config.burst_updates, dtype=bool)
+
+    def _to_mid(self, x: np.ndarray) -> np.ndarray:
+        p = 1 / (1 + np.exp(-_reflect(x, self._bound)))
+        return np.clip(np.rint(self.top * p), 2, self.top - 2).astype(np.int64)
+
+    def _sizes(self, level: np.ndarray) -> np.ndarray:
+        """第 level 档的数量尾数（期望值随档位衰减 × 对数正态噪声）"""
+        cfg = self.config
+        expected = cfg.min_size + cfg.top_size * np.exp(-(level - 1) / cfg.depth_decay_levels)
+        noise = self._rng.lognormal(-cfg.size_noise ** 2 / 2, cfg.size_noise, len(level))
+        return np.maximum(np.rint(expected * noise * self.size_mantissa), self.size_mantissa).astype(np.int64)
+
+    # ========== 生成 ==========
+
+    def records(self, updates: int) -> np.ndarray:
+        """接下来 updates 次更新的记录（第一次调用时以初始快照开头）"""
+        parts = []
+        while updates > 0:
+            n = min(updates, CHUNK_UPDATES)
+            parts.append(self._chunk(n))
+            updates -= n
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=RECORD_DTYPE)
+
+    def iter_records(self, updates: int) -> Iterator[np.ndarray]:
+        """逐块生成（每块 CHUNK_UPDATES 次更新），总内存与 updates 无关"""
+        while updates > 0:
+            n = min(updates, CHUNK_UPDATES)
+            yield self._chunk(n)
+            updates -= n
+
+    def _chunk(self, n: int) -> np.ndarray:
+        cfg = self.config
+        rng = self._rng
+        levels = cfg.levels
+        k = cfg.burst_updates
+
+        # ---------- 新闻冲击与时间 ----------
+        news = rng.random(n) < cfg.news_probability
+        if self._updates == 0:
+            news[0] = False
+        window = np.concatenate((self._recent_news, news))
+        counts = np.concatenate(([0], np.cumsum(window)))
+        burst = counts[k + 1:] - counts[1:n + 1] > 0
+        self._recent_news = window[-k:] if k else self._recent_news
+
+        gaps = rng.exponential(1e9 / cfg.updates_per_second, n) / np.where(burst, cfg.burst_rate, 1.0)
+        ts_event = self._ts + np.cumsum(np.maximum(gaps.astype(np.int64), 1))
+
+        # ---------- 中间价（logit 随机游走，边界反射）----------
+        dx = rng.normal(0.0, cfg.volatility, n) * np.where(burst, cfg.burst_volatility, 1.0)
+        dx += np.where(news, rng.normal(0.0, cfg.jump_volatility, n), 0.0)
+        x = self._x + np.cumsum(dx)
+        mid = np.concatenate(([self._mid], self._to_mid(x)))      # mid[i + 1] 为第 i 次更新后的中间价
+
+        cols = _Columns()
+
+        # ---------- 初始快照 ----------
+        first = self._updates == 0
+        if first:
+            ladder = np.arange(1, levels + 1)
+            start = np.full(levels, -1, np.int64)
+            cols.add(
+                update=np.array([-1]), phase=_PHASE_CLEAR, order=np.zeros(1, np.int64),
+                price=0, size=0, side=0, action=_CLEAR, kind=KIND_DELTA,
+            )
+            for side, prices in ((_BUY, mid[0] - ladder), (_SELL, mid[0] + ladder)):
+                cols.add(
+                    update=start, phase=_PHASE_ADD, order=ladder + (side - 1) * levels,
+                    price=prices, size=self._sizes(ladder), side=side, action=_ADD, kind=KIND_DELTA,
+                )
+
+        # ---------- 中间价移动：删除移出的档位，新增移入的档位 ----------
+        move = mid[1:] - mid[:-1]
+        index, j = _expand(np.minimum(np.abs(move), levels))
+        up = move[index] > 0
+        old, new = mid[index], mid[index + 1]
+
+        blocks = (
+            # (相位, 方向, 价格)
+            (_PHASE_DELETE, _BUY, np.where(up, old - levels + j, old - 1 - j)),
+            (_PHASE_DELETE, _SELL, np.where(up, old + 1 + j, old + levels - j)),
+            (_PHASE_ADD, _BUY, np.where(up, new - 1 - j, new - levels + j)),
+            (_PHASE_ADD, _SELL, np.where(up, new + levels - j, new + 1 + j)),
+        )
+        for phase, side, prices in blocks:
+            adding = phase == _PHASE_ADD
+            cols.add(
+                update=index, phase=phase, order=j + (side - 1) * levels, price=prices,
+                size=self._sizes(np.abs(prices - new)) if adding else np.zeros(len(prices), np.int64),
+                side=side, action=_ADD if adding else _DELETE, kind=KIND_DELTA,
+            )
+
+        # ---------- 单档数量更新（集中在中间价附近）----------
+        index, j = _expand(1 + rng.poisson(cfg.size_updates, n))
+        level = np.minimum(rng.geometric(cfg.level_decay, len(index)), levels)
+        side = np.where(rng.random(len(index)) < 0.5, _BUY, _SELL)
+        cols.add(
+            update=index, phase=_PHASE_UPDATE, order=j,
+            price=mid[index + 1] + np.where(side == _BUY, -level, level),
+            size=self._sizes(level), side=side, action=_UPDATE, kind=KIND_DELTA,
+        )
+
+        # ---------- 成交（吃掉第 1 档）----------
+        traded = np.flatnonzero(rng.random(n) < cfg.trade_probability)
+        aggressor = np.where(rng.random(len(traded)) < 0.5, _BUYER, _SELLER)
+        trade_size = np.rint(rng.exponential(cfg.trade_size, len(traded)) * self.size_mantissa)
+        cols.add(
+            update=traded, phase=_PHASE_TRADE, order=np.zeros(len(traded), np.int64),
+            price=mid[traded + 1] + np.where(aggressor == _BUYER, 1, -1),
+            size=np.maximum(trade_size, self.size_mantissa), side=aggressor, action=0, kind=KIND_TRADE,
+        )
+
+        yes = cols.concat()
+
+        # 超出 (0, 1) 的档位不存在
+        keep = (yes["action"] == _CLEAR) | ((yes["price"] >= 1) & (yes["price"] <= self.top - 1))
+        parts = [{name: column[keep] for name, column in yes.items()}]
+        if len(self.instruments) > 1:
+            mirror = dict(parts[0])
+            mirror["price"] = np.where(mirror["action"] == _CLEAR, 0, self.top - mirror["price"])
+            mirror["side"] = np.where(mirror["side"] == 0, 0, 3 - mirror["side"])    # BUY ↔ SELL，BUYER ↔ SELLER
+            parts.append(mirror)
+
+        ts_event = np.concatenate((ts_event, [self._ts]))         # 下标 -1：初始快照
+        records = self._assemble(parts, ts_event)
+
+        self._x = x[-1]
+        self._mid = mid[-1]
+        self._ts = int(ts_event[-2])
+        self._updates += n
+        return records
+
+    def _assemble(self, parts, ts_event: np.ndarray) -> np.ndarray:
+        """字段列 → 排序后的记录数组，并标记每个批次的最后一条增量"""
+        instrument = np.concatenate([np.full(len(cols["update"]), i, np.int64) for i, cols in enumerate(parts)])
+        cols = {name: np.concatenate([c[name] for c in parts]) for name in _Columns.FIELDS}
+
+        # 排序键：(更新, 品种, 相位, 相位内序号) 压缩为一个 int64（初始快照的更新为 -1）
+        width = int(cols["order"].max()) + 1
+        key = (((cols["update"] + 1) * len(parts) + instrument) * 5 + cols["phase"]) * width + cols["order"]
+        order = np.argsort(key, kind="stable")
+        update = cols["update"][order]
+        instrument = instrument[order]
+
+        records = np.zeros(len(order), dtype=RECORD_DTYPE)
+        records["ts_event"] = ts_event[update]
+        records["ts_init"] = records["ts_event"] + np.uint64(int(self.config.feed_latency_ms * 1_000_000))
+        records["price"] = cols["price"][order] * self.tick_mantissa
+        records["size"] = cols["size"][order]
+        records["sequence"] = update + 1 + self._updates
+        records["instrument"] = instrument
+        records["kind"] = cols["kind"][order]
+        records["action"] = cols["action"][order]
+        records["side"] = cols["side"][order]
+
+        trades = records["kind"] == KIND_TRADE
+        trade_count = int(trades.sum())
+        records["id"][trades] = np.arange(self._trades + 1, self._trades + trade_count + 1)
+        self._trades += trade_count
+
+        # 每个 (更新, 品种) 的最后一条增量带 F_LAST
+        deltas = np.flatnonzero(~trades)
+        group = update[deltas] * len(parts) + instrument[deltas]
+        last = np.append(group[1:] != group[:-1], True)
+        records["flags"][deltas[last]] = _F_LAST
+        return records
+
+
+def generate(
+    instrument,
+    updates: int,
+    config: SyntheticBookConfig = SyntheticBookConfig(),
+    seed: int = 0,
+    start_ns: int = START_NS,
+    no_instrument=None,
+) -> Tuple[np.ndarray, InstrumentTable]:
+    """
+    一次生成一个市场的增量流
+
+    Returns:
+        (records, table)：按 ts_init 排序的记录数组（每个 OrderBookDeltas 的最后一条带 F_LAST）和品种表
+    """
+    market = SyntheticMarket(instrument, config, seed=seed, start_ns=start_ns, no_instrument=no_instrument)
+    return market.records(updates), market.table
+
+
+def generate_markets(
+    markets: int,
+    updates: int,
+    config: SyntheticBookConfig = SyntheticBookConfig(),
+    seed: int = 0,
+    tick: str = "0.001",
+    with_no: bool = True,
+    start_ns: int = START_NS,
+) -> Tuple[list, np.ndarray, InstrumentTable]:
+    """
+    多个独立市场（每个市场 updates 次更新）按 ts_init 归并为一条流
+
+    Returns:
+        (instruments, records, table)
+    """
+    instruments, parts = [], []
+    table = InstrumentTable([])
+    for i in range(markets):
+        yes, no = binary_market(tick, suffix=f"{i:02x}" if markets > 1 else "")
+        market = SyntheticMarket(yes, config, seed=seed + i, start_ns=start_ns, no_instrument=no if with_no else None)
+        remap = np.array([
+            table.add(instrument.id, instrument.price_precision, instrument.size_precision)
+            for instrument in market.instruments
+        ], dtype=np.uint16)
+
+        records = market.records(updates)
+        records["instrument"] = remap[records["instrument"]]
+        instruments.extend(market.instruments)
+        parts.append(records)
+
+    merged = np.concatenate(parts)
+    return instruments, merged[np.argsort(merged["ts_init"], kind="stable")], table
+
+
+# ========== 送入引擎 ==========
+
+def chunks(records: np.ndarray, table: InstrumentTable, chunk_size: int = 65_536) -> Iterator[list]:
+    """
+    按块解码为引擎数据（供 BacktestEngine.add_data_iterator 使用）
+
+    块边界落在时间戳变化处，同一批次的增量不会被切开
+    """
+    ts_init = records["ts_init"]
+    start = 0
+    while start < len(records):
+        stop = min(start + chunk_size, len(records))
+        if stop < len(records):
+            stop = int(np.searchsorted(ts_init, ts_init[stop - 1], side="right"))
+        yield to_engine_data(decode(records[start:stop], table))
+        start = stop
+
+
+def engine_data(records: np.ndarray, table: InstrumentTable) -> list:
+    """一次性解码为引擎数据（小规模数据）"""
+    return to_engine_data(decode(records, table))
@@ -0,0 +1,301 @@
+"""
+运行配置 - 预设档位（profile）+ 配置文件 + 命令行覆盖
+
+核心原则：
+1. 只依赖标准库：--help、配置校验、dry-run 不导入 NautilusTrader
+2. 参数优先级：档位默认值 < 配置文件 < --set
+3. 所有入口共用同一份档位定义，不在各个启动脚本里重复参数
+
+配置文件（TOML 或 JSON）：
+
+    profile = "safe"                 # 基础档位
+    markets = ["bitcoin-up-or-down-on-january-28"]   # 省略时按日期滚动每日市场
+    signature_type = 2
+    log_level = "INFO"               # 节点日志级别（strategy.telemetry_level 未给出时也用它）
+
+    [strategy]
+    base_spread = "0.04"
+    max_daily_loss = "-2.0"
+"""
+
+import json
+from dataclasses import dataclass, field, replace
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+class ConfigError(ValueError):
+    """配置无效（未知参数、类型错误、取值矛盾）"""
+
+
+# ========== 策略参数表 ==========
+# 与 MarketMakingConfig 的字段一一对应（instrument_id(s) 除外，由入口填充），
+# 单元测试保证两者一致
+
+STRATEGY_PARAMS: Dict[str, type] = {
+    "base_spread": Decimal,
+    "min_spread": Decimal,
+    "max_spread": Decimal,
+    "order_size": int,
+    "min_order_size": int,
+    "max_order_size": int,
+    "depth_levels": int,
+    "target_inventory": int,
+    "max_inventory": int,
+    "inventory_skew_factor": Decimal,
+    "max_skew": Decimal,
+    "hedge_threshold": int,
+    "hedge_size": int,
+    "min_price": Decimal,
+    "max_price": Decimal,
+    "max_volatility": Decimal,
+    "volatility_window": int,
+    "max_position_ratio": Decimal,
+    "max_daily_loss": Decimal,
+    "update_interval_ms": int,
+    "min_requote_interval_ms": int,
+    "requote_trigger_ticks": int,
+    "requote_tolerance_ticks": int,
+    "requote_size_tolerance": int,
+    "use_inventory_skew": bool,
+    "use_dynamic_spread": bool,
+    "log_every_n_updates": int,
+    "telemetry_level": str,
+    "latency_stats": bool,
+    "latency_dump_interval_secs": int,
+}
+
+MODES = ("live", "paper", "backtest")
+
+# 标准实盘参数（20+ USDC）
+_STANDARD = {
+    "base_spread": "0.03",
+    "min_spread": "0.01",
+    "max_spread": "0.15",
+    "order_size": 2,
+    "min_order_size": 1,
+    "max_order_size": 5,
+    "target_inventory": 0,
+    "max_inventory": 20,
+    "inventory_skew_factor": "0.0002",
+    "max_skew": "0.03",
+    "hedge_threshold": 10,
+    "hedge_size": 5,
+    "min_price": "0.05",
+    "max_price": "0.95",
+    "max_volatility": "0.10",
+    "volatility_window": 50,
+    "max_position_ratio": "0.3",
+    "max_daily_loss": "-20.0",
+    "update_interval_ms": 2000,
+}
+
+PROFILES: Dict[str, dict] = {
+    # 小资金安全测试（5-10 USDC，日亏损 1 USDC 即停止）
+    "safe": {
+        "mode": "live",
+        "signature_type": 2,        # 邮箱/Magic 用户
+        "strategy": {
+            "base_spread": "0.05",
+            "min_spread": "0.03",
+            "max_spread": "0.20",
+            "order_size": 1,
+            "min_order_size": 1,
+            "max_order_size": 2,
+            "target_inventory": 0,
+            "max_inventory": 5,
+            "inventory_skew_factor": "0.0003",
+            "max_skew": "0.05",
+            "hedge_threshold": 3,
+            "hedge_size": 2,
+            "min_price": "0.05",
+            "max_price": "0.95",
+            "max_volatility": "0.08",
+            "volatility_window": 50,
+            "max_position_ratio": "0.5",
+            "max_daily_loss": "-1.0",
+            "update_interval_ms": 5000,
+        },
+    },
+    # 标准实盘
+    "standard": {
+        "mode": "live",
+        "signature_type": 0,        # EOA 钱包
+        "strategy": _STANDARD,
+    },
+    # 标准参数 + 本地模拟交易所（排队位置模型撮合），回放录制行情
+    "paper": {
+        "mode": "paper",
+        "log_level": "ERROR",
+        "strategy": _STANDARD,
+    },
+    # 策略默认参数 + BacktestEngine 回放
+    "backtest": {
+        "mode": "backtest",
+        "log_level": "ERROR",
+    },
+}
+
+DEFAULT_PROFILE = "safe"
+
+
+@dataclass(frozen=True)
+class RunProfile:
+    """解析完成的运行配置"""
+
+    name: str
+    mode: str
+    strategy: Dict[str, Any] = field(default_factory=dict)     # 已转换类型的策略参数
+    markets: Tuple[str, ...] = ()                              # 空表示按日期滚动每日市场
+    signature_type: int = 0
+    log_level: str = "INFO"
+    trader_id: str = "POLYMARKET-001"
+
+    @property
+    def live(self) -> bool:
+        return self.mode == "live"
+
+    def strategy_config(self, instrument_ids: Sequence[str]):
+        """构造 MarketMakingConfig（此时才导入 NautilusTrader）"""
+        from config.strategy_config import MarketMakingConfig, with_overrides
+
+        return with_overrides(
+            MarketMakingConfig(instrument_ids=tuple(str(iid) for iid in instrument_ids)),
+            **self.strategy,
+        )
+
+    def describe(self) -> str:
+        lines = [f"档位: {self.name}（{self.mode}）"]
+        if self.live:
+            lines.append(f"市场: {', '.join(self.markets) if self.markets else '每日市场（自动滚动）'}")
+            lines.append(f"签名类型: {self.signature_type}")
+        lines.extend(f"  {name} = {value}" for name, value in self.strategy.items())
+        return "\n".join(lines)
+
+
+# ========== 读取与校验 ==========
+
+def load_file(path) -> dict:
+    """读取 TOML / JSON 配置文件"""
+    path = Path(path)
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as e:
+        raise ConfigError(f"无法读取配置文件 {path}: {e}") from e
+
+    try:
+        if path.suffix == ".json":
+            return json.loads(text)
+        import tomllib
+
+        return tomllib.loads(text)
+    except ValueError as e:
+        raise ConfigError(f"配置文件格式错误 {path}: {e}") from e
+
+
+def coerce_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """按参数表转换类型（Decimal 接受 str / int / float，bool 接受 true / false）"""
+    unknown = sorted(set(params) - set(STRATEGY_PARAMS))
+    if unknown:
+        raise ConfigError(f"未知的策略参数: {unknown}")
+
+    result = {}
+    for name, value in params.items():
+        kind = STRATEGY_PARAMS[name]
+        try:
+            result[name] = _coerce(kind, value)
+        except (TypeError, ValueError, InvalidOperation):
+            raise ConfigError(f"参数 {name} 应为 {kind.__name__}: {value!r}") from None
+    return result
+
+
+def _coerce(kind: type, value):
+    if kind is bool:
+        if isinstance(value, str) and value.lower() in ("true", "false"):
+            return value.lower() == "true"
+        if not isinstance(value, bool):
+            raise TypeError(value)
+        return value
+    if kind is int:
+        if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+            raise TypeError(value)
+        return int(value)
+    if kind is Decimal:
+        if isinstance(value, bool):
+            raise TypeError(value)
+        return Decimal(str(value))
+    return str(value)
+
+
+def validate(profile: RunProfile) -> RunProfile:
+    """检查取值之间的约束，未给出的参数不检查（使用策略默认值）"""
+    if profile.mode not in MODES:
+        raise ConfigError(f"未知的运行模式: {profile.mode}")
+    if profile.signature_type not in (0, 1, 2):
+        raise ConfigError(f"signature_type 应为 0 / 1 / 2: {profile.signature_type}")
+
+    p = profile.strategy
+    _ordered(p, "min_spread", "base_spread", "max_spread")
+    _ordered(p, "min_order_size", "order_size", "max_order_size")
+    _ordered(p, "hedge_threshold", "max_inventory")
+    _ordered(p, "min_price", "max_price")
+
+    for name in ("min_price", "max_price"):
+        if name in p and not Decimal(0) < p[name] < Decimal(1):
+            raise ConfigError(f"{name} 应在 (0, 1) 之间: {p[name]}")
+    if p.get("max_daily_loss", Decimal(0)) > 0:
+        raise ConfigError(f"max_daily_loss 应为负数或 0: {p['max_daily_loss']}")
+    for name, kind in STRATEGY_PARAMS.items():
+        if kind is int and name != "target_inventory" and p.get(name, 0) < 0:
+            raise ConfigError(f"{name} 不能为负数: {p[name]}")
+
+    return profile
+
+
+def _ordered(params: Dict[str, Any], *names: str):
+    values = [(name, params[name]) for name in names if name in params]
+    for (low_name, low), (high_name, high) in zip(values, values[1:]):
+        if low > high:
+            raise ConfigError(f"{low_name} ({low}) 不能大于 {high_name} ({high})")
+
+
+def resolve(
+    profile: Optional[str] = None,
+    path=None,
+    overrides: Optional[Dict[str, Any]] = None,
+    markets: Sequence[str] = (),
+) -> RunProfile:
+    """
+    合并档位、配置文件和命令行覆盖
+
+    Args:
+        profile: 档位名（None 时取配置文件中的 profile，再缺省为 safe）
+        path: 配置文件（可选）
+        overrides: --set 的策略参数
+        markets: 命令行指定的市场 slug（非空时覆盖配置文件）
+    """
+    file = load_file(path) if path else {}
+    unknown = sorted(set(file) - {"profile", "markets", "signature_type", "log_level", "trader_id", "strategy"})
+    if unknown:
+        raise ConfigError(f"配置文件中有未知的设置: {unknown}")
+
+    name = profile or file.get("profile") or DEFAULT_PROFILE
+    if name not in PROFILES:
+        raise ConfigError(f"未知的档位: {name}（可选: {', '.join(PROFILES)}）")
+    base = PROFILES[name]
+
+    params = coerce_params(
+        {**base.get("strategy", {}), **file.get("strategy", {}), **(overrides or {})}
+    )
+
+    result = RunProfile(name=name, mode=base["mode"], strategy=params)
+    settings = {key: base[key] for key in ("signature_type", "log_level") if key in base}
+    settings.update({key: file[key] for key in ("signature_type", "log_level", "trader_id") if key in file})
+    result = replace(result, **settings, markets=tuple(markets or file.get("markets", ())))
+
+    # 遥测日志级别默认跟随节点日志级别：低于 log_level 的记录格式化后也会被节点丢弃
+    if "telemetry_level" not in result.strategy:
+        result = replace(result, strategy={**result.strategy, "telemetry_level": result.log_level})
+
+    return validate(result)
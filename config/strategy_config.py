@@ -0,0 +1,92 @@
+"""
+策略配置 - MarketMakingStrategy 的统一 StrategyConfig
+
+核心原则：
+1. 默认值直接取自策略类的 DEFAULT_*，不在多处重复
+2. frozen msgspec 结构，可哈希、可跨进程传递
+3. 回测、参数扫描、实盘共用同一个配置类
+"""
+
+from decimal import Decimal
+from typing import Optional
+
+import msgspec
+from nautilus_trader.config import StrategyConfig
+
+from strategies.market_making_strategy import MarketMakingStrategy as _S
+
+
+class MarketMakingConfig(StrategyConfig, frozen=True):
+    """
+    做市策略配置
+
+    instrument_ids 非空时为多市场模式，否则使用 instrument_id
+    """
+
+    # ========== 品种 ==========
+    instrument_id: Optional[str] = None
+    instrument_ids: tuple[str, ...] = ()
+
+    # ========== 价差参数 ==========
+    base_spread: Decimal = _S.DEFAULT_BASE_SPREAD
+    min_spread: Decimal = _S.DEFAULT_MIN_SPREAD
+    max_spread: Decimal = _S.DEFAULT_MAX_SPREAD
+
+    # ========== 订单参数 ==========
+    order_size: int = _S.DEFAULT_ORDER_SIZE
+    min_order_size: int = _S.DEFAULT_MIN_ORDER_SIZE
+    max_order_size: int = _S.DEFAULT_MAX_ORDER_SIZE
+    depth_levels: int = _S.DEFAULT_DEPTH_LEVELS
+
+    # ========== 库存参数 ==========
+    target_inventory: int = _S.DEFAULT_TARGET_INVENTORY
+    max_inventory: int = _S.DEFAULT_MAX_INVENTORY
+    inventory_skew_factor: Decimal = _S.DEFAULT_INVENTORY_SKEW_FACTOR
+    max_skew: Decimal = _S.DEFAULT_MAX_SKEW
+    hedge_threshold: int = _S.DEFAULT_HEDGE_THRESHOLD
+    hedge_size: int = _S.DEFAULT_HEDGE_SIZE
+
+    # ========== 价格 / 波动率 ==========
+    min_price: Decimal = _S.DEFAULT_MIN_PRICE
+    max_price: Decimal = _S.DEFAULT_MAX_PRICE
+    max_volatility: Decimal = _S.DEFAULT_MAX_VOLATILITY
+    volatility_window: int = _S.DEFAULT_VOLATILITY_WINDOW
+
+    # ========== 风险参数 ==========
+    max_position_ratio: Decimal = _S.DEFAULT_MAX_POSITION_RATIO
+    max_daily_loss: Decimal = _S.DEFAULT_MAX_DAILY_LOSS
+
+    # ========== 行为参数 ==========
+    update_interval_ms: int = _S.DEFAULT_UPDATE_INTERVAL_MS
+    min_requote_interval_ms: int = _S.DEFAULT_MIN_REQUOTE_INTERVAL_MS
+    requote_trigger_ticks: int = _S.DEFAULT_REQUOTE_TRIGGER_TICKS
+    requote_tolerance_ticks: int = _S.DEFAULT_REQUOTE_TOLERANCE_TICKS
+    requote_size_tolerance: int = _S.DEFAULT_REQUOTE_SIZE_TOLERANCE
+    use_inventory_skew: bool = True
+    use_dynamic_spread: bool = True
+
+    # ========== 日志 ==========
+    log_every_n_updates: int = _S.DEFAULT_LOG_EVERY_N_UPDATES
+    telemetry_level: str = "INFO"           # 由 config/profiles 构造时默认等于节点 log_level
+
+    # ========== 延迟统计 ==========
+    latency_stats: bool = False
+    latency_dump_interval_secs: int = 0     # 0 = 只在停止时输出
+
+
+def with_overrides(config: MarketMakingConfig, **overrides) -> MarketMakingConfig:
+    """
+    返回替换了部分参数的新配置
+
+    Decimal 字段接受 float / str，会转换为 Decimal
+    """
+    fields = set(MarketMakingConfig.__struct_fields__)
+    unknown = set(overrides) - fields
+    if unknown:
+        raise ValueError(f"未知的策略参数: {sorted(unknown)}")
+
+    for name, value in overrides.items():
+        if isinstance(getattr(config, name), Decimal) and not isinstance(value, Decimal):
+            overrides[name] = Decimal(str(value))
+
+    return msgspec.structs.replace(config, **overrides)
@@ -0,0 +1,230 @@
+"""
+微基准 - 计时、基线文件与回归判断
+
+报价循环的性能优化需要可复现的基准：
+1. measure() 按 timeit 的方式自动确定循环次数，重复 N 轮，得到每次调用的纳秒数
+2. 结果与仓库中的基线 JSON 比较，超过阈值（默认 +30%）视为回归
+3. 基线记录机器信息：换机器比较时给出提示（绝对耗时只在同一台机器上可比）
+
+只依赖标准库；策略相关的基准用例在 diagnostics/strategy_bench.py
+"""
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "strategy_bench.json"
+DEFAULT_THRESHOLD = 0.30
+DEFAULT_REPEAT = 7
+DEFAULT_MIN_TIME = 0.05     # 每轮至少运行的秒数
+
+
+@dataclass
+class Timing:
+    """
+    一个用例的计时结果
+
+    samples 为每轮的平均单次耗时（纳秒）；逐次采样（per_call）时为每次调用的耗时
+
+    比较用的代表值 value_ns：多次循环取最小值（噪声只会让耗时变长，同 timeit），
+    逐次采样取中位数（单次调用的耗时分布本身有意义，最小值通常是提前返回的路径）
+    """
+
+    loops: int
+    samples: List[float] = field(default_factory=list)
+    per_call: bool = False
+
+    @property
+    def min_ns(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median_ns(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def value_ns(self) -> float:
+        return self.median_ns if self.per_call else self.min_ns
+
+    def to_dict(self) -> dict:
+        return {
+            "min_ns": round(self.min_ns, 1),
+            "median_ns": round(self.median_ns, 1),
+            "value_ns": round(self.value_ns, 1),
+            "loops": self.loops,
+            "repeat": len(self.samples),
+        }
+
+
+def _time_loops(func: Callable, loops: int) -> int:
+    """运行 loops 次，返回总纳秒数（计时期间关闭 GC）"""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            func()
+        return time.perf_counter_ns() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def measure(func: Callable, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> Timing:
+    """
+    计时无参函数
+
+    循环次数按 1, 2, 5, 10, 20, 50 ... 增长，直到一轮不少于 min_time 秒
+
+    Returns:
+        Timing（repeat 轮，每轮的单次耗时）
+    """
+    min_ns = min_time * 1e9
+    scale = 1
+    while True:
+        for factor in (1, 2, 5):
+            loops = scale * factor
+            if _time_loops(func, loops) >= min_ns:
+                return Timing(loops, [_time_loops(func, loops) / loops for _ in range(repeat)])
+        scale *= 10
+
+
+def from_samples(samples_ns: List[int], warmup: float = 0.1) -> Timing:
+    """逐次采样（例如回测中每次 on_order_book 的耗时）→ Timing，丢弃前 warmup 比例的预热样本"""
+    skip = int(len(samples_ns) * warmup)
+    return Timing(1, [float(s) for s in samples_ns[skip:]], per_call=True)
+
+
+# ========== 基线 ==========
+
+def machine_info() -> Dict[str, str]:
+    """记录在基线中的机器 / 解释器信息"""
+    info = {
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or _cpu_model(),
+    }
+    try:
+        import nautilus_trader
+        info["nautilus_trader"] = nautilus_trader.__version__
+    except ImportError:
+        pass
+    return info
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return ""
+
+
+def save_baseline(path, results: Dict[str, Timing]) -> Path:
+    """写入基线 JSON"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "machine": machine_info(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": {name: timing.to_dict() for name, timing in results.items()},
+    }
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return path
+
+
+def load_baseline(path) -> Optional[dict]:
+    """读取基线（不存在时返回 None）"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def machine_mismatch(baseline: dict) -> List[str]:
+    """基线与当前机器不同的字段（不同机器上的比较只作参考）"""
+    current = machine_info()
+    recorded = baseline.get("machine", {})
+    return [key for key in ("python", "machine", "processor", "nautilus_trader") if recorded.get(key) != current.get(key)]
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """一个用例与基线的比较"""
+
+    name: str
+    current_ns: float
+    baseline_ns: Optional[float]
+    threshold: float
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline_ns:
+            return None
+        return self.current_ns / self.baseline_ns
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio is not None and self.ratio > 1 + self.threshold
+
+
+def compare(
+    results: Dict[str, Timing],
+    baseline: Optional[dict],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Comparison]:
+    """
+    按 value_ns 与基线比较（基线中没有的用例 baseline_ns 为 None，不算回归）
+
+    Args:
+        threshold: 允许的变慢比例（0.3 = 慢 30% 以内不算回归）
+    """
+    recorded = (baseline or {}).get("results", {})
+    return [
+        Comparison(
+            name=name,
+            current_ns=timing.value_ns,
+            baseline_ns=recorded.get(name, {}).get("value_ns"),
+            threshold=threshold,
+        )
+        for name, timing in results.items()
+    ]
+
+
+def _format_ns(ns: Optional[float]) -> str:
+    if ns is None:
+        return "-"
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f}ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f}us"
+    return f"{ns:.0f}ns"
+
+
+def format_report(results: Dict[str, Timing], comparisons: List[Comparison]) -> str:
+    """文本表格：用例、min、median、基线（value_ns）、比值、状态"""
+    lines = [f"{'case':<28}{'min':>10}{'median':>10}{'baseline':>10}{'ratio':>8}  status"]
+    for row in comparisons:
+        timing = results[row.name]
+        if row.ratio is None:
+            ratio, status = "-", "new"
+        else:
+            ratio = f"{row.ratio:.2f}"
+            status = "REGRESSION" if row.regressed else "ok"
+        lines.append(
+            f"{row.name:<28}{_format_ns(timing.min_ns):>10}{_format_ns(timing.median_ns):>10}"
+            f"{_format_ns(row.baseline_ns):>10}{ratio:>8}  {status}"
+        )
+    return "\n".join(lines)
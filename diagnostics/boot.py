@@ -0,0 +1,294 @@
+"""
+启动剖析 - 从进程启动到第一笔报价的分阶段耗时
+
+重启和每日滚动时真正影响可用性的是冷启动时间：解释器启动、NautilusTrader /
+Polymarket 适配器导入、Gamma API 查询、Instrument 加载、node.build()、
+websocket 订阅到第一笔行情、第一笔报价。这里：
+1. BootProfiler 以进程启动时刻为零点，记录每个阶段的起止和里程碑
+2. ImportTimer 在 sys.meta_path 上计时每个模块的导入（类似 -X importtime：自身 / 累计耗时）
+3. BootMarker（Actor）在事件循环里标记第一笔行情、第一笔报价和交易所确认，然后写出报告
+
+只依赖标准库；BootMarker 在 boot_marker() 中才导入 NautilusTrader
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def process_age() -> float:
+    """进程已运行的秒数（Linux 读 /proc，其他平台返回 0）"""
+    try:
+        with open("/proc/self/stat", "rb") as f:
+            # comm 字段可能含空格，从最后一个 ')' 之后开始数：starttime 为第 22 个字段
+            fields = f.read().rsplit(b")", 1)[1].split()
+        with open("/proc/uptime", "rb") as f:
+            uptime = float(f.read().split()[0])
+        return max(uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"), 0.0)
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+class BootProfiler:
+    """
+    启动阶段计时器
+
+    时间以进程启动为零点（单调时钟），阶段可以嵌套，里程碑是瞬时事件
+
+    Args:
+        started_at: 零点对应的 perf_counter 值（None 表示按进程已运行时间推算）
+    """
+
+    def __init__(self, started_at: Optional[float] = None):
+        now = time.perf_counter()
+        self.started_at = started_at if started_at is not None else now - process_age()
+        self.phases: List[Tuple[str, float, float]] = [("interpreter", 0.0, now - self.started_at)]
+        self.milestones: List[Tuple[str, float]] = []
+        self.imports: Optional["ImportTimer"] = None
+        self._finished = False
+
+    def elapsed(self) -> float:
+        """距零点的秒数"""
+        return time.perf_counter() - self.started_at
+
+    @contextmanager
+    def phase(self, name: str):
+        """计时一个阶段（异常时同样记录）"""
+        start = self.elapsed()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start, self.elapsed()))
+
+    def mark(self, name: str) -> float:
+        """记录里程碑（同名只记录第一次），返回距零点的秒数"""
+        at = self.elapsed()
+        if not any(existing == name for existing, _ in self.milestones):
+            self.milestones.append((name, at))
+        return at
+
+    # ========== 报告 ==========
+
+    def to_dict(self) -> dict:
+        result = {
+            "phases": [
+                {"name": name, "start_ms": start * 1e3, "duration_ms": (end - start) * 1e3}
+                for name, start, end in self.phases
+            ],
+            "milestones": {name: at * 1e3 for name, at in self.milestones},
+        }
+        if self.imports is not None:
+            result["imports"] = self.imports.to_dict()
+        return result
+
+    def report(self) -> str:
+        lines = [f"{'阶段':<24}{'开始(ms)':>12}{'耗时(ms)':>12}"]
+        for name, start, end in self.phases:
+            lines.append(f"{name:<26}{start * 1e3:>12.1f}{(end - start) * 1e3:>12.1f}")
+        for name, at in self.milestones:
+            lines.append(f"{'@ ' + name:<26}{at * 1e3:>12.1f}")
+        if self.imports is not None:
+            lines.append("")
+            lines.append(self.imports.report())
+        return "\n".join(lines)
+
+    def finish(self, path=None, out: Callable[[str], None] = print) -> bool:
+        """
+        输出报告（只输出一次）
+
+        Args:
+            path: JSON 报告路径（None 表示只打印）
+            out: 文本报告输出函数
+        """
+        if self._finished:
+            return False
+        self._finished = True
+
+        if self.imports is not None:
+            self.imports.uninstall()
+        out(self.report())
+        if path:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=1), encoding="utf-8")
+        return True
+
+
+# ========== 导入计时 ==========
+
+class ImportTimer:
+    """
+    模块导入计时（sys.meta_path 查找器）
+
+    找到模块后临时包装它的 loader，执行完毕恢复原 loader；
+    嵌套导入按栈扣除，得到每个模块的自身耗时和累计耗时（与 -X importtime 相同的口径）
+    """
+
+    def __init__(self):
+        self.records: List[Tuple[str, float, float, int]] = []    # (模块, 自身秒, 累计秒, 嵌套深度)
+        self._stack: List[float] = []                               # 每层已扣除的子模块耗时
+        self._finding = set()
+
+    def install(self) -> "ImportTimer":
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname in self._finding:
+            return None
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self, fullname)
+                    return spec
+            return None
+        finally:
+            self._finding.discard(fullname)
+
+    def _enter(self):
+        self._stack.append(0.0)
+        return time.perf_counter()
+
+    def _exit(self, name: str, start: float):
+        cumulative = time.perf_counter() - start
+        children = self._stack.pop()
+        if self._stack:
+            self._stack[-1] += cumulative
+        self.records.append((name, cumulative - children, cumulative, len(self._stack)))
+
+    # ========== 汇总 ==========
+
+    def by_package(self) -> Dict[str, float]:
+        """顶层包 → 自身耗时之和（秒），降序"""
+        totals: Dict[str, float] = {}
+        for name, self_time, _, _ in self.records:
+            package = name.split(".", 1)[0]
+            totals[package] = totals.get(package, 0.0) + self_time
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def slowest(self, n: int = 15) -> List[Tuple[str, float, float, int]]:
+        """自身耗时最长的 n 个模块"""
+        return sorted(self.records, key=lambda record: -record[1])[:n]
+
+    def total(self) -> float:
+        return sum(record[1] for record in self.records)
+
+    def to_dict(self, n: int = 30) -> dict:
+        return {
+            "total_ms": self.total() * 1e3,
+            "modules": len(self.records),
+            "packages_ms": {name: value * 1e3 for name, value in self.by_package().items()},
+            "slowest": [
+                {"module": name, "self_ms": s * 1e3, "cumulative_ms": c * 1e3}
+                for name, s, c, _ in self.slowest(n)
+            ],
+        }
+
+    def report(self, n: int = 15) -> str:
+        lines = [f"导入 {len(self.records)} 个模块，共 {self.total() * 1e3:.1f} ms"]
+        lines.append(f"{'包':<32}{'自身(ms)':>12}")
+        for name, value in list(self.by_package().items())[:n]:
+            lines.append(f"{name:<33}{value * 1e3:>12.1f}")
+        lines.append(f"{'模块':<32}{'自身(ms)':>12}{'累计(ms)':>12}")
+        for name, self_time, cumulative, _ in self.slowest(n):
+            lines.append(f"{name:<34}{self_time * 1e3:>12.1f}{cumulative * 1e3:>12.1f}")
+        return "\n".join(lines)
+
+
+class _TimedLoader:
+    """计时包装（模块执行完毕即恢复原 loader，不留在模块上）"""
+
+    def __init__(self, loader, timer: ImportTimer, name: str):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+        self._start = None
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        self._start = self._timer._enter()
+        create = getattr(self._loader, "create_module", None)
+        try:
+            return create(spec) if create is not None else None
+        except BaseException:
+            self._timer._exit(self._name, self._start)
+            raise
+
+    def exec_module(self, module):
+        spec = module.__spec__
+        if spec is not None and spec.loader is self:
+            spec.loader = self._loader
+        if getattr(module, "__loader__", None) is self:
+            module.__loader__ = self._loader
+        if self._start is None:
+            self._start = self._timer._enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer._exit(self._name, self._start)
+
+
+# ========== 事件循环里程碑 ==========
+
+def boot_marker(profiler: BootProfiler, on_ready: Optional[Callable] = None):
+    """
+    创建 BootMarker Actor（此时才导入 NautilusTrader）
+
+    标记：node_started（Actor 启动）、first_book（第一批订单簿增量）、
+    first_quote（第一笔报价提交）、first_ack（交易所确认第一笔报价）；
+    first_ack 之后调用 on_ready（通常是 profiler.finish）
+    """
+    from nautilus_trader.common.actor import Actor
+    from nautilus_trader.config import ActorConfig
+
+    class BootMarker(Actor):
+        BOOK_TOPIC = "data.book.deltas.*"
+        ORDER_TOPIC = "events.order.*"
+
+        def __init__(self):
+            super().__init__(ActorConfig(component_id="BootMarker"))
+
+        def on_start(self):
+            profiler.mark("node_started")
+            self.msgbus.subscribe(topic=self.BOOK_TOPIC, handler=self._on_book)
+            self.msgbus.subscribe(topic=self.ORDER_TOPIC, handler=self._on_order_event)
+
+        def on_stop(self):
+            self._unsubscribe()
+
+        def _unsubscribe(self):
+            for topic, handler in ((self.BOOK_TOPIC, self._on_book), (self.ORDER_TOPIC, self._on_order_event)):
+                if self.msgbus.is_subscribed(topic=topic, handler=handler):
+                    self.msgbus.unsubscribe(topic=topic, handler=handler)
+
+        def _on_book(self, deltas):
+            profiler.mark("first_book")
+            self.msgbus.unsubscribe(topic=self.BOOK_TOPIC, handler=self._on_book)
+
+        def _on_order_event(self, event):
+            kind = type(event).__name__
+            if kind == "OrderSubmitted":
+                profiler.mark("first_quote")
+            elif kind == "OrderAccepted":
+                profiler.mark("first_ack")
+                self.msgbus.unsubscribe(topic=self.ORDER_TOPIC, handler=self._on_order_event)
+                if on_ready is not None:
+                    on_ready()
+
+    return BootMarker()
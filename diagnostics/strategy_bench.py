@@ -0,0 +1,199 @@
+"""
+做市策略微基准 - 纯计算函数和完整 on_order_book 路径
+
+在 BacktestEngine 中回放一段合成订单簿（默认每边 30 档，tick 0.001，随机游走含跳价，
+附带成交以产生持仓），策略以真实的 Cache / Portfolio / RiskEngine 运行：
+1. on_order_book：回放期间逐次计时（含重报调度、风控、报价计算、差分与 submit_order），
+   交易所正常确认 / 撤单，挂单规模保持在稳态
+2. 回放结束后引擎保持运行（streaming），对当前订单簿按 timeit 方式计时
+   _calculate_dynamic_spread / _calculate_inventory_skew / _calculate_order_size /
+   _calculate_volatility / _check_risk；仓位 / 账户快照每次调用前失效，与 on_order_book 中一致
+
+合成数据由 seed 固定，同一台机器上结果可复现
+"""
+
+import random
+from time import perf_counter_ns
+from typing import Callable, Dict, Optional, Sequence
+
+from nautilus_trader.model.data import BookOrder, OrderBookDelta, OrderBookDeltas, TradeTick
+from nautilus_trader.model.enums import AggressorSide, BookAction, OrderSide, RecordFlag
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.objects import Price, Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.harness import build_engine
+from config.strategy_config import MarketMakingConfig
+from diagnostics.bench import DEFAULT_MIN_TIME, DEFAULT_REPEAT, Timing, from_samples, measure
+from strategies.market_making_strategy import MarketMakingStrategy
+
+
+START_NS = 1_700_000_000_000_000_000
+STEP_NS = 100_000_000       # 100ms：每秒 20 笔订单，低于 RiskEngine 默认限流
+
+DEFAULT_LEVELS = 30
+DEFAULT_UPDATES = 2000
+DEFAULT_SEED = 7
+
+CASES = (
+    "calculate_dynamic_spread",
+    "calculate_inventory_skew",
+    "calculate_order_size",
+    "calculate_order_size_scan",
+    "calculate_volatility",
+    "check_risk",
+    "on_order_book",
+)
+
+
+def synthetic_session(instrument, updates: int = DEFAULT_UPDATES, levels: int = DEFAULT_LEVELS, seed: int = DEFAULT_SEED):
+    """
+    合成 L2 订单簿快照序列 + 成交
+
+    每次更新为一个完整快照（CLEAR + 每边 levels 档），中间价按 tick 随机游走（偶有跳价），
+    数量为对数正态分布，每 5 次更新一笔成交
+
+    Returns:
+        [OrderBookDeltas | TradeTick]（按时间排序）
+    """
+    rng = random.Random(seed)
+    tick = float(instrument.price_increment)
+    precision = instrument.price_precision
+    top = int(round(1 / tick))
+    data = []
+    mid = top // 2
+    ts = START_NS
+
+    for i in range(updates):
+        ts += STEP_NS
+        mid = max(levels + 1, min(top - levels - 1, mid + rng.choice([-15, -3, -1, 0, 0, 1, 3, 15])))
+
+        deltas = [OrderBookDelta.clear(instrument.id, i, ts, ts)]
+        for level in range(levels):
+            for side, ticks in ((OrderSide.BUY, mid - 1 - level), (OrderSide.SELL, mid + 1 + level)):
+                last = level == levels - 1 and side == OrderSide.SELL
+                size = round(rng.lognormvariate(4.0, 1.0) + 1, 2)
+                deltas.append(OrderBookDelta(
+                    instrument.id,
+                    BookAction.ADD,
+                    BookOrder(side, Price(ticks * tick, precision), Quantity(size, 2), 0),
+                    RecordFlag.F_LAST if last else 0,
+                    i,
+                    ts,
+                    ts,
+                ))
+        data.append(OrderBookDeltas(instrument.id, deltas))
+
+        if i % 5 == 0:
+            aggressor = rng.choice([AggressorSide.BUYER, AggressorSide.SELLER])
+            ticks = mid + (15 if aggressor == AggressorSide.BUYER else -15)
+            data.append(TradeTick(
+                instrument.id,
+                Price(ticks * tick, precision),
+                Quantity(10, 2),
+                aggressor,
+                TradeId(str(i)),
+                ts + 1,
+                ts + 1,
+            ))
+
+    return data
+
+
+class TimedMarketMakingStrategy(MarketMakingStrategy):
+    """逐次记录 on_order_book 耗时（纳秒）"""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.book_samples = []
+
+    def on_order_book(self, order_book):
+        start = perf_counter_ns()
+        super().on_order_book(order_book)
+        self.book_samples.append(perf_counter_ns() - start)
+
+
+def _fresh(strategy, method: Callable) -> Callable:
+    """每次调用前使快照失效（与 on_order_book 中的新 tick 一致）"""
+
+    def call():
+        strategy.invalidate_snapshots()
+        return method()
+
+    return call
+
+
+def _cases(strategy, order_book) -> Dict[str, Callable]:
+    return {
+        "calculate_dynamic_spread": lambda: strategy._calculate_dynamic_spread(order_book),
+        "calculate_inventory_skew": _fresh(strategy, strategy._calculate_inventory_skew),
+        "calculate_order_size": lambda: strategy._calculate_order_size(order_book),
+        "calculate_volatility": strategy._calculate_volatility,
+        "check_risk": _fresh(strategy, lambda: strategy._check_risk(order_book)),
+    }
+
+
+def run_strategy_bench(
+    updates: int = DEFAULT_UPDATES,
+    levels: int = DEFAULT_LEVELS,
+    seed: int = DEFAULT_SEED,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+    cases: Optional[Sequence[str]] = None,
+) -> Dict[str, Timing]:
+    """
+    运行基准
+
+    Args:
+        updates: 回放的订单簿更新次数（也是 on_order_book 的样本数）
+        levels: 每边档位数
+        repeat / min_time: 纯函数用例的轮数和每轮最短时间
+        cases: 只运行这些用例（None 表示全部）
+
+    Returns:
+        {用例名: Timing}，按 CASES 顺序
+    """
+    selected = set(cases or CASES)
+    instrument = TestInstrumentProvider.binary_option()
+    config = MarketMakingConfig(
+        instrument_id=str(instrument.id),
+        order_size=5,
+        min_order_size=1,
+        min_requote_interval_ms=0,
+        telemetry_level="ERROR",
+    )
+    strategy = TimedMarketMakingStrategy(config)
+
+    engine = build_engine([instrument])
+    results: Dict[str, Timing] = {}
+    try:
+        engine.add_strategy(strategy)
+        engine.add_data(synthetic_session(instrument, updates, levels, seed))
+        engine.run(streaming=True)
+
+        if "on_order_book" in selected:
+            results["on_order_book"] = from_samples(strategy.book_samples)
+
+        strategy._activate(instrument.id)
+        order_book = strategy.cache.order_book(instrument.id)
+        for name, func in _cases(strategy, order_book).items():
+            if name in selected:
+                results[name] = measure(func, repeat=repeat, min_time=min_time)
+
+        if "calculate_order_size_scan" in selected:
+            # 深度跟踪未初始化时的回退路径：逐档累加订单簿
+            depth = strategy._slot.depth
+            depth.initialized = False
+            try:
+                results["calculate_order_size_scan"] = measure(
+                    lambda: strategy._calculate_order_size(order_book),
+                    repeat=repeat,
+                    min_time=min_time,
+                )
+            finally:
+                depth.initialized = True
+    finally:
+        engine.end()
+        engine.dispose()
+
+    return {name: results[name] for name in CASES if name in results}
@@ -0,0 +1,524 @@
+"""
+端到端吞吐基准 - 一个 TradingNode + MarketMakingStrategy 能承受多少订单簿更新
+
+与实盘相同的组件：LiveDataEngine / RiskEngine / ExecEngine 的异步队列、策略回调、
+订单提交；只替换两端：
+1. SyntheticDataClient：本地数据客户端，按目标速率把 backtest.synthetic 的增量流推入 DataEngine
+   （时间戳取 LiveClock 当前时间，与真实 websocket 客户端一样在事件循环内解码）
+2. Sandbox 执行客户端：本地模拟撮合，不连接交易所
+
+速率阶梯逐级加压，每级记录：实际处理速率、策略回调延迟（latency_stats 的 dispatch /
+tick_to_trade 分位数）、DataEngine 队列积压、CPU%、RSS。
+
+饱和判定看持续的状态，不看单次抖动（一级只有几百个样本，一次事件循环停顿就能推高 p99）：
+1. 一级内按 WINDOW_SECS 分窗口，多数窗口处理速率跟不上、或多数窗口 dispatch p99 超过上限、
+   或队列积压持续增长时，这一级记为过载
+2. 过载后以同一速率重测，连续 confirm_steps 次过载才确认饱和；重测通过则继续加压
+报告确认饱和前最高的一级
+
+只依赖 NautilusTrader 和 NumPy，离线运行（CI 和生产机器上都可以跑）
+"""
+
+import asyncio
+import os
+import resource
+import sys
+import time
+from decimal import Decimal
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from nautilus_trader.common.providers import InstrumentProvider
+from nautilus_trader.live.data_client import LiveMarketDataClient
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.identifiers import ClientId, Venue
+
+from backtest.reader import to_engine_data
+from backtest.records import RECORD_DTYPE, decode
+from backtest.synthetic import SyntheticBookConfig, SyntheticMarket, binary_market
+from strategies.latency import LatencyHistogram
+
+
+VENUE = "POLYMARKET"
+
+DEFAULT_RATES = (250, 500, 1000, 2000, 4000, 8000, 16000)
+DEFAULT_STEP_SECS = 3.0
+DEFAULT_MAX_P99_MS = 50.0       # dispatch p99 超过该值视为饱和
+DEFAULT_MIN_RATIO = 0.9         # 实际 / 目标速率低于该值视为饱和
+DEFAULT_WARMUP_SECS = 1.0
+DEFAULT_CONFIRM_STEPS = 2       # 同一速率连续过载这么多次才确认饱和
+
+WINDOW_SECS = 0.5               # 一级内的统计窗口
+
+PUMP_INTERVAL_SECS = 0.001
+REFILL_UPDATES = 4096
+DRAIN_TIMEOUT_SECS = 10.0
+
+
+# ========== 进程资源 ==========
+
+def rss_bytes() -> int:
+    """当前常驻内存（Linux 读 /proc/self/statm，其他平台返回峰值 ru_maxrss）"""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class ResourceSampler:
+    """一段时间内的 CPU%（进程 CPU 时间 / 墙钟）和 RSS"""
+
+    def __init__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    def sample(self) -> Dict[str, float]:
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        return {
+            "cpu_percent": 100.0 * cpu / wall if wall > 0 else 0.0,
+            "rss_mb": rss_bytes() / 2**20,
+        }
+
+
+# ========== 本地数据客户端 ==========
+
+class SyntheticDataClient(LiveMarketDataClient):
+    """
+    按目标速率推送合成订单簿增量的数据客户端
+
+    rate 为所有品种合计的 OrderBookDeltas 条数 / 秒（0 表示暂停）；
+    每 PUMP_INTERVAL_SECS 按墙钟补齐应发的更新，事件循环跟不上时积压在 DataEngine 队列中
+
+    Args:
+        markets: SyntheticMarket 列表（每个市场的 YES / NO 品种都会推送）
+    """
+
+    def __init__(self, loop, msgbus, cache, clock, markets: Sequence[SyntheticMarket]):
+        super().__init__(
+            loop=loop,
+            client_id=ClientId(VENUE),
+            venue=Venue(VENUE),
+            msgbus=msgbus,
+            cache=cache,
+            clock=clock,
+            instrument_provider=InstrumentProvider(),
+        )
+        self.markets = list(markets)
+        self.rate = 0.0
+        self.sent = 0           # 已推送的 OrderBookDeltas 条数
+
+        self._buffers = [np.zeros(0, dtype=RECORD_DTYPE) for _ in self.markets]
+        self._next = 0
+        self._carry = 0.0
+        self._last_ns = 0
+        self._pump_task = None
+
+    @property
+    def books_per_update(self) -> int:
+        return len(self.markets[0].instruments)
+
+    # ---------- LiveMarketDataClient ----------
+
+    async def _connect(self):
+        self._pump_task = self.create_task(self._pump(), log_msg="synthetic-pump")
+
+    async def _disconnect(self):
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            self._pump_task = None
+
+    async def _subscribe_order_book_deltas(self, command):
+        pass
+
+    async def _subscribe_quote_ticks(self, command):
+        pass
+
+    async def _subscribe_trade_ticks(self, command):
+        pass
+
+    async def _unsubscribe_order_book_deltas(self, command):
+        pass
+
+    async def _unsubscribe_quote_ticks(self, command):
+        pass
+
+    async def _unsubscribe_trade_ticks(self, command):
+        pass
+
+    # ---------- 推送 ----------
+
+    async def _pump(self):
+        while True:
+            await asyncio.sleep(PUMP_INTERVAL_SECS)
+            now_ns = self._clock.timestamp_ns()
+            if self.rate <= 0 or not self._last_ns:
+                self._last_ns = now_ns
+                self._carry = 0.0
+                continue
+
+            due = (now_ns - self._last_ns) * self.rate / 1e9 / self.books_per_update + self._carry
+            self._last_ns = now_ns
+            updates = int(due)
+            self._carry = due - updates
+            for _ in range(updates):
+                self._send_update(now_ns)
+
+    def _send_update(self, ts_ns: int):
+        """轮流从各市场取下一次更新，时间戳改为当前时间后解码推送"""
+        index = self._next
+        self._next = (index + 1) % len(self.markets)
+
+        records = self._take(index)
+        records["ts_event"] = ts_ns
+        records["ts_init"] = ts_ns
+        for item in to_engine_data(decode(records, self.markets[index].table)):
+            self._handle_data(item)
+            if isinstance(item, OrderBookDeltas):
+                self.sent += 1
+
+    def _take(self, index: int) -> np.ndarray:
+        """下一次更新的记录（同一 sequence；第一次还包含初始快照）"""
+        buffer = self._buffers[index]
+        if len(buffer) == 0:
+            # 按块生成的记录只包含完整的更新
+            buffer = self.markets[index].records(REFILL_UPDATES)
+        stop = int(np.searchsorted(buffer["sequence"], max(int(buffer["sequence"][0]), 1), side="right"))
+        self._buffers[index] = buffer[stop:]
+        return buffer[:stop].copy()
+
+
+# ========== 速率阶梯 ==========
+
+@dataclass
+class StepResult:
+    """一级速率的测量结果（速率单位：OrderBookDeltas / 秒，延迟单位：毫秒）"""
+
+    target_rate: float
+    offered_rate: float                 # 实际推送的速率
+    processed_rate: float               # 策略实际处理的速率
+    dispatch_p50_ms: float
+    dispatch_p99_ms: float
+    dispatch_max_ms: float
+    tick_to_trade_p50_ms: float
+    tick_to_trade_p99_ms: float
+    max_backlog: int                    # DataEngine 数据队列的最大积压
+    cpu_percent: float
+    rss_mb: float
+    windows: int = 0                    # 统计窗口数
+    windows_behind: int = 0             # 处理速率 / 目标速率低于下限的窗口数（推送跟不上也算）
+    windows_slow: int = 0               # dispatch p99 超过上限的窗口数
+    backlog_growing: bool = False       # 结束时积压超过一个窗口的数据量且仍在增长
+    attempt: int = 1                    # 同一速率的第几次测量
+    overloaded: bool = False            # 这一级过载（可能是瞬时抖动）
+    saturated: bool = False             # 同一速率连续过载，确认饱和
+
+    @property
+    def ratio(self) -> float:
+        return self.processed_rate / self.offered_rate if self.offered_rate else 0.0
+
+    def is_overloaded(self, max_p99_ms: float, min_ratio: float) -> bool:
+        """多数窗口跟不上或 dispatch p99 超限、或积压持续增长（没有窗口统计时按整级判断）"""
+        if not self.windows:
+            return self.processed_rate < self.target_rate * min_ratio or self.dispatch_p99_ms > max_p99_ms
+
+        majority = self.windows // 2 + 1
+        return (
+            self.windows_behind >= majority
+            or self.windows_slow >= majority
+            or self.backlog_growing
+        )
+
+
+@dataclass
+class ThroughputReport:
+    """整个阶梯的结果"""
+
+    markets: int
+    instruments: int
+    steps: List[StepResult] = field(default_factory=list)
+
+    @property
+    def saturation_rate(self) -> Optional[float]:
+        """确认饱和之前、未过载的各级中最高的实际处理速率（第一级就确认饱和时为 None）"""
+        healthy = []
+        for step in self.steps:
+            if step.saturated:
+                break
+            if not step.overloaded:
+                healthy.append(step.processed_rate)
+        return max(healthy) if healthy else None
+
+    def to_dict(self) -> dict:
+        return {
+            "markets": self.markets,
+            "instruments": self.instruments,
+            "saturation_rate": self.saturation_rate,
+            "steps": [asdict(step) for step in self.steps],
+        }
+
+    def format_table(self) -> str:
+        lines = [
+            f"{'target/s':>9}{'offered/s':>10}{'done/s':>9}{'disp p50':>10}{'disp p99':>10}"
+            f"{'t2t p99':>10}{'backlog':>9}{'cpu%':>7}{'rss MB':>8}  status"
+        ]
+        for step in self.steps:
+            lines.append(
+                f"{step.target_rate:>9.0f}{step.offered_rate:>10.0f}{step.processed_rate:>9.0f}"
+                f"{step.dispatch_p50_ms:>10.2f}{step.dispatch_p99_ms:>10.2f}{step.tick_to_trade_p99_ms:>10.2f}"
+                f"{step.max_backlog:>9}{step.cpu_percent:>7.0f}{step.rss_mb:>8.0f}  "
+                f"{'SATURATED' if step.saturated else 'overload (retry)' if step.overloaded else 'ok'}"
+            )
+        rate = self.saturation_rate
+        lines.append(
+            f"{self.markets} 个市场 / {self.instruments} 个订单簿，饱和吞吐: "
+            + (f"{rate:.0f} 次订单簿更新/秒" if rate is not None else "第一级即饱和")
+        )
+        return "\n".join(lines)
+
+
+def synthetic_markets(markets: int, tick: str = "0.001", seed: int = 0, config: SyntheticBookConfig = SyntheticBookConfig()):
+    """markets 个独立的 YES / NO 合成市场"""
+    result = []
+    for i in range(markets):
+        yes, no = binary_market(tick, suffix=f"{i:02x}" if markets > 1 else "")
+        result.append(SyntheticMarket(yes, config, seed=seed + i, no_instrument=no))
+    return result
+
+
+def run_throughput(
+    markets: int = 1,
+    rates: Sequence[float] = DEFAULT_RATES,
+    step_secs: float = DEFAULT_STEP_SECS,
+    warmup_secs: float = DEFAULT_WARMUP_SECS,
+    max_p99_ms: float = DEFAULT_MAX_P99_MS,
+    min_ratio: float = DEFAULT_MIN_RATIO,
+    confirm_steps: int = DEFAULT_CONFIRM_STEPS,
+    tick: str = "0.001",
+    seed: int = 0,
+    strategy_overrides: Optional[dict] = None,
+    stop_on_saturation: bool = True,
+    log_level: str = "ERROR",
+) -> ThroughputReport:
+    """
+    启动一个 TradingNode，按速率阶梯逐级加压
+
+    Args:
+        markets: 市场数（每个市场 YES / NO 两个订单簿，策略为两者报价）
+        rates: 速率阶梯（所有订单簿合计的 OrderBookDeltas / 秒）
+        step_secs: 每级持续秒数
+        warmup_secs: 第一级之前以最低速率预热（初始快照、账户、首批订单）的秒数
+        max_p99_ms / min_ratio: 过载判定（dispatch p99 上限、处理速率 / 推送速率下限）
+        confirm_steps: 同一速率连续过载多少次确认饱和（1 表示不重测）
+        strategy_overrides: 额外的 MarketMakingConfig 参数
+        stop_on_saturation: 饱和后不再加压
+
+    Returns:
+        ThroughputReport
+    """
+    from nautilus_trader.adapters.sandbox.config import SandboxExecutionClientConfig
+    from nautilus_trader.adapters.sandbox.factory import SandboxLiveExecClientFactory
+    from nautilus_trader.config import LoggingConfig, TradingNodeConfig
+    from nautilus_trader.live.node import TradingNode
+    from nautilus_trader.model.identifiers import TraderId
+
+    from config.strategy_config import MarketMakingConfig
+    from strategies.market_making_strategy import MarketMakingStrategy
+
+    sources = synthetic_markets(markets, tick=tick, seed=seed)
+    quoted = [instrument for source in sources for instrument in source.instruments]
+    currency = quoted[0].quote_currency
+
+    # 合成行情含新闻冲击：放宽波动率暂停，保持策略始终走完整的报价路径
+    params = {
+        "order_size": 5,
+        "min_order_size": 1,
+        "max_volatility": Decimal("1"),
+        "telemetry_level": log_level,
+        **(strategy_overrides or {}),
+    }
+    strategy = MarketMakingStrategy(MarketMakingConfig(
+        instrument_ids=tuple(str(instrument.id) for instrument in quoted),
+        latency_stats=True,
+        **params,
+    ))
+
+    # 每次运行使用新的事件循环（node.dispose() 会关闭它）
+    loop = asyncio.new_event_loop()
+    node = TradingNode(loop=loop, config=TradingNodeConfig(
+        trader_id=TraderId("BENCH-001"),
+        exec_clients={
+            VENUE: SandboxExecutionClientConfig(
+                venue=VENUE,
+                starting_balances=[f"1000000 {currency.code}"],
+                base_currency=currency.code,
+                oms_type="NETTING",
+                account_type="CASH",
+                book_type="L2_MBP",
+            ),
+        },
+        logging=LoggingConfig(log_level=log_level),
+        timeout_connection=10.0,
+        timeout_reconciliation=5.0,
+        timeout_portfolio=5.0,
+        timeout_disconnection=2.0,
+        timeout_post_stop=0.0,
+    ))
+    report = ThroughputReport(markets=markets, instruments=len(quoted))
+
+    try:
+        node.trader.add_strategy(strategy)
+        node.add_exec_client_factory(VENUE, SandboxLiveExecClientFactory)
+        node.build()
+
+        kernel = node.kernel
+        for source in sources:
+            for instrument in source.instruments:
+                node.cache.add_instrument(instrument)
+
+        client = SyntheticDataClient(kernel.loop, kernel.msgbus, kernel.cache, kernel.clock, sources)
+        kernel.data_engine.register_client(client)
+
+        async def drive():
+            runner = asyncio.ensure_future(node.run_async())
+            try:
+                while not strategy.is_running:
+                    await asyncio.sleep(0.05)
+                if warmup_secs > 0:
+                    await _run_step(client, kernel.data_engine, strategy, rates[0], warmup_secs)
+                for rate in rates:
+                    attempts = []
+                    while len(attempts) < max(confirm_steps, 1):
+                        step = await _run_step(
+                            client, kernel.data_engine, strategy, rate, step_secs, min_ratio, max_p99_ms
+                        )
+                        step.attempt = len(attempts) + 1
+                        step.overloaded = step.is_overloaded(max_p99_ms, min_ratio)
+                        attempts.append(step)
+                        report.steps.append(step)
+                        if not step.overloaded:
+                            break
+
+                    # 重测通过说明是瞬时抖动，继续加压
+                    if attempts[-1].overloaded:
+                        for step in attempts:
+                            step.saturated = True
+                        if stop_on_saturation:
+                            break
+            finally:
+                client.rate = 0
+                await node.stop_async()
+                await asyncio.wait_for(runner, timeout=DRAIN_TIMEOUT_SECS)
+
+        kernel.loop.run_until_complete(drive())
+    finally:
+        node.dispose()
+
+    return report
+
+
+def _backlog_growing(windows, rate: float) -> bool:
+    """
+    积压持续增长：结束时的积压超过一个窗口的数据量，且不低于前半程的最大积压
+
+    一次停顿造成的积压会在之后的窗口里排空，不满足第二个条件
+    """
+    if len(windows) < 2:
+        return False
+
+    backlogs = [window[3] for window in windows]
+    half = len(backlogs) // 2
+    return backlogs[-1] > rate * WINDOW_SECS and backlogs[-1] >= max(backlogs[:half])
+
+
+async def _run_step(
+    client,
+    data_engine,
+    strategy,
+    rate: float,
+    step_secs: float,
+    min_ratio: float = DEFAULT_MIN_RATIO,
+    max_p99_ms: float = DEFAULT_MAX_P99_MS,
+) -> StepResult:
+    """
+    一级速率：推送 step_secs 秒（按窗口统计），然后等待队列排空
+
+    延迟直方图每个窗口取一次 p99 后合并到整级的直方图
+    """
+    sent_before = client.sent
+    strategy.latency.reset()
+    sampler = ResourceSampler()
+    max_backlog = 0
+
+    feed = strategy.latency["feed"]
+    dispatch, tick_to_trade = LatencyHistogram(), LatencyHistogram()
+    windows = []    # 每个窗口 (秒数, 推送数, 处理数, 窗口结束时的积压, dispatch p99 纳秒)
+    window_start, window_sent, window_done = time.perf_counter(), client.sent, feed.count
+
+    def close_window(now, backlog):
+        nonlocal window_start, window_sent, window_done
+        window_dispatch = strategy.latency["dispatch"]
+        windows.append((
+            now - window_start,
+            client.sent - window_sent,
+            feed.count - window_done,
+            backlog,
+            window_dispatch.value_at_quantile(0.99),
+        ))
+        window_start, window_sent, window_done = now, client.sent, feed.count
+
+        dispatch.merge(window_dispatch)
+        tick_to_trade.merge(strategy.latency["tick_to_trade"])
+        window_dispatch.reset()
+        strategy.latency["tick_to_trade"].reset()
+
+    client.rate = rate
+    started = time.perf_counter()
+    window_end = started + WINDOW_SECS
+    while time.perf_counter() - started < step_secs:
+        await asyncio.sleep(0.01)
+        backlog = data_engine.data_qsize()
+        max_backlog = max(max_backlog, backlog)
+
+        now = time.perf_counter()
+        if now >= window_end:
+            close_window(now, backlog)
+            window_end = now + WINDOW_SECS
+    elapsed = time.perf_counter() - started
+
+    processed = feed.count
+    offered = client.sent - sent_before
+    resources = sampler.sample()
+
+    # 最后不足一个窗口的样本只计入整级
+    dispatch.merge(strategy.latency["dispatch"])
+    tick_to_trade.merge(strategy.latency["tick_to_trade"])
+    dispatch = dispatch.summary()
+    tick_to_trade = tick_to_trade.summary()
+
+    # 下一级之前排空积压
+    client.rate = 0
+    deadline = time.perf_counter() + DRAIN_TIMEOUT_SECS
+    while data_engine.data_qsize() and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+
+    return StepResult(
+        target_rate=rate,
+        offered_rate=offered / elapsed,
+        processed_rate=processed / elapsed,
+        dispatch_p50_ms=dispatch["p50_us"] / 1000,
+        dispatch_p99_ms=dispatch["p99_us"] / 1000,
+        dispatch_max_ms=dispatch["max_us"] / 1000,
+        tick_to_trade_p50_ms=tick_to_trade["p50_us"] / 1000,
+        tick_to_trade_p99_ms=tick_to_trade["p99_us"] / 1000,
+        max_backlog=max_backlog,
+        windows=len(windows),
+        windows_behind=sum(1 for secs, _, done, _, _ in windows if done < rate * secs * min_ratio),
+        windows_slow=sum(1 for *_, p99_ns in windows if p99_ns > max_p99_ms * 1e6),
+        backlog_growing=_backlog_growing(windows, rate),
+        **resources,
+    )
@@ -0,0 +1,274 @@
+"""
+市场发现 - 通过 Gamma API 把 slug 解析为 condition_id / token_ids
+
+1. 异步 httpx 客户端，连接池复用，批量 slug 并发查询（信号量限制并发数）
+2. 网络错误 / 5xx / 429 指数退避重试，404 直接失败
+3. 磁盘 TTL 缓存 slug → (condition_id, token_ids, question)：
+   缓存有效时启动不发任何请求；网络失败时退回过期缓存
+
+多市场部署的启动只需要一轮并行请求，缓存热时为零
+"""
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+
+GAMMA_API_URL = "https://gamma-api.polymarket.com"
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "cache" / "markets.json"
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+# HTTP 状态码中可以重试的（其余 4xx 直接失败）
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class MarketNotFound(LookupError):
+    """Gamma API 中不存在该 slug"""
+
+
+@dataclass(frozen=True)
+class MarketInfo:
+    """单个市场的标识"""
+
+    slug: str
+    condition_id: str
+    token_ids: Tuple[str, ...]
+    question: str = ""
+
+    @property
+    def token_id(self) -> str:
+        """YES token（做市使用的一侧）"""
+        return self.token_ids[0]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MarketInfo":
+        return cls(
+            slug=data["slug"],
+            condition_id=data["condition_id"],
+            token_ids=tuple(data["token_ids"]),
+            question=data.get("question", ""),
+        )
+
+
+def parse_market(slug: str, data: dict) -> MarketInfo:
+    """Gamma API 的市场 JSON → MarketInfo"""
+    token_ids = data.get("clobTokenIds") or "[]"
+    if isinstance(token_ids, str):
+        token_ids = json.loads(token_ids)
+
+    if not data.get("conditionId"):
+        raise ValueError(f"市场没有 condition ID: {slug}")
+    if not token_ids:
+        raise ValueError(f"市场没有 token IDs: {slug}")
+
+    return MarketInfo(
+        slug=slug,
+        condition_id=data["conditionId"],
+        token_ids=tuple(str(token_id) for token_id in token_ids),
+        question=data.get("question") or "",
+    )
+
+
+# ========== 磁盘缓存 ==========
+
+class MarketCache:
+    """
+    slug → MarketInfo 的 JSON 文件缓存
+
+    Args:
+        path: 缓存文件（None 表示不落盘，只在内存中）
+        ttl_seconds: 有效期
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # 缓存损坏时当作空缓存，下次写入覆盖
+            return {}
+
+    def get(self, slug: str, allow_stale: bool = False) -> Optional[MarketInfo]:
+        entry = self._entries.get(slug)
+        if entry is None:
+            return None
+        if not allow_stale and time.time() - entry["fetched_at"] > self.ttl_seconds:
+            return None
+        return MarketInfo.from_dict(entry["market"])
+
+    def put(self, markets: Iterable[MarketInfo]):
+        """写入并落盘（临时文件 + rename，进程崩溃也不会留下半个文件）"""
+        now = time.time()
+        for market in markets:
+            self._entries[market.slug] = {"fetched_at": now, "market": market.to_dict()}
+
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._entries, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# ========== 异步查询 ==========
+
+Fetch = Callable[[object, str], Awaitable[dict]]
+
+
+class MarketDiscovery:
+    """
+    批量市场查询
+
+    Args:
+        cache: 磁盘缓存（None 使用默认路径）
+        base_url: Gamma API 地址
+        timeout: 单次请求超时（秒）
+        max_concurrency: 并发请求上限（同时也是连接池大小）
+        retries: 每个 slug 最多尝试次数
+        backoff: 首次重试等待（秒），之后翻倍
+        fetch: 自定义 async fetch(client, slug) -> dict（测试或替换数据源用）
+    """
+
+    def __init__(
+        self,
+        cache: Optional[MarketCache] = None,
+        base_url: str = GAMMA_API_URL,
+        timeout: float = 10.0,
+        max_concurrency: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+        fetch: Optional[Fetch] = None,
+    ):
+        self.cache = cache if cache is not None else MarketCache()
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self._fetch = fetch or _fetch_gamma
+        self.requests = 0
+
+    async def lookup_many(self, slugs: Iterable[str]) -> Tuple[Dict[str, MarketInfo], Dict[str, Exception]]:
+        """
+        查询一组 slug
+
+        Returns:
+            (markets, errors)：成功的 slug → MarketInfo，失败的 slug → 异常
+        """
+        markets: Dict[str, MarketInfo] = {}
+        missing = []
+
+        for slug in dict.fromkeys(slugs):
+            cached = self.cache.get(slug)
+            if cached is not None:
+                markets[slug] = cached
+            else:
+                missing.append(slug)
+
+        errors: Dict[str, Exception] = {}
+        if not missing:
+            return markets, errors
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._client() as client:
+            results = await asyncio.gather(
+                *(self._lookup(client, semaphore, slug) for slug in missing),
+                return_exceptions=True,
+            )
+
+        fetched = []
+        for slug, result in zip(missing, results):
+            if isinstance(result, MarketInfo):
+                markets[slug] = result
+                fetched.append(result)
+                continue
+
+            stale = self.cache.get(slug, allow_stale=True)
+            if stale is not None and not isinstance(result, MarketNotFound):
+                markets[slug] = stale
+            else:
+                errors[slug] = result
+
+        if fetched:
+            self.cache.put(fetched)
+
+        return markets, errors
+
+    async def _lookup(self, client, semaphore: asyncio.Semaphore, slug: str) -> MarketInfo:
+        for attempt in range(self.retries):
+            try:
+                async with semaphore:
+                    self.requests += 1
+                    data = await self._fetch(client, slug)
+                return parse_market(slug, data)
+            except (MarketNotFound, ValueError):
+                raise
+            except Exception:
+                if attempt == self.retries - 1:
+                    raise
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+
+    def _client(self):
+        if self._fetch is not _fetch_gamma:
+            return _NullClient()
+
+        import httpx
+
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+
+
+class _NullClient:
+    """自定义 fetch 不需要 httpx 客户端"""
+
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+async def _fetch_gamma(client, slug: str) -> dict:
+    response = await client.get(f"/markets/slug/{slug}")
+    status = response.status_code
+    if status == 404:
+        raise MarketNotFound(slug)
+    if 400 <= status < 500 and status not in _RETRY_STATUS:
+        raise ValueError(f"Gamma API 返回 HTTP {status}: {slug}")
+    response.raise_for_status()
+    return response.json()
+
+
+# ========== 同步入口 ==========
+
+def lookup_markets(slugs: Iterable[str], **kwargs) -> Tuple[Dict[str, MarketInfo], Dict[str, Exception]]:
+    """同步批量查询（在没有运行中事件循环的启动阶段调用）"""
+    return asyncio.run(MarketDiscovery(**kwargs).lookup_many(slugs))
+
+
+def lookup_market(slug: str, **kwargs) -> MarketInfo:
+    """同步查询单个 slug，失败时抛出异常"""
+    markets, errors = lookup_markets([slug], **kwargs)
+    if slug in errors:
+        raise errors[slug]
+    return markets[slug]
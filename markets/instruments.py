@@ -0,0 +1,249 @@
+"""
+Instrument 快照 - 启动时直接从本地快照填充 Cache，后台再向交易所刷新
+
+InstrumentProviderConfig(load_ids=...) 每次启动都要向 Polymarket 请求品种定义，
+data client 连接完成之前策略不能报价。这里：
+1. InstrumentSnapshotStore 把首次加载的 Instrument（精度、tick size、最小数量等）
+   序列化到 data/cache/instruments.json，键为 get_polymarket_instrument_id(condition_id, token_id)
+2. 之后启动时有快照的品种不再交给 data client 加载，node.build() 之后直接放入 Cache
+3. InstrumentRefresher（Actor）启动后在后台线程重新加载这些品种，
+   回到事件循环更新 Cache 和快照，并在消息总线上发布品种更新
+   （tick size 变化时策略在 on_instrument 中按新网格撤单重报）
+
+重启后策略可以在网络往返完成之前开始报价
+"""
+
+import json
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.config import ActorConfig
+from nautilus_trader.model import instruments as _instruments
+
+
+DEFAULT_SNAPSHOT_PATH = Path(__file__).resolve().parent.parent / "data" / "cache" / "instruments.json"
+DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+
+def instrument_to_dict(instrument) -> dict:
+    """Instrument → 可 JSON 序列化的字典（含 type 字段）"""
+    return type(instrument).to_dict(instrument)
+
+
+def instrument_from_dict(data: dict):
+    """instrument_to_dict 的逆操作"""
+    return getattr(_instruments, data["type"]).from_dict(data)
+
+
+class InstrumentSnapshotStore:
+    """
+    instrument_id → Instrument 的 JSON 文件快照
+
+    Args:
+        path: 快照文件（None 表示不落盘，只在内存中）
+        max_age_seconds: 超过该时间的快照不再用于启动（仍会被刷新覆盖）
+    """
+
+    def __init__(self, path=DEFAULT_SNAPSHOT_PATH, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS):
+        self.path = Path(path) if path else None
+        self.max_age_seconds = max_age_seconds
+        self._entries: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # 快照损坏时当作空快照，下次写入覆盖
+            return {}
+
+    def __contains__(self, instrument_id) -> bool:
+        return str(instrument_id) in self._entries
+
+    def get(self, instrument_id, allow_stale: bool = False):
+        """
+        读取快照（不存在、过期或已到期的品种返回 None）
+
+        Args:
+            allow_stale: 是否接受超过 max_age_seconds 的快照
+        """
+        entry = self._entries.get(str(instrument_id))
+        if entry is None:
+            return None
+        if not allow_stale and time.time() - entry["fetched_at"] > self.max_age_seconds:
+            return None
+
+        try:
+            instrument = instrument_from_dict(entry["instrument"])
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+        if instrument.expiration_ns and instrument.expiration_ns < time.time_ns():
+            return None
+        return instrument
+
+    def get_many(self, instrument_ids: Iterable) -> Tuple[list, List[str]]:
+        """
+        Returns:
+            (instruments, missing)：可用的快照，以及需要从交易所加载的 ID
+        """
+        found, missing = [], []
+        for instrument_id in instrument_ids:
+            instrument = self.get(instrument_id)
+            if instrument is None:
+                missing.append(str(instrument_id))
+            else:
+                found.append(instrument)
+        return found, missing
+
+    def put(self, instruments: Iterable):
+        """写入并落盘（临时文件 + rename），同时清理已到期的品种"""
+        now = time.time()
+        for instrument in instruments:
+            self._entries[str(instrument.id)] = {
+                "fetched_at": now,
+                "instrument": instrument_to_dict(instrument),
+            }
+
+        now_ns = time.time_ns()
+        self._entries = {
+            key: entry for key, entry in self._entries.items()
+            if not 0 < (entry["instrument"].get("expiration_ns") or 0) < now_ns
+        }
+
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._entries, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def loader(self, load: Callable[[Sequence], list]) -> Callable[[Sequence], list]:
+        """
+        包装 [InstrumentId] → [Instrument] 加载函数：先查快照，缺失的再调用 load，并写回快照
+        """
+
+        def load_with_snapshot(instrument_ids: Sequence) -> list:
+            found, missing = self.get_many(instrument_ids)
+            if missing:
+                loaded = load(missing)
+                self.put(loaded)
+                found.extend(loaded)
+            return found
+
+        return load_with_snapshot
+
+
+class InstrumentRefresher(Actor):
+    """
+    快照刷新 Actor
+
+    启动时：
+    1. Cache 中已有、快照中没有的品种（本次由 data client 从交易所加载）→ 写入快照
+    2. seeded 中的品种（本次从快照填充）→ 后台线程重新加载，完成后更新 Cache 和快照
+
+    Args:
+        store: 快照
+        instrument_ids: 需要保存快照的品种
+        load_instruments: [InstrumentId] → [Instrument]（在后台线程调用）
+        seeded: 从快照填充、需要刷新的品种
+        poll_interval_secs: 检查后台任务的间隔
+        background: 是否在后台线程加载（False 时在 on_start 中同步执行，用于回测）
+    """
+
+    TIMER_NAME = "instrument-refresh"
+
+    def __init__(
+        self,
+        store: InstrumentSnapshotStore,
+        instrument_ids: Sequence,
+        load_instruments: Callable[[Sequence], list],
+        seeded: Sequence = (),
+        poll_interval_secs: float = 1.0,
+        background: bool = True,
+        config: Optional[ActorConfig] = None,
+    ):
+        super().__init__(config or ActorConfig(component_id="InstrumentRefresher"))
+        self.store = store
+        self.instrument_ids = [str(iid) for iid in instrument_ids]
+        self.seeded = [str(iid) for iid in seeded]
+        self.poll_interval_secs = poll_interval_secs
+        self.background = background
+        self.refreshed = 0
+
+        self._load_instruments = load_instruments
+        self._future: Optional[Future] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def on_start(self):
+        fresh = [
+            instrument for instrument in self.cache.instruments()
+            if str(instrument.id) in self.instrument_ids and str(instrument.id) not in self.seeded
+        ]
+        if fresh:
+            self.store.put(fresh)
+            self.log.info(f"[OK] 已保存 {len(fresh)} 个品种快照")
+
+        if not self.seeded:
+            return
+
+        if not self.background:
+            self._apply(self._load_instruments(self.seeded))
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="instrument-refresh")
+        self._future = self._executor.submit(self._load_instruments, self.seeded)
+        self.clock.set_timer(
+            name=self.TIMER_NAME,
+            interval=timedelta(seconds=self.poll_interval_secs),
+            callback=lambda event: self._poll(),
+        )
+
+    def on_stop(self):
+        self._cancel_timer()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _cancel_timer(self):
+        if self.TIMER_NAME in self.clock.timer_names:
+            self.clock.cancel_timer(self.TIMER_NAME)
+
+    def _poll(self):
+        if self._future is None or not self._future.done():
+            return
+
+        future, self._future = self._future, None
+        self._cancel_timer()
+        try:
+            self._apply(future.result())
+        except Exception as e:
+            self.log.error(f"[ERROR] 品种快照刷新失败（继续使用快照）: {e}")
+
+    def _apply(self, instruments: list):
+        """回到事件循环：更新 Cache 和快照"""
+        for instrument in instruments:
+            cached = self.cache.instrument(instrument.id)
+            if cached is not None and (
+                cached.price_increment != instrument.price_increment
+                or cached.size_increment != instrument.size_increment
+            ):
+                self.log.warning(
+                    f"[WARN] 品种定义已变化: {instrument.id} "
+                    f"tick {cached.price_increment} → {instrument.price_increment}"
+                )
+            self.cache.add_instrument(instrument)
+
+            # 发布到 DataEngine 的品种主题：订阅了该品种的策略在 on_instrument 中重建 tick 网格
+            instrument_id = instrument.id
+            self.msgbus.publish(topic=f"data.instrument.{instrument_id.venue}.{instrument_id.symbol}", msg=instrument)
+
+        self.store.put(instruments)
+        self.refreshed = len(instruments)
+        self.log.info(f"[OK] 已刷新 {len(instruments)} 个品种快照")
@@ -0,0 +1,207 @@
+"""
+每日市场滚动 - bitcoin-up-or-down-on-<date> 市场自动换月（换日）
+
+BTC 每日涨跌市场每天一个 slug，美东 12:00 结算。不再每天手改 slug 重新部署：
+1. RolloverPlan（schedule.py）计算当前和未来几天的 slug，以及每个市场的报价窗口
+2. MarketRollover（Actor）在后台线程提前解析 slug 和加载 Instrument，
+   到时间把下一个市场热加入运行中的策略，临近结算时撤单、平仓并退出旧市场
+
+整个过程不重启进程：私钥、已加载品种、websocket 连接全部保留
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Sequence, Set
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.config import ActorConfig
+from nautilus_trader.model.identifiers import InstrumentId
+
+from .discovery import MarketInfo, lookup_markets
+from .schedule import RolloverPlan
+
+
+class MarketRollover(Actor):
+    """
+    每日市场滚动 Actor
+
+    定时检查（默认每分钟）：
+    1. 未解析的 slug → 后台线程查询 Gamma API（discovery 带缓存）
+    2. Cache 中没有的 Instrument → 后台线程加载，回到事件循环后放入 Cache
+    3. 进入报价窗口的市场 → strategy.add_instrument()
+    4. 进入收尾阶段的市场 → strategy.remove_instrument()（撤单、平仓）
+
+    网络请求都不在事件循环上执行，策略回调不受影响
+
+    Args:
+        strategy: 支持 add_instrument / remove_instrument 的策略
+        plan: 时间表
+        lookup: slugs → (markets, errors)，默认 discovery.lookup_markets
+        load_instruments: [InstrumentId] → [Instrument]（None 表示只使用 Cache 中已有的品种）
+        instrument_id_for: MarketInfo → InstrumentId（默认 Polymarket YES token）
+        check_interval_secs: 检查间隔
+        background: 是否在后台线程执行查询/加载（False 时同步执行，用于回测）
+    """
+
+    TIMER_NAME = "market-rollover"
+
+    def __init__(
+        self,
+        strategy,
+        plan: Optional[RolloverPlan] = None,
+        lookup: Callable = lookup_markets,
+        load_instruments: Optional[Callable] = None,
+        instrument_id_for: Optional[Callable[[MarketInfo], InstrumentId]] = None,
+        check_interval_secs: float = 60.0,
+        background: bool = True,
+        config: Optional[ActorConfig] = None,
+    ):
+        super().__init__(config or ActorConfig(component_id="MarketRollover"))
+        self.strategy = strategy
+        self.plan = plan or RolloverPlan()
+        self.check_interval_secs = check_interval_secs
+        self.background = background
+
+        self._lookup = lookup
+        self._load_instruments = load_instruments
+        self._instrument_id_for = instrument_id_for or _polymarket_instrument_id
+
+        self._markets: Dict[str, MarketInfo] = {}           # slug → 已解析的市场
+        self._expiry: Dict[InstrumentId, datetime] = {}      # 品种 → 结算时间
+        self._retired: Set[InstrumentId] = set()             # 已退出的品种（不再加入）
+        self._pending: Dict[str, Future] = {}                # 后台任务
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def on_start(self):
+        if self.background:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rollover")
+
+        self.check()
+        self.clock.set_timer(
+            name=self.TIMER_NAME,
+            interval=timedelta(seconds=self.check_interval_secs),
+            callback=lambda event: self.check(),
+        )
+
+    def on_stop(self):
+        if self.TIMER_NAME in self.clock.timer_names:
+            self.clock.cancel_timer(self.TIMER_NAME)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # ========== 检查 ==========
+
+    def check(self):
+        """一次滚动检查"""
+        now = self.clock.utc_now()
+        upcoming = self.plan.upcoming(now)
+
+        # 1. 解析 slug
+        unresolved = [m.slug for m in upcoming if m.slug not in self._markets]
+        if unresolved:
+            result = self._run("lookup", self._lookup, unresolved)
+            if result is not None:
+                markets, errors = result
+                self._markets.update(markets)
+                for slug, error in errors.items():
+                    self.log.warning(f"[WARN] 市场暂不可用: {slug} ({error})")
+
+        # 2. 加载品种 + 加入报价
+        missing = []
+        for market in upcoming:
+            info = self._markets.get(market.slug)
+            if info is None:
+                continue
+
+            instrument_id = self._instrument_id_for(info)
+            self._expiry[instrument_id] = market.expiry
+
+            instrument = self.cache.instrument(instrument_id)
+            if instrument is None:
+                missing.append(instrument_id)
+                continue
+
+            if (
+                instrument_id not in self._retired
+                and instrument_id not in self.strategy.trading_instrument_ids()
+                and self.plan.should_quote(now, market.expiry)
+            ):
+                self.log.info(f"[OK] 滚动加入市场: {market.slug} → {instrument_id}")
+                self.strategy.add_instrument(instrument)
+
+        if missing and self._load_instruments is not None:
+            loaded = self._run("load", self._load_instruments, missing)
+            for instrument in loaded or ():
+                self.cache.add_instrument(instrument)
+
+        # 3. 收尾到期市场
+        for instrument_id in list(self.strategy.trading_instrument_ids()):
+            expiry = self._expiry.get(instrument_id)
+            if expiry is not None and self.plan.should_wind_down(now, expiry):
+                self.log.info(f"[OK] 滚动退出市场: {instrument_id}（结算 {expiry:%Y-%m-%d %H:%M} UTC）")
+                self.strategy.remove_instrument(instrument_id)
+                self._retired.add(instrument_id)
+
+    def _run(self, name: str, func: Callable, arg):
+        """
+        执行网络任务
+
+        后台模式下：第一次调用提交任务并返回 None，任务完成后的下一次调用返回结果
+        """
+        if not self.background:
+            return func(arg)
+
+        future = self._pending.get(name)
+        if future is None:
+            self._pending[name] = self._executor.submit(func, arg)
+            return None
+        if not future.done():
+            return None
+
+        del self._pending[name]
+        try:
+            return future.result()
+        except Exception as e:
+            self.log.error(f"[ERROR] 滚动任务失败 ({name}): {e}")
+            return None
+
+
+def _polymarket_instrument_id(market: MarketInfo) -> InstrumentId:
+    from nautilus_trader.adapters.polymarket.common.symbol import get_polymarket_instrument_id
+
+    return get_polymarket_instrument_id(market.condition_id, market.token_id)
+
+
+def polymarket_instrument_loader(private_key: str, signature_type: int = 0) -> Callable:
+    """
+    返回 [InstrumentId] → [Instrument] 的加载函数（在后台线程调用）
+
+    CLOB 客户端、InstrumentProvider 和事件循环在这里创建一次，之后每次滚动 / 刷新都复用
+    （不经过适配器的 lru_cache 工厂函数，不会挤掉数据客户端缓存的实例）；
+    滚动和品种刷新在不同线程调用，加载时持锁串行执行
+    """
+    import asyncio
+    import threading
+
+    from nautilus_trader.adapters.polymarket.factories import get_polymarket_http_client
+    from nautilus_trader.adapters.polymarket.providers import PolymarketInstrumentProvider
+    from nautilus_trader.common.component import LiveClock
+    from nautilus_trader.config import InstrumentProviderConfig
+
+    # __wrapped__：绕过 lru_cache(1)，直接创建客户端
+    client = get_polymarket_http_client.__wrapped__(private_key=private_key, signature_type=signature_type)
+    provider = PolymarketInstrumentProvider(
+        client=client,
+        clock=LiveClock(),
+        config=InstrumentProviderConfig(),
+    )
+    loop = asyncio.new_event_loop()
+    lock = threading.Lock()
+
+    def load(instrument_ids: Sequence[InstrumentId]) -> list:
+        with lock:
+            loop.run_until_complete(provider.load_ids_async(list(instrument_ids)))
+        return [i for i in (provider.find(iid) for iid in instrument_ids) if i is not None]
+
+    return load
@@ -0,0 +1,87 @@
+"""
+每日市场时间表 - slug 与报价窗口的计算
+
+只依赖标准库，启动脚本在导入 NautilusTrader 之前就可以算出当天的市场
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List
+from zoneinfo import ZoneInfo
+
+
+MONTHS = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+
+DEFAULT_SLUG_TEMPLATE = "bitcoin-up-or-down-on-{month}-{day}"
+DEFAULT_EXPIRY_TIME = time(12, 0)
+DEFAULT_TIMEZONE = "America/New_York"
+
+
+def daily_slug(day: date, template: str = DEFAULT_SLUG_TEMPLATE) -> str:
+    """日期 → slug（例如 2026-01-28 → bitcoin-up-or-down-on-january-28）"""
+    return template.format(month=MONTHS[day.month - 1], day=day.day, year=day.year)
+
+
+@dataclass(frozen=True)
+class DailyMarket:
+    """一个每日市场"""
+
+    day: date
+    slug: str
+    expiry: datetime        # 结算时间（UTC）
+
+
+class RolloverPlan:
+    """
+    每日市场的时间表
+
+    市场在 [结算 - quote_window, 结算 - wind_down) 内报价；
+    quote_window 比 24 小时略长，新旧市场有一段重叠，换日时不会出现空档
+
+    Args:
+        days_ahead: 提前解析几天后的市场
+        quote_window: 结算前多久开始报价
+        wind_down: 结算前多久停止报价并平仓
+        template: slug 模板（{month} {day} {year}）
+        expiry_time: 结算时刻（tz 时区）
+        tz: 结算时区
+    """
+
+    def __init__(
+        self,
+        days_ahead: int = 1,
+        quote_window: timedelta = timedelta(hours=25),
+        wind_down: timedelta = timedelta(minutes=30),
+        template: str = DEFAULT_SLUG_TEMPLATE,
+        expiry_time: time = DEFAULT_EXPIRY_TIME,
+        tz: str = DEFAULT_TIMEZONE,
+    ):
+        self.days_ahead = days_ahead
+        self.quote_window = quote_window
+        self.wind_down = wind_down
+        self.template = template
+        self.expiry_time = expiry_time
+        self.tz = ZoneInfo(tz)
+
+    def market(self, day: date) -> DailyMarket:
+        expiry = datetime.combine(day, self.expiry_time, tzinfo=self.tz).astimezone(timezone.utc)
+        return DailyMarket(day=day, slug=daily_slug(day, self.template), expiry=expiry)
+
+    def upcoming(self, now: datetime) -> List[DailyMarket]:
+        """尚未进入收尾阶段的市场（当前 + 未来 days_ahead 天）"""
+        today = now.astimezone(self.tz).date()
+        markets = [self.market(today + timedelta(days=n)) for n in range(self.days_ahead + 2)]
+        return [m for m in markets if now < m.expiry - self.wind_down][: self.days_ahead + 1]
+
+    def current(self, now: datetime) -> DailyMarket:
+        """当前应该报价的最早市场"""
+        return self.upcoming(now)[0]
+
+    def should_quote(self, now: datetime, expiry: datetime) -> bool:
+        return expiry - self.quote_window <= now < expiry - self.wind_down
+
+    def should_wind_down(self, now: datetime, expiry: datetime) -> bool:
+        return now >= expiry - self.wind_down
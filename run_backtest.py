@@ -0,0 +1,122 @@
+"""
+做市策略 - 离线回测
+
+回放本地 ParquetDataCatalog 中录制的 Polymarket 订单簿增量和成交，
+策略与实盘完全相同，不访问网络
+
+--recordings 回放 MarketDataRecorder 的录制目录（memmap 分块流式读取，
+内存不随数据量增长），品种定义仍从 --catalog 读取
+
+运行方法：
+    python run_backtest.py --catalog data/catalog
+    python run_backtest.py --catalog data/catalog --instrument <ID> --set base_spread=0.03 --latency-ms 50
+    python run_backtest.py --catalog data/catalog --speed 60      # 60 倍实时回放
+    python run_backtest.py --catalog data/catalog --recordings data/recordings --start 2026-01-01
+"""
+
+import argparse
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+# 添加项目根目录到路径
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from config.profiles import ConfigError
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="MarketMakingStrategy 离线回测")
+    parser.add_argument("--catalog", required=True, help="ParquetDataCatalog 目录")
+    parser.add_argument("--recordings", help="录制目录（流式回放，品种定义取自 --catalog）")
+    parser.add_argument("--instrument", action="append", help="品种 ID（可多次指定，默认全部）")
+    parser.add_argument("--start", help="开始时间（ISO 8601）")
+    parser.add_argument("--end", help="结束时间（ISO 8601）")
+    parser.add_argument("--balance", type=Decimal, default=Decimal("1000"), help="期初资金")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="模拟交易所延迟（毫秒）")
+    parser.add_argument("--speed", type=float, default=0.0, help="回放速度（N 倍实时，0 为尽可能快）")
+    parser.add_argument("--log-level", default="ERROR", help="引擎日志级别")
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="覆盖策略参数，例如 --set base_spread=0.03",
+    )
+    return parser.parse_args(argv)
+
+
+def parse_overrides(items):
+    """NAME=VALUE 列表 → 参数字典（数值自动转换）"""
+    overrides = {}
+    for item in items:
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise ConfigError(f"参数格式应为 NAME=VALUE: {item}")
+
+        lowered = value.lower()
+        if lowered in ("true", "false"):
+            overrides[name] = lowered == "true"
+        elif value.lstrip("-").isdigit():
+            overrides[name] = int(value)
+        else:
+            overrides[name] = value
+
+    return overrides
+
+
+def load_data(args):
+    """按 --catalog / --recordings 读取品种和行情"""
+    from backtest.harness import load_catalog, load_instruments
+    from backtest.reader import RecordingReader
+
+    if args.recordings:
+        print(f"[INFO] 读取录制目录: {args.recordings}")
+        data = RecordingReader.from_directory(
+            args.recordings,
+            args.instrument,
+            start=args.start[:10] if args.start else None,
+            end=args.end[:10] if args.end else None,
+        )
+        instruments = load_instruments(args.catalog, data.instrument_ids)
+        print(f"[OK] {len(instruments)} 个品种, {len(data.paths)} 个文件, {len(data)} 条记录")
+    else:
+        print(f"[INFO] 读取 catalog: {args.catalog}")
+        instruments, data = load_catalog(args.catalog, args.instrument, args.start, args.end)
+        print(f"[OK] {len(instruments)} 个品种, {len(data)} 条数据")
+
+    return instruments, data
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    from backtest.replay import run_replay
+    from config.strategy_config import MarketMakingConfig, with_overrides
+
+    instruments, data = load_data(args)
+
+    config = with_overrides(
+        MarketMakingConfig(
+            instrument_ids=tuple(str(instrument.id) for instrument in instruments),
+            telemetry_level=args.log_level,     # 与引擎日志级别一致
+        ),
+        **parse_overrides(args.set),
+    )
+
+    result = run_replay(
+        instruments,
+        data,
+        config,
+        speed=args.speed,
+        starting_balance=args.balance,
+        latency_ms=args.latency_ms,
+        log_level=args.log_level,
+    )
+    print(result.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
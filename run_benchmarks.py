@@ -0,0 +1,113 @@
+"""
+做市策略 - 微基准
+
+合成订单簿上计时 _calculate_* / _check_risk 和完整 on_order_book 路径，
+与 diagnostics/baselines/strategy_bench.json 比较，变慢超过阈值时返回 1
+
+运行方法：
+    python run_benchmarks.py
+    python run_benchmarks.py --threshold 0.5 --case on_order_book --case check_risk
+    python run_benchmarks.py --save            # 优化合入后更新基线
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# 添加项目根目录到路径
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from diagnostics.bench import (
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_MIN_TIME,
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    compare,
+    format_report,
+    load_baseline,
+    machine_mismatch,
+    save_baseline,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="MarketMakingStrategy 微基准")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH), help="基线 JSON")
+    parser.add_argument("--save", action="store_true", help="把本次结果写为新基线")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"允许的变慢比例（默认 {DEFAULT_THRESHOLD}）",
+    )
+    parser.add_argument("--case", action="append", help="只运行指定用例（可多次指定）")
+    parser.add_argument("--updates", type=int, default=2000, help="回放的订单簿更新次数")
+    parser.add_argument("--levels", type=int, default=30, help="每边档位数")
+    parser.add_argument("--seed", type=int, default=7, help="合成数据种子")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="每个用例的轮数")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="每轮最短秒数")
+    parser.add_argument("--retries", type=int, default=1, help="回归用例重新测量的次数（取较快的一次）")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    from diagnostics.strategy_bench import CASES, run_strategy_bench
+
+    unknown = set(args.case or ()) - set(CASES)
+    if unknown:
+        print(f"[ERROR] 未知用例: {sorted(unknown)}（可选: {', '.join(CASES)}）")
+        return 2
+
+    def run(cases):
+        return run_strategy_bench(
+            updates=args.updates,
+            levels=args.levels,
+            seed=args.seed,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            cases=cases,
+        )
+
+    results = run(args.case)
+    baseline = None if args.save else load_baseline(args.baseline)
+    comparisons = compare(results, baseline, threshold=args.threshold)
+
+    # 共享机器上偶发的抖动：只重测超过阈值的用例，取较快的结果
+    for _ in range(args.retries):
+        regressed = [row.name for row in comparisons if row.regressed]
+        if not regressed:
+            break
+        for name, timing in run(regressed).items():
+            if timing.value_ns < results[name].value_ns:
+                results[name] = timing
+        comparisons = compare(results, baseline, threshold=args.threshold)
+
+    print(format_report(results, comparisons))
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"[OK] 基线已写入 {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"[WARN] 没有基线 {args.baseline}，使用 --save 生成")
+        return 0
+
+    mismatch = machine_mismatch(baseline)
+    if mismatch:
+        print(f"[WARN] 基线来自不同的环境（{', '.join(mismatch)}），比较结果仅供参考")
+
+    regressions = [row.name for row in comparisons if row.regressed]
+    if regressions:
+        print(f"[X] 性能回归（> +{args.threshold:.0%}）: {', '.join(regressions)}")
+        return 1
+
+    print("[OK] 没有性能回归")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,178 +1,406 @@
 """
-做市策略运行脚本
-
-使用方法：
-1. 模拟模式：python run_market_making.py --mode paper
-2. 双轨模式：python run_market_making.py --mode both
-3. 真实交易：python run_market_making.py --mode portfolio
+做市策略 - 统一入口
+
+档位（config/profiles.py）：
+    safe      小资金实盘（5-10 USDC，日亏损 1 USDC 即停止）
+    standard  标准实盘（20+ USDC）
+    paper     标准参数 + 本地模拟交易所，回放录制行情
+    backtest  策略默认参数 + BacktestEngine 回放
+
+运行方法：
+    python run_market_making.py                                       # safe，当天每日市场
+    python run_market_making.py --profile standard --market <slug> --market <slug>
+    python run_market_making.py --config my_config.toml --set base_spread=0.04
+    python run_market_making.py --profile standard --check            # 只校验并打印配置
+    python run_market_making.py --profile standard --dry-run          # 再解析市场，不启动节点
+    python run_market_making.py --profile paper --catalog data/catalog --recordings data/recordings
+    python run_market_making.py --profile backtest --catalog data/catalog --speed 60
+
+未指定 --market 时按日期选择当天的 Bitcoin up or down 每日市场，并自动滚动到下一天。
+NautilusTrader 只在真正启动节点或回测时导入：--help、--check、--dry-run 不付出适配器的导入开销
+
+设置环境变量 POLYMARKET_RECORD_DIR 时，实盘同时把收到的行情录制到该目录（可用于回测）
+
+启动剖析（diagnostics/boot.py）：
+    python run_market_making.py --boot-profile data/boot.json              # 各阶段耗时，第一笔报价被确认时输出
+    python run_market_making.py --boot-profile --importtime                # 附带模块导入耗时
 """
 
+import argparse
 import os
-import asyncio
-from datetime import datetime
-
-from nautilus_trader.config import TradingNodeConfig
-from nautilus_trader.config import LoggingConfig
-from nautilus_trader.config import LiveExecClientConfig
-from nautilus_trader.config import LiveDataClientConfig
-from nautilus_trader.live.node import TradingNode
-
-from strategies.market_making_strategy import MarketMakingStrategy
-from config.risk_config import get_moderate_config
-
-
-# ========== 配置参数 ==========
-
-INSTRUMENT_ID = "POLY-BTC-USD.POLYMARKET"  # 示例品种 ID
-PRIVATE_KEY = os.getenv("POLYMARKET_PK")
-SIGNATURE_TYPE = 0  # 0=EOA, 1=Email Proxy, 2=Browser Proxy
-
-# 做市策略配置
-MM_CONFIG = {
-    # 价差参数
-    'base_spread': 0.02,      # 2% 基础价差
-    'min_spread': 0.005,      # 0.5% 最小价差
-    'max_spread': 0.10,       # 10% 最大价差
-
-    # 订单参数
-    'order_size': 20,         # 每单 20 个
-    'min_order_size': 5,
-    'max_order_size': 50,
-
-    # 库存参数
-    'target_inventory': 0,    # 目标库存（中性）
-    'max_inventory': 200,     # 最大库存
-    'inventory_skew_factor': 0.0001,
-    'max_skew': 0.02,         # 2% 最大倾斜
-    'hedge_threshold': 80,    # 对冲阈值
-    'hedge_size': 20,         # 对冲大小
-
-    # 价格参数
-    'min_price': 0.05,        # 5%
-    'max_price': 0.95,        # 95%
-
-    # 波动率参数
-    'max_volatility': 0.15,   # 15%
-    'volatility_window': 100, # 100 tick
-
-    # 资金参数
-    'max_position_ratio': 0.5,    # 50%
-    'max_daily_loss': -100.0,     # -100 USDC
-
-    # 行为参数
-    'update_interval_ms': 1000,       # 1 秒更新
-    'use_inventory_skew': True,       # 使用库存倾斜
-    'use_dynamic_spread': True,       # 使用动态价差
-}
-
-
-def get_strategy_config():
-    """获取策略配置"""
-    from dataclasses import dataclass
-
-    @dataclass
-    class MarketMakingStrategyConfig:
-        instrument_id: str
-        max_positions: int = 1
-        min_free_balance: float = 10.0
-        # ... 其他参数从 MM_CONFIG 读取
-
-    config = MarketMakingStrategyConfig(
-        instrument_id=INSTRUMENT_ID,
-        **MM_CONFIG
+import sys
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+# 添加项目根目录到路径
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from diagnostics.boot import BootProfiler, ImportTimer, boot_marker
+
+# 尽早创建：interpreter 阶段覆盖进程启动到这里
+BOOT = BootProfiler()
+
+from config.profiles import PROFILES, ConfigError, resolve
+from run_backtest import parse_overrides
+
+
+def load_env():
+    """加载 .env 文件到环境变量（已设置的环境变量优先，例如 Zeabur）"""
+    env_file = project_root / ".env"
+    if env_file.exists():
+        with open(env_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#') and '=' in line:
+                    key, value = line.split('=', 1)
+                    os.environ.setdefault(key.strip(), value.strip())
+    return os.getenv("POLYMARKET_PK")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Polymarket 做市策略")
+    parser.add_argument("--profile", choices=sorted(PROFILES), help="预设档位（默认取配置文件中的 profile，再缺省为 safe）")
+    parser.add_argument("--config", help="TOML / JSON 配置文件")
+    parser.add_argument("--market", action="append", default=[], metavar="SLUG", help="市场 slug（可多次指定）")
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="覆盖策略参数，例如 --set base_spread=0.03",
+    )
+    parser.add_argument("--check", action="store_true", help="只校验并打印配置")
+    parser.add_argument("--dry-run", action="store_true", help="校验配置、解析市场 / 数据，不启动")
+    parser.add_argument(
+        "--boot-profile",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="输出启动各阶段耗时（可选写入 JSON）",
     )
+    parser.add_argument("--importtime", action="store_true", help="启动剖析中附带模块导入耗时")
 
-    return config
+    offline = parser.add_argument_group("paper / backtest")
+    offline.add_argument("--catalog", help="ParquetDataCatalog 目录")
+    offline.add_argument("--recordings", help="录制目录（流式回放，品种定义取自 --catalog）")
+    offline.add_argument("--instrument", action="append", help="品种 ID（可多次指定，默认全部）")
+    offline.add_argument("--start", help="开始时间（ISO 8601）")
+    offline.add_argument("--end", help="结束时间（ISO 8601）")
+    offline.add_argument("--balance", type=Decimal, default=Decimal("1000"), help="期初资金")
+    offline.add_argument("--latency-ms", type=float, default=0.0, help="模拟交易所延迟（毫秒）")
+    offline.add_argument("--speed", type=float, default=0.0, help="回放速度（backtest，N 倍实时，0 为尽可能快）")
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv=None):
     """主函数"""
+    args = parse_args(argv)
+
+    profiling = args.boot_profile is not None or args.importtime
+    if args.importtime:
+        BOOT.imports = ImportTimer().install()
+
+    try:
+        return _main(args, profiling)
+    finally:
+        if profiling:
+            print("\n" + "=" * 80)
+            BOOT.finish(args.boot_profile)
+
+
+def _main(args, profiling: bool):
+    try:
+        with BOOT.phase("config"):
+            profile = resolve(args.profile, args.config, parse_overrides(args.set), args.market)
+    except ConfigError as e:
+        print(f"[ERROR] {e}")
+        return 2
+
     print("=" * 80)
     print("Polymarket 做市策略")
     print("=" * 80)
-    print(f"开始时间: {datetime.utcnow()}")
-    print(f"品种ID: {INSTRUMENT_ID}")
-    print(f"基础价差: {MM_CONFIG['base_spread']*100:.1f}%")
-    print(f"订单大小: {MM_CONFIG['order_size']}个")
-    print(f"最大库存: {MM_CONFIG['max_inventory']}个")
+    print(profile.describe())
     print("=" * 80)
-    print()
 
-    # 检查环境变量
-    if not PRIVATE_KEY:
-        raise ValueError("POLYMARKET_PK 环境变量未设置")
+    if args.check:
+        print("[OK] 配置有效")
+        return 0
 
-    # 获取策略配置
-    strategy_config = get_strategy_config()
+    if profile.live:
+        ready = (lambda: BOOT.finish(args.boot_profile)) if profiling else None
+        return run_live(profile, dry_run=args.dry_run, on_ready=ready)
+    return run_offline(profile, args)
 
-    # 获取风险配置
-    risk_configs = get_moderate_config(
-        instrument_id=strategy_config.instrument_id
-    )
 
-    # 创建日志配置
-    logging_config = LoggingConfig(
-        log_level="INFO",
-        log_colors=True,
-    )
+# ========== 实盘 ==========
+
+def resolve_markets(profile):
+    """
+    解析要报价的市场
+
+    Returns:
+        (markets, plan)：slug → MarketInfo；未指定市场时 plan 为每日滚动时间表，否则为 None
+    """
+    from markets.discovery import lookup_markets
+    from markets.schedule import RolloverPlan
+
+    plan = None
+    slugs = list(profile.markets)
+    if not slugs:
+        plan = RolloverPlan()
+        slugs = [market.slug for market in plan.upcoming(datetime.now(timezone.utc))]
+
+    print(f"\n[INFO] 正在获取 {len(slugs)} 个市场信息...")
+    markets, errors = lookup_markets(slugs)
+    for slug in slugs:
+        if slug in errors:
+            print(f"[WARN] 跳过市场 {slug}: {errors[slug]}")
+        else:
+            print(f"[OK] {slug}: {markets[slug].question}")
+
+    return markets, plan
+
+
+def run_live(profile, dry_run: bool = False, on_ready=None):
+    """
+    启动实盘节点
+
+    Args:
+        on_ready: 第一笔报价被交易所确认后调用（启动剖析输出报告）
+    """
+    # 加载环境变量
+    with BOOT.phase("env"):
+        private_key = load_env()
+    if not private_key:
+        print("[ERROR] 未找到私钥！请在 .env 文件中配置 POLYMARKET_PK")
+        return 1
+
+    print(f"\n[OK] 私钥已加载: {private_key[:10]}...{private_key[-6:]}")
+
+    with BOOT.phase("market_lookup"):
+        markets, plan = resolve_markets(profile)
+    if not markets:
+        print("\n[ERROR] 没有可用的市场")
+        return 1
+
+    if dry_run:
+        print("\n[OK] dry-run 完成，未启动 TradingNode")
+        return 0
 
-    # 创建数据客户端配置
+    # 导入 NautilusTrader 模块
+    try:
+        with BOOT.phase("nautilus_imports"):
+            from nautilus_trader.adapters.polymarket import POLYMARKET
+            from nautilus_trader.adapters.polymarket import PolymarketDataClientConfig
+            from nautilus_trader.adapters.polymarket import PolymarketExecClientConfig
+            from nautilus_trader.adapters.polymarket import PolymarketLiveDataClientFactory
+            from nautilus_trader.adapters.polymarket import PolymarketLiveExecClientFactory
+            from nautilus_trader.adapters.polymarket.common.symbol import get_polymarket_instrument_id
+            from nautilus_trader.config import InstrumentProviderConfig
+            from nautilus_trader.config import LoggingConfig, TradingNodeConfig
+            from nautilus_trader.live.node import TradingNode
+            from nautilus_trader.model.identifiers import TraderId, Venue
+            from markets.instruments import InstrumentRefresher, InstrumentSnapshotStore
+            from markets.rollover import polymarket_instrument_loader
+            from strategies.market_making_strategy import MarketMakingStrategy
+    except ImportError as e:
+        print(f"\n[ERROR] 导入失败: {e}")
+        return 1
+
+    load_ids = [
+        str(get_polymarket_instrument_id(market.condition_id, market.token_id))
+        for market in markets.values()
+    ]
+
+    # 每日滚动：只从当前市场开始报价，之后的市场预加载，由 MarketRollover 到时加入
+    instrument_ids = load_ids
+    if plan is not None:
+        current = plan.current(datetime.now(timezone.utc)).slug
+        instrument_ids = [iid for slug, iid in zip(markets, load_ids) if slug == current] or load_ids[:1]
+
+    config = profile.strategy_config(instrument_ids)
+
+    # 有本地快照的品种不再由 data client 加载，build 之后直接放入 Cache，启动后后台刷新
+    store = InstrumentSnapshotStore()
+    seeded, missing = store.get_many(load_ids)
+    load_instruments = polymarket_instrument_loader(private_key, profile.signature_type)
+    print(f"\n[OK] 品种定义: {len(seeded)} 个来自本地快照，{len(missing)} 个从交易所加载")
+
+    print("\n" + "=" * 80)
+    print(f"策略配置（{profile.name}，{len(instrument_ids)} 个市场）")
+    print("=" * 80)
+    for instrument_id in instrument_ids:
+        print(f"  {instrument_id}")
+    print(f"  订单大小: {config.order_size} 个")
+    print(f"  每市场最大库存: {config.max_inventory} 个")
+    print(f"  基础价差: {config.base_spread*100:.1f}%")
+    print(f"  日亏损限制: {config.max_daily_loss} USDC")
+    print("=" * 80)
+
+    # 一个数据客户端加载所有品种
     data_client_config = PolymarketDataClientConfig(
-        private_key=PRIVATE_KEY,
-        signature_type=SIGNATURE_TYPE,
-        # ... 其他参数
+        private_key=private_key,
+        signature_type=profile.signature_type,
+        instrument_provider=InstrumentProviderConfig(
+            load_ids=frozenset(missing) if missing else None
+        ),
     )
 
-    # 创建执行客户端配置
     exec_client_config = PolymarketExecClientConfig(
-        private_key=PRIVATE_KEY,
-        signature_type=SIGNATURE_TYPE,
-        # ... 其他参数
+        private_key=private_key,
+        signature_type=profile.signature_type,
     )
 
-    # 创建节点配置
     node_config = TradingNodeConfig(
-        data_clients=[data_client_config],
-        exec_clients=[exec_client_config],
-        risk_engine_config=risk_configs['risk_engine'],
-        logging_config=logging_config,
+        trader_id=TraderId(profile.trader_id),
+        data_clients={
+            POLYMARKET: data_client_config,
+        },
+        exec_clients={
+            POLYMARKET: exec_client_config,
+        },
+        logging=LoggingConfig(
+            log_level=profile.log_level,
+            log_colors=True,
+        ),
     )
 
-    # 创建交易节点
-    node = TradingNode(config=node_config)
-
-    # 添加策略
-    strategy = MarketMakingStrategy(config=strategy_config)
-    node.add_strategy(strategy)
+    print("\n[INFO] 正在创建 TradingNode...")
 
-    # 启动节点
+    node = None
     try:
-        node.start()
-
-        print("\n✅ 策略已启动")
-        print("按 Ctrl+C 停止\n")
+        with BOOT.phase("node_create"):
+            node = TradingNode(config=node_config)
+            strategy = MarketMakingStrategy(config)
+            node.trader.add_strategy(strategy)
+
+        # 启动剖析：事件循环内的里程碑（连接 + 加载品种 → 第一笔行情 → 第一笔报价 → 确认）
+        if on_ready is not None:
+            node.trader.add_actor(boot_marker(BOOT, on_ready))
+
+        if plan is not None:
+            from markets.rollover import MarketRollover
+
+            node.trader.add_actor(MarketRollover(
+                strategy,
+                plan,
+                load_instruments=store.loader(load_instruments),
+            ))
+
+        node.trader.add_actor(InstrumentRefresher(
+            store,
+            load_ids,
+            load_instruments,
+            seeded=[instrument.id for instrument in seeded],
+        ))
+
+        record_dir = os.getenv("POLYMARKET_RECORD_DIR")
+        if record_dir:
+            from backtest.recorder import MarketDataRecorder
+            node.trader.add_actor(MarketDataRecorder(record_dir, load_ids))
+            print(f"[OK] 行情录制目录: {record_dir}")
+
+        node.add_data_client_factory(POLYMARKET, PolymarketLiveDataClientFactory)
+        node.add_exec_client_factory(POLYMARKET, PolymarketLiveExecClientFactory)
+        with BOOT.phase("node_build"):
+            node.build()
+
+        for instrument in seeded:
+            node.cache.add_instrument(instrument)
+
+        print("[OK] TradingNode 创建成功")
+        print()
+        print("[WARN] 这是真实交易模式！")
+        print("[WARN] 建议监控 1-2 小时，观察策略表现")
+        print("[WARN] 按 Ctrl+C 停止")
+        print("=" * 80)
 
-        # 运行直到用户中断
-        asyncio.get_event_loop().run_forever()
+        node.run()
 
     except KeyboardInterrupt:
-        print("\n\n⏹️  正在停止策略...")
-        node.stop()
-        print("✅ 策略已停止")
+        print("\n\n[INFO] 正在停止策略...")
+        node.dispose()
+        print("[OK] 策略已停止")
 
-        # 打印最终统计
+        # 打印统计
         print("\n" + "=" * 80)
         print("最终统计")
         print("=" * 80)
 
-        account = node.portfolio.account_for_venue("POLYMARKET")
+        account = node.portfolio.account_for_venue(Venue("POLYMARKET"))
         if account:
             print(f"总盈亏: {account.realized_pnl() + account.unrealized_pnl()}")
             print(f"已实现盈亏: {account.realized_pnl()}")
             print(f"未实现盈亏: {account.unrealized_pnl()}")
 
         print("=" * 80)
+        return 0
+
+    except Exception as e:
+        print(f"\n[ERROR] 启动失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+# ========== Paper / 回测 ==========
+
+def run_offline(profile, args):
+    if not args.catalog:
+        print(f"[ERROR] {profile.name} 档位需要 --catalog")
+        return 2
+
+    for path in (args.catalog, args.recordings):
+        if path and not Path(path).exists():
+            print(f"[ERROR] 目录不存在: {path}")
+            return 2
+
+    if args.dry_run:
+        print("\n[OK] dry-run 完成，未运行回放")
+        return 0
+
+    from run_backtest import load_data
+
+    with BOOT.phase("load_data"):
+        instruments, data = load_data(args)
+        config = profile.strategy_config([instrument.id for instrument in instruments])
+
+    with BOOT.phase("run"):
+        if profile.mode == "paper":
+            from backtest.paper import run_paper_trading
+
+            result = run_paper_trading(
+                instruments,
+                data,
+                config,
+                starting_balance=args.balance,
+                latency_ms=args.latency_ms,
+                log_level=profile.log_level,
+            )
+        else:
+            from backtest.replay import run_replay
+
+            result = run_replay(
+                instruments,
+                data,
+                config,
+                speed=args.speed,
+                starting_balance=args.balance,
+                latency_ms=args.latency_ms,
+                log_level=profile.log_level,
+            )
+
+    print(result.summary())
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n已停止")
+        sys.exit(0)
@@ -1,173 +1,26 @@
 """
-做市策略 - 完整可运行版本
-连接到 Polymarket 进行真实交易
+做市策略 - 标准实盘
+
+等价于 python run_market_making.py --profile standard
+参数与统一入口相同（--config / --set / --check / --dry-run ...）
 
 运行方法：
     python run_market_making_live.py
 """
 
-import os
 import sys
 from pathlib import Path
-from decimal import Decimal
 
 # 添加项目根目录到路径
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# 从 .env 加载环境变量
-def load_env():
-    """加载 .env 文件到环境变量"""
-    env_file = project_root / ".env"
-    if env_file.exists():
-        with open(env_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
-    return os.getenv("POLYMARKET_PK")
-
-def main():
-    """主函数"""
-    print("=" * 80)
-    print("Polymarket 做市策略 - 实盘交易")
-    print("=" * 80)
-
-    # 加载环境变量
-    private_key = load_env()
-    if not private_key:
-        print("[ERROR] 未找到私钥！请在 .env 文件中配置 POLYMARKET_PK")
-        return 1
-
-    print(f"\n[OK] 私钥已加载: {private_key[:10]}...{private_key[-6:]}")
-
-    # 导入必要模块
-    try:
-        from nautilus_trader.live.node import TradingNode
-        from nautilus_trader.config import LoggingConfig, StrategyConfig
-        from nautilus_trader.adapters.polymarket import (
-            PolymarketDataClientConfig,
-            PolymarketExecClientConfig,
-        )
-        from nautilus_trader.model.identifiers import Venue
-        from strategies.market_making_strategy import MarketMakingStrategy
-    except ImportError as e:
-        print(f"\n[ERROR] 导入失败: {e}")
-        return 1
-
-    # 创建策略配置
-    class MarketMakingLiveConfig(StrategyConfig, frozen=True):
-        instrument_id: str
-        base_spread: Decimal
-        min_spread: Decimal
-        max_spread: Decimal
-        order_size: int
-        min_order_size: int
-        max_order_size: int
-        target_inventory: int
-        max_inventory: int
-        inventory_skew_factor: Decimal
-        max_skew: Decimal
-        hedge_threshold: int
-        hedge_size: int
-        min_price: Decimal
-        max_price: Decimal
-        max_volatility: Decimal
-        volatility_window: int
-        max_position_ratio: Decimal
-        max_daily_loss: Decimal
-        update_interval_ms: int
-        use_inventory_skew: bool
-        use_dynamic_spread: bool
-
-    # 小资金安全配置
-    config = MarketMakingLiveConfig(
-        instrument_id="POLY-BTC-USD.POLYMARKET",
-        base_spread=Decimal("0.03"),      # 3% 价差
-        min_spread=Decimal("0.01"),
-        max_spread=Decimal("0.15"),
-        order_size=2,                    # 每单 2 个
-        min_order_size=1,
-        max_order_size=5,
-        target_inventory=0,
-        max_inventory=20,                # 最大库存 20 个
-        inventory_skew_factor=Decimal("0.0002"),
-        max_skew=Decimal("0.03"),
-        hedge_threshold=10,
-        hedge_size=5,
-        min_price=Decimal("0.05"),
-        max_price=Decimal("0.95"),
-        max_volatility=Decimal("0.10"),
-        volatility_window=50,
-        max_position_ratio=Decimal("0.3"),
-        max_daily_loss=Decimal("-20.0"),
-        update_interval_ms=2000,
-        use_inventory_skew=True,
-        use_dynamic_spread=True,
-    )
-
-    print("\n" + "=" * 80)
-    print("策略配置")
-    print("=" * 80)
-    print(f"  订单大小: {config.order_size} 个")
-    print(f"  最大库存: {config.max_inventory} 个")
-    print(f"  基础价差: {config.base_spread*100:.1f}%")
-    print(f"  日亏损限制: {config.max_daily_loss} USDC")
-    print("=" * 80)
-
-    # 创建数据客户端配置
-    data_client_config = PolymarketDataClientConfig(
-        private_key=private_key,
-        signature_type=0,
-        instrument_provider=None,  # 使用默认
-    )
-
-    # 创建执行客户端配置
-    exec_client_config = PolymarketExecClientConfig(
-        private_key=private_key,
-        signature_type=0,
-    )
-
-    # 创建日志配置
-    logging_config = LoggingConfig(
-        log_level="INFO",
-        log_colors=True,
-    )
-
-    print("\n[INFO] 正在创建 TradingNode...")
-
-    # 注意：这里需要完整的 NautilusTrader 配置
-    # 由于配置较复杂，这里先显示配置信息
-    print("\n" + "=" * 80)
-    print("配置完成")
-    print("=" * 80)
-    print("数据客户端: Polymarket")
-    print("执行客户端: Polymarket")
-    print("模式: 真实交易")
-    print("=" * 80)
-
-    print("\n[WARN] 完整的 TradingNode 配置较复杂")
-    print("[WARN] 建议：先使用 poly-sdk-trader 的基础设施进行测试")
-    print("[WARN] 或者等待我创建完整的 NautilusTrader 集成")
-
-    print("\n当前状态：")
-    print("  [OK] 私钥已配置")
-    print("  [OK] 策略已创建")
-    print("  [OK] 配置已准备")
-    print("  [INFO] 等待完整实现")
-
-    return 0
+from run_market_making import main
 
 
 if __name__ == "__main__":
     try:
-        sys.exit(main())
+        sys.exit(main(["--profile", "standard", *sys.argv[1:]]))
     except KeyboardInterrupt:
         print("\n\n已停止")
         sys.exit(0)
-    except Exception as e:
-        print(f"\n[ERROR] {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
@@ -0,0 +1,37 @@
+"""
+做市策略 - 多市场模式
+一个 TradingNode、一组数据/执行客户端，同时为多个 Polymarket 市场报价
+
+等价于 python run_market_making.py --profile standard --market <slug> --market <slug> ...
+
+运行方法：
+    python run_market_making_multi.py bitcoin-up-or-down-on-january-28 bitcoin-up-or-down-on-january-29
+
+每个品种的价格历史、挂单、重报调度放在策略内的独立槽位（MarketSlot），
+库存按品种由 Cache/Portfolio 跟踪；相比每个市场一个进程，
+只建立一条行情/执行连接，内存和 websocket 数量不随市场数线性增长
+
+设置环境变量 POLYMARKET_RECORD_DIR 时，同时把收到的行情录制到该目录（可用于回测）
+"""
+
+import sys
+from pathlib import Path
+
+# 添加项目根目录到路径
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from run_market_making import main
+
+
+if __name__ == "__main__":
+    slugs = sys.argv[1:]
+    if not slugs:
+        print("[ERROR] 请至少指定一个市场 slug")
+        print("用法: python run_market_making_multi.py <slug> [<slug> ...]")
+        sys.exit(1)
+    try:
+        sys.exit(main(["--profile", "standard", *(f"--market={slug}" for slug in slugs)]))
+    except KeyboardInterrupt:
+        print("\n\n已停止")
+        sys.exit(0)
@@ -0,0 +1,131 @@
+"""
+做市策略 - 参数扫描
+
+行情只读取一次，按网格或随机搜索把回测分发到所有 CPU 核，
+结果按指定指标排序输出
+
+运行方法：
+    python run_sweep.py --catalog data/catalog --grid base_spread=0.01,0.02,0.03 --grid order_size=5,10
+    python run_sweep.py --catalog data/catalog --range base_spread=0.005:0.05 --range hedge_threshold=20:120 --samples 64
+    python run_sweep.py --catalog data/catalog --grid base_spread=0.01,0.02 --sort max_drawdown --csv sweep.csv
+    python run_sweep.py --catalog data/catalog --recordings data/recordings --grid order_size=5,10
+"""
+
+import argparse
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+# 添加项目根目录到路径
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from run_backtest import load_data, parse_overrides
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="MarketMakingStrategy 参数扫描")
+    parser.add_argument("--catalog", required=True, help="ParquetDataCatalog 目录")
+    parser.add_argument("--recordings", help="录制目录（worker 直接 memmap，品种定义取自 --catalog）")
+    parser.add_argument("--instrument", action="append", help="品种 ID（可多次指定，默认全部）")
+    parser.add_argument("--start", help="开始时间（ISO 8601）")
+    parser.add_argument("--end", help="结束时间（ISO 8601）")
+    parser.add_argument("--balance", type=Decimal, default=Decimal("1000"), help="期初资金")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="模拟交易所延迟（毫秒）")
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="网格搜索的参数取值",
+    )
+    parser.add_argument(
+        "--range",
+        action="append",
+        default=[],
+        metavar="NAME=LOW:HIGH",
+        help="随机搜索的参数区间（配合 --samples）",
+    )
+    parser.add_argument("--samples", type=int, default=32, help="随机搜索的组合数")
+    parser.add_argument("--seed", type=int, default=0, help="随机搜索种子")
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="所有组合共用的固定参数",
+    )
+    parser.add_argument("--workers", type=int, help="进程数（默认 CPU 核数）")
+    parser.add_argument("--sort", default="pnl", help="排序指标（pnl / fill_rate / max_drawdown / turnover）")
+    parser.add_argument("--top", type=int, help="只显示前 N 行")
+    parser.add_argument("--csv", help="把完整结果写入 CSV")
+    return parser.parse_args(argv)
+
+
+def parse_space(grid_items, range_items):
+    """--grid / --range → 参数空间（网格为列表，区间为 (low, high) 元组）"""
+    space = {}
+
+    for item in grid_items:
+        name, sep, values = item.partition("=")
+        if not sep:
+            raise ValueError(f"参数格式应为 NAME=V1,V2,...: {item}")
+        space[name] = [parse_overrides([f"{name}={value}"])[name] for value in values.split(",")]
+
+    for item in range_items:
+        name, sep, bounds = item.partition("=")
+        low, colon, high = bounds.partition(":")
+        if not sep or not colon:
+            raise ValueError(f"参数格式应为 NAME=LOW:HIGH: {item}")
+        parsed = parse_overrides([f"low={low}", f"high={high}"])
+        space[name] = (_number(parsed["low"]), _number(parsed["high"]))
+
+    return space
+
+
+def _number(value):
+    return value if isinstance(value, int) else float(value)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.grid and args.range:
+        print("[ERROR] --grid 和 --range 不能同时使用")
+        return 2
+
+    from backtest.sweep import format_table, grid, random_search, run_sweep, write_csv
+    from config.strategy_config import MarketMakingConfig, with_overrides
+
+    space = parse_space(args.grid, args.range)
+    param_sets = random_search(space, args.samples, args.seed) if args.range else grid(space)
+    print(f"[INFO] {len(param_sets)} 组参数")
+
+    instruments, data = load_data(args)
+
+    config = with_overrides(
+        MarketMakingConfig(
+            instrument_ids=tuple(str(instrument.id) for instrument in instruments),
+            telemetry_level="ERROR",
+        ),
+        **parse_overrides(args.set),
+    )
+
+    rows = run_sweep(
+        instruments,
+        data,
+        config,
+        param_sets,
+        workers=args.workers,
+        starting_balance=args.balance,
+        latency_ms=args.latency_ms,
+    )
+
+    print(format_table(rows, by=args.sort, limit=args.top))
+    if args.csv:
+        write_csv(rows, args.csv, by=args.sort)
+        print(f"[OK] 结果已写入 {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+做市策略 - 端到端吞吐基准
+
+本地 TradingNode（合成数据客户端 + Sandbox 执行客户端）按速率阶梯加压，
+报告饱和吞吐、回调延迟分位数、CPU% 和 RSS；不连接交易所，可在 CI 和生产机器上运行
+
+运行方法：
+    python run_throughput.py
+    python run_throughput.py --markets 1 --markets 4 --markets 16 --json data/throughput.json
+    python run_throughput.py --rates 500,1000,2000 --step-secs 2 --min-rate 800   # CI：低于 800/秒 返回 1
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# 添加项目根目录到路径
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from diagnostics.throughput import (
+    DEFAULT_CONFIRM_STEPS,
+    DEFAULT_MAX_P99_MS,
+    DEFAULT_MIN_RATIO,
+    DEFAULT_RATES,
+    DEFAULT_STEP_SECS,
+    DEFAULT_WARMUP_SECS,
+)
+
+
+def parse_rates(text: str):
+    return tuple(float(rate) for rate in text.split(",") if rate.strip())
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="TradingNode + MarketMakingStrategy 端到端吞吐基准")
+    parser.add_argument("--markets", type=int, action="append", help="市场数（可多次指定，每个单独运行；默认 1）")
+    parser.add_argument(
+        "--rates",
+        type=parse_rates,
+        default=DEFAULT_RATES,
+        help="速率阶梯，所有订单簿合计的更新次数/秒（逗号分隔）",
+    )
+    parser.add_argument("--step-secs", type=float, default=DEFAULT_STEP_SECS, help="每级持续秒数")
+    parser.add_argument("--warmup-secs", type=float, default=DEFAULT_WARMUP_SECS, help="预热秒数")
+    parser.add_argument("--max-p99-ms", type=float, default=DEFAULT_MAX_P99_MS, help="dispatch p99 上限（毫秒）")
+    parser.add_argument("--min-ratio", type=float, default=DEFAULT_MIN_RATIO, help="处理速率 / 推送速率下限")
+    parser.add_argument(
+        "--confirm-steps",
+        type=int,
+        default=DEFAULT_CONFIRM_STEPS,
+        help="同一速率连续过载多少次才确认饱和（过载后以同一速率重测）",
+    )
+    parser.add_argument("--tick", default="0.001", choices=["0.01", "0.001"], help="价格 tick")
+    parser.add_argument("--seed", type=int, default=0, help="合成数据种子")
+    parser.add_argument("--no-stop", action="store_true", help="饱和后继续加压（默认停止）")
+    parser.add_argument("--json", help="结果写入 JSON")
+    parser.add_argument("--min-rate", type=float, help="饱和吞吐低于该值时返回 1（CI 门禁）")
+    parser.add_argument("--log-level", default="ERROR", help="节点日志级别")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    from diagnostics.throughput import run_throughput
+
+    reports = []
+    for markets in args.markets or [1]:
+        print(f"\n[INFO] {markets} 个市场，速率阶梯: {', '.join(f'{rate:.0f}' for rate in args.rates)}")
+        report = run_throughput(
+            markets=markets,
+            rates=args.rates,
+            step_secs=args.step_secs,
+            warmup_secs=args.warmup_secs,
+            max_p99_ms=args.max_p99_ms,
+            min_ratio=args.min_ratio,
+            confirm_steps=args.confirm_steps,
+            tick=args.tick,
+            seed=args.seed,
+            stop_on_saturation=not args.no_stop,
+            log_level=args.log_level,
+        )
+        print(report.format_table())
+        reports.append(report)
+
+    if args.json:
+        path = Path(args.json)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps([report.to_dict() for report in reports], indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+        print(f"\n[OK] 结果已写入 {path}")
+
+    if args.min_rate is not None:
+        below = [report for report in reports if (report.saturation_rate or 0) < args.min_rate]
+        if below:
+            print(f"[X] 饱和吞吐低于 {args.min_rate:.0f}/秒: " + ", ".join(f"{report.markets} 个市场" for report in below))
+            return 1
+        print(f"[OK] 饱和吞吐不低于 {args.min_rate:.0f}/秒")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,15 +9,29 @@
 5. 使用 Cache 获取数据
 """
 
+from datetime import timedelta
 from decimal import Decimal
+from time import perf_counter_ns
 
 from nautilus_trader.trading.strategy import Strategy
 from nautilus_trader.model.identifiers import InstrumentId, Venue
 from nautilus_trader.model.orders import Order, OrderList
 from nautilus_trader.model.identifiers import OrderListId
-from nautilus_trader.model.enums import OrderSide, TimeInForce, BookType
+from nautilus_trader.model.enums import OrderSide, TimeInForce, BookType, order_side_to_str, position_side_to_str
 from nautilus_trader.model.objects import Quantity, Price, Money
 
+from .latency import create_recorder
+from .telemetry import DEBUG, INFO, WARNING, ERROR, format_kv, parse_level
+
+
+# 快照失效标记（None 是合法快照值：无仓位/无账户）
+_STALE = object()
+
+
+def instrument_topic(instrument_id) -> str:
+    """品种定义更新的消息总线主题（与 DataEngine 发布的主题相同）"""
+    return f"data.instrument.{instrument_id.venue}.{instrument_id.symbol}"
+
 
 class BaseStrategy(Strategy):
     """
@@ -25,8 +39,33 @@ class BaseStrategy(Strategy):
 
     封装常用功能，确保正确使用 NautilusTrader API
     充分利用 Portfolio、BettingAccount、RiskEngine 等框架能力
+
+    仓位和账户信息按事件做快照：同一个事件内多次查询只访问一次
+    Cache/Portfolio，成交、仓位、撤单、账户状态事件或新 tick 开始时失效
+
+    热路径日志走 log_kv()：低于 telemetry_level 的记录不做任何格式化
+
+    latency_stats 打开时各阶段延迟记入 self.latency（LatencyRecorder），
+    每 latency_dump_interval_secs 秒（0 表示只在停止时）输出 p50/p99/p999
     """
 
+    LATENCY_TIMER_NAME = "latency-dump"
+    ACCOUNT_TOPIC = "events.account.*"
+
+    def __init__(self, config=None):
+        super().__init__(config)
+
+        # 每事件快照
+        self._position_snapshot = _STALE
+        self._account_snapshot = _STALE
+
+        # 遥测日志级别（DEBUG / INFO / WARNING / ERROR）
+        self._telemetry_level = parse_level(getattr(config, 'telemetry_level', 'INFO'))
+
+        # 延迟直方图（关闭时为 None）
+        self.latency = create_recorder(getattr(config, 'latency_stats', False))
+        self.latency_dump_interval_secs = getattr(config, 'latency_dump_interval_secs', 0)
+
     # ========== 生命周期管理 ==========
 
     def on_start(self):
@@ -35,27 +74,46 @@ class BaseStrategy(Strategy):
         self.log.info(f"策略启动: {self.id}")
         self.log.info("=" * 80)
 
-        # 获取 Instrument
-        self.instrument = self.cache.instrument(self.instrument_id)
+        # 账户状态事件（余额变化不一定伴随成交）不会派发给 Strategy，需要自己订阅
+        self.msgbus.subscribe(topic=self.ACCOUNT_TOPIC, handler=self.on_account_state)
 
-        if not self.instrument:
-            self.log.error(f"Instrument not found: {self.instrument_id}")
-            return
+        if self.latency is not None and self.latency_dump_interval_secs > 0:
+            self.clock.set_timer(
+                name=self.LATENCY_TIMER_NAME,
+                interval=timedelta(seconds=self.latency_dump_interval_secs),
+                callback=lambda event: self.dump_latency(),
+            )
 
-        self.log.info(
-            f"\n"
-            f"交易品种:\n"
-            f"  ID: {self.instrument.id}\n"
-            f"  基础货币: {self.instrument.get_base_currency()}\n"
-            f"  计价货币: {self.instrument.quote_currency}\n"
-            f"  价格精度: {self.instrument.price_precision}\n"
-            f"  数量精度: {self.instrument.size_precision}\n"
-            f"  最小数量: {self.instrument.min_quantity}\n"
-            f"  最大数量: {self.instrument.max_quantity}\n"
-        )
+        # 获取 Instrument（多市场策略会有多个）
+        self.instruments = {}
+        for instrument_id in self.trading_instrument_ids():
+            instrument = self.cache.instrument(instrument_id)
+
+            if not instrument:
+                self.log.error(f"Instrument not found: {instrument_id}")
+                continue
 
-        # 订阅数据
-        self.subscribe_data()
+            self.instruments[instrument_id] = instrument
+
+            self.log.info(
+                f"\n"
+                f"交易品种:\n"
+                f"  ID: {instrument.id}\n"
+                f"  基础货币: {instrument.get_base_currency()}\n"
+                f"  计价货币: {instrument.quote_currency}\n"
+                f"  价格精度: {instrument.price_precision}\n"
+                f"  数量精度: {instrument.size_precision}\n"
+                f"  最小数量: {instrument.min_quantity}\n"
+                f"  最大数量: {instrument.max_quantity}\n"
+            )
+
+            # 订阅数据
+            self.subscribe_data(instrument)
+
+        self.instrument = self.instruments.get(self.instrument_id)
+
+        if not self.instrument:
+            return
 
         # 打印初始状态
         self.print_account_summary()
@@ -72,37 +130,119 @@ class BaseStrategy(Strategy):
         self.print_position_summary()
 
         # 取消所有订单
-        self.cancel_all_orders(self.instrument_id)
+        for instrument_id in self.trading_instrument_ids():
+            self.cancel_all_orders(instrument_id)
+
+        if self.msgbus.is_subscribed(topic=self.ACCOUNT_TOPIC, handler=self.on_account_state):
+            self.msgbus.unsubscribe(topic=self.ACCOUNT_TOPIC, handler=self.on_account_state)
+
+        if self.latency is not None:
+            if self.LATENCY_TIMER_NAME in self.clock.timer_names:
+                self.clock.cancel_timer(self.LATENCY_TIMER_NAME)
+            self.dump_latency()
+
+    def trading_instrument_ids(self):
+        """
+        策略交易的品种列表
+
+        单品种策略返回 [instrument_id]，多市场策略覆盖此方法
+        """
+        return [self.instrument_id]
 
     # ========== 数据订阅 ==========
 
-    def subscribe_data(self):
-        """订阅市场数据"""
+    def subscribe_data(self, instrument=None):
+        """订阅市场数据（默认当前品种）"""
+        instrument = instrument or self.instrument
+
         # 订阅订单簿增量（推荐）
         self.subscribe_order_book_deltas(
-            self.instrument.id,
+            instrument.id,
             BookType.L2_MBP
         )
 
         # 订阅报价
-        self.subscribe_quote_ticks(self.instrument.id)
+        self.subscribe_quote_ticks(instrument.id)
 
         # 订阅成交
-        self.subscribe_trade_ticks(self.instrument.id)
+        self.subscribe_trade_ticks(instrument.id)
+
+        # 品种定义更新（例如 InstrumentRefresher 刷新快照）：只订阅消息总线，
+        # 不向数据客户端发送订阅命令；收到后调用 on_instrument
+        self.msgbus.subscribe(topic=instrument_topic(instrument.id), handler=self.handle_instrument)
+
+        self.log.info(f"[OK] 数据订阅完成: {instrument.id}")
+
+    # ========== 遥测日志 ==========
+
+    def log_enabled(self, level: int) -> bool:
+        """检查遥测级别是否启用（用于跳过昂贵的字段计算）"""
+        return level >= self._telemetry_level
 
-        self.log.info("[OK] 数据订阅完成")
+    def log_kv(self, event: str, level: int = INFO, **fields):
+        """
+        输出紧凑的 key=value 记录
+
+        级别未启用时直接返回，不构建字符串
+
+        Args:
+            event: 事件名
+            level: DEBUG / INFO / WARNING / ERROR
+            **fields: 记录字段
+        """
+        if level < self._telemetry_level:
+            return
+
+        message = format_kv(event, fields)
+
+        if level >= ERROR:
+            self.log.error(message)
+        elif level >= WARNING:
+            self.log.warning(message)
+        elif level >= INFO:
+            self.log.info(message)
+        else:
+            self.log.debug(message)
+
+    def dump_latency(self):
+        """输出各阶段延迟分位数（微秒，每个阶段一条记录）"""
+        if self.latency is None:
+            return
+
+        for stage, summary in self.latency.snapshot().items():
+            self.log.info(format_kv("latency", {"stage": stage, **summary}))
+
+    # ========== 快照管理 ==========
+
+    def invalidate_snapshots(self):
+        """
+        使仓位和账户快照失效
+
+        每个行情 tick 开始时、以及成交/仓位/撤单/账户状态事件后调用，
+        下一次查询会重新从 Cache/Portfolio 读取
+        """
+        self._position_snapshot = _STALE
+        self._account_snapshot = _STALE
 
     # ========== Portfolio 相关方法 ==========
 
     def get_current_position(self):
         """
-        获取当前仓位信息
+        获取当前仓位信息（事件内快照）
 
         [OK] 使用 Cache，不自己维护 paper_position
 
+        注意：返回的字典在快照失效前被共享，调用方不要修改
+
         Returns:
             dict | None: 仓位信息字典，如果无仓位返回 None
         """
+        if self._position_snapshot is _STALE:
+            self._position_snapshot = self._load_current_position()
+        return self._position_snapshot
+
+    def _load_current_position(self):
+        """从 Cache 读取当前仓位"""
         # positions_open 返回列表，取第一个（应该只有一个）
         positions = self.cache.positions_open(instrument_id=self.instrument_id)
 
@@ -111,19 +251,28 @@ class BaseStrategy(Strategy):
 
         position = positions[0]
 
+        entry_price = Decimal(str(position.avg_px_open)) if position.avg_px_open else None
+
+        # 当前价取订单簿中间价（没有订单簿时用开仓均价）
+        mid = self.get_midpoint()
+        current_price = Decimal(str(mid)) if mid is not None else entry_price
+
+        # 未实现盈亏需要参考价，由 Portfolio 按最新行情计算
+        unrealized_pnl = self.portfolio.unrealized_pnl(self.instrument_id)
+
         return {
-            'side': str(position.side),  # 'LONG' | 'SHORT' | 'FLAT'
-            'quantity': Decimal(position.quantity),
-            'entry_price': Decimal(position.avg_px_open) if position.avg_px_open else None,
-            'current_price': Decimal(position.avg_px_current) if position.avg_px_current else None,
-            'unrealized_pnl': Decimal(position.unrealized_pnl()),
-            'realized_pnl': Decimal(position.realized_pnl),
+            'side': position_side_to_str(position.side),  # 'LONG' | 'SHORT' | 'FLAT'
+            'quantity': position.signed_decimal_qty(),  # 多头为正、空头为负
+            'entry_price': entry_price,
+            'current_price': current_price,
+            'unrealized_pnl': unrealized_pnl.as_decimal() if unrealized_pnl is not None else Decimal('0'),
+            'realized_pnl': position.realized_pnl.as_decimal() if position.realized_pnl is not None else Decimal('0'),
         }
 
     def has_open_position(self):
         """检查是否有开放仓位"""
         position = self.get_current_position()
-        return position is not None and position['quantity'] > 0
+        return position is not None and position['quantity'] != 0
 
     def is_long(self):
         """检查是否持有多头仓位"""
@@ -139,13 +288,21 @@ class BaseStrategy(Strategy):
 
     def get_account_info(self):
         """
-        获取账户信息
+        获取账户信息（事件内快照）
 
         [OK] 使用 Portfolio 系统，不自己维护 paper_position
 
+        注意：返回的字典在快照失效前被共享，调用方不要修改
+
         Returns:
             dict: 账户信息字典
         """
+        if self._account_snapshot is _STALE:
+            self._account_snapshot = self._load_account_info()
+        return self._account_snapshot
+
+    def _load_account_info(self):
+        """从 Cache/Portfolio 读取账户信息"""
         account = self.cache.account_for_venue(Venue("POLYMARKET"))
 
         if not account:
@@ -328,29 +485,45 @@ class BaseStrategy(Strategy):
             oco=True,
         )
 
-        self.submit_order_list(order_list)
-        self.log.info(f"[OK] OCO 订单已提交: {order_list.order_list_id}")
+        if self.latency is not None:
+            start = perf_counter_ns()
+            self.submit_order_list(order_list)
+            self.latency.record("submit", perf_counter_ns() - start)
+        else:
+            self.submit_order_list(order_list)
+        self.log_kv("oco_submitted", level=DEBUG, order_list_id=order_list.order_list_id)
 
     # ========== 事件处理 ==========
 
     def on_order_filled(self, event):
         """订单成交时调用"""
-        self.log.info(
-            f"\n"
-            f"{'='*60}\n"
-            f"[OK] Order Filled\n"
-            f"{'='*60}\n"
-            f"Order ID: {event.client_order_id}\n"
-            f"Venue Order ID: {event.venue_order_id}\n"
-            f"Side: {event.order_side}\n"
-            f"Fill Price: {event.last_px}\n"
-            f"成交数量: {event.last_qty}\n"
-            f"手续费: {event.commission}\n"
-            f"{'='*60}"
+        # 成交改变仓位和余额
+        self.invalidate_snapshots()
+
+        self.log_kv(
+            "fill",
+            order_id=event.client_order_id,
+            venue_order_id=event.venue_order_id,
+            side=order_side_to_str(event.order_side),
+            px=event.last_px,
+            qty=event.last_qty,
+            fee=event.commission,
         )
 
-        # 打印仓位更新（Portfolio 自动维护）
-        self.print_position_summary()
+        # 记录仓位更新（Portfolio 自动维护）
+        if self.log_enabled(INFO):
+            position = self.get_current_position()
+            if position:
+                self.log_kv(
+                    "position",
+                    side=position['side'],
+                    qty=position['quantity'],
+                    entry=position['entry_price'],
+                    upnl=position['unrealized_pnl'],
+                    rpnl=position['realized_pnl'],
+                )
+            else:
+                self.log_kv("position", side="FLAT")
 
     def on_order_rejected(self, event):
         """订单被拒绝时调用"""
@@ -379,10 +552,26 @@ class BaseStrategy(Strategy):
 
     def on_order_canceled(self, event):
         """订单取消时调用"""
-        self.log.info(
-            f"[STOP] 订单取消: {event.client_order_id}, "
-            f"取消数量: {event.rejected_qty}"
-        )
+        # 撤单释放锁定余额
+        self.invalidate_snapshots()
+
+        self.log_kv("canceled", order_id=event.client_order_id)
+
+    def on_position_opened(self, event):
+        """仓位开启时调用"""
+        self.invalidate_snapshots()
+
+    def on_position_changed(self, event):
+        """仓位变化时调用"""
+        self.invalidate_snapshots()
+
+    def on_position_closed(self, event):
+        """仓位关闭时调用"""
+        self.invalidate_snapshots()
+
+    def on_account_state(self, event):
+        """账户状态更新时调用（充值、提现、结算等余额变化）"""
+        self.invalidate_snapshots()
 
     # ========== 打印辅助方法 ==========
 
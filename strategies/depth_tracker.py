@@ -0,0 +1,149 @@
+"""
+深度跟踪 - 由订单簿增量维护的前 N 档累计深度
+
+核心原则：
+1. 每条增量只更新受影响的价位（有序价位表 + 价位→数量表）
+2. 前 N 档累计数量增量维护，读取 O(1)
+3. 只有前 N 档的集合发生变化时才重算（O(N)）
+"""
+
+from bisect import bisect_left, insort
+
+from nautilus_trader.model.enums import BookAction, OrderSide
+
+
+class _SideDepth:
+    """单边深度（价位 key 升序即由优到劣）"""
+
+    __slots__ = ("depth", "_keys", "_sizes", "top_size")
+
+    def __init__(self, depth: int):
+        self.depth = depth
+        self._keys = []     # 有序价位 key
+        self._sizes = {}    # key -> 数量
+        self.top_size = 0.0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def set(self, key: int, size: float):
+        """设置价位数量（size <= 0 视为删除）"""
+        if size <= 0:
+            self.remove(key)
+            return
+
+        old = self._sizes.get(key)
+        self._sizes[key] = size
+
+        if old is not None:
+            # 已有价位：只在前 N 档内时调整累计值
+            if bisect_left(self._keys, key) < self.depth:
+                self.top_size += size - old
+            return
+
+        insort(self._keys, key)
+        if bisect_left(self._keys, key) < self.depth:
+            self._recompute()
+
+    def remove(self, key: int):
+        """删除价位"""
+        if self._sizes.pop(key, None) is None:
+            return
+
+        index = bisect_left(self._keys, key)
+        del self._keys[index]
+        if index < self.depth:
+            self._recompute()
+
+    def clear(self):
+        """清空"""
+        self._keys.clear()
+        self._sizes.clear()
+        self.top_size = 0.0
+
+    def _recompute(self):
+        sizes = self._sizes
+        self.top_size = sum(sizes[key] for key in self._keys[:self.depth])
+
+
+class DepthTracker:
+    """
+    前 N 档深度跟踪器
+
+    由 OrderBookDeltas 增量驱动，bid_depth / ask_depth 读取 O(1)
+
+    Args:
+        depth: 统计的档位数
+    """
+
+    def __init__(self, depth: int = 5):
+        if depth <= 0:
+            raise ValueError(f"depth 必须为正数: {depth}")
+
+        self.depth = depth
+        # 买单价格越高越优：用负的 raw 价格作为 key
+        self._bids = _SideDepth(depth)
+        self._asks = _SideDepth(depth)
+
+        # 是否已收到过增量（未初始化时调用方应回退到订单簿）
+        self.initialized = False
+
+    # ========== 更新 ==========
+
+    def apply_deltas(self, deltas):
+        """应用一批 OrderBookDeltas"""
+        for delta in deltas.deltas:
+            self.apply(delta)
+
+    def apply(self, delta):
+        """应用单条 OrderBookDelta"""
+        self.initialized = True
+        action = delta.action
+
+        if action == BookAction.CLEAR:
+            self.clear()
+            return
+
+        order = delta.order
+        if order.side == OrderSide.BUY:
+            side = self._bids
+            key = -order.price.raw
+        else:
+            side = self._asks
+            key = order.price.raw
+
+        if action == BookAction.DELETE:
+            side.remove(key)
+        else:
+            # L2 MBP：ADD / UPDATE 都是设置该价位的总数量
+            side.set(key, order.size.as_double())
+
+    def clear(self):
+        """清空两边（快照开始）"""
+        self._bids.clear()
+        self._asks.clear()
+
+    # ========== 读取 ==========
+
+    @property
+    def bid_depth(self) -> float:
+        """买方前 N 档累计数量"""
+        return self._bids.top_size
+
+    @property
+    def ask_depth(self) -> float:
+        """卖方前 N 档累计数量"""
+        return self._asks.top_size
+
+    @property
+    def avg_depth(self) -> float:
+        """买卖平均深度"""
+        return (self._bids.top_size + self._asks.top_size) / 2
+
+    @property
+    def imbalance(self) -> float:
+        """深度失衡：(买 - 卖) / (买 + 卖)，范围 [-1, 1]"""
+        total = self._bids.top_size + self._asks.top_size
+        if total <= 0:
+            return 0.0
+        return (self._bids.top_size - self._asks.top_size) / total
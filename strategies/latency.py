@@ -0,0 +1,181 @@
+"""
+延迟统计 - 行情到下单（tick-to-trade）各阶段的 HDR 风格直方图
+
+热路径上只做整数运算：
+1. 纳秒值按对数-线性分桶（每个 2 的幂区间 SUB_BUCKETS/2 个线性子桶），
+   相对误差上限 2/SUB_BUCKETS，桶数组预分配，记录一次只是一次下标 +1
+2. 不加锁：记录和输出都在策略的事件循环线程上执行
+3. 分位数（p50 / p99 / p999）只在输出时计算
+
+阶段（MarketMakingStrategy）：
+    feed           订单簿增量 ts_event → ts_init（交易所 → 节点）
+    dispatch       ts_init → on_order_book 开始处理（事件循环排队）
+    risk           _check_risk 耗时
+    compute        中间价 / 价差 / 倾斜 / 挂单价格 / 订单大小计算
+    submit         报价差分 + submit_order（交给 RiskEngine / 执行客户端）
+    tick_to_trade  ts_init → 订单提交完成（只统计由行情直接触发且发出了订单的更新）
+"""
+
+from typing import Dict, List, Optional
+
+# 每个 2 的幂区间的子桶精度（2^8 = 256 → 相对误差 < 0.8%）
+SUB_BUCKET_BITS = 8
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_HALF = SUB_BUCKETS >> 1
+
+# 可记录的最大值（约 18 分钟），超出的记为最大值
+MAX_VALUE_BITS = 40
+MAX_VALUE = (1 << MAX_VALUE_BITS) - 1
+
+QUANTILES = (("p50", 0.50), ("p90", 0.90), ("p99", 0.99), ("p999", 0.999))
+
+
+def bucket_index(value: int) -> int:
+    """值 → 桶下标（小于 SUB_BUCKETS 的值精确记录）"""
+    if value < SUB_BUCKETS:
+        return value if value > 0 else 0
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKETS + (shift - 1) * _HALF + (value >> shift) - _HALF
+
+
+def bucket_bounds(index: int):
+    """桶下标 → 值区间 [low, high]"""
+    if index < SUB_BUCKETS:
+        return index, index
+    offset = index - SUB_BUCKETS
+    shift = offset // _HALF + 1
+    mantissa = offset % _HALF + _HALF
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+_BUCKET_COUNT = bucket_index(MAX_VALUE) + 1
+
+
+class LatencyHistogram:
+    """
+    纳秒延迟直方图
+
+    record() 为 O(1)；分位数返回所在桶的中点，相对误差 < 2/SUB_BUCKETS
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * _BUCKET_COUNT
+        self.reset()
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value_ns: int):
+        value = int(value_ns)
+        if value < 0:
+            value = 0
+        elif value > MAX_VALUE:
+            value = MAX_VALUE
+
+        self.counts[bucket_index(value)] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "LatencyHistogram"):
+        """合并另一个直方图（例如多个 worker 的结果）"""
+        if other.count == 0:
+            return
+        for i, n in enumerate(other.counts):
+            if n:
+                self.counts[i] += n
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def value_at_quantile(self, q: float) -> int:
+        """分位数（纳秒）"""
+        if self.count == 0:
+            return 0
+        if q >= 1.0:
+            return self.max
+
+        rank = max(1, int(q * self.count + 0.999999))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            if not n:
+                continue
+            seen += n
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                return min(max((low + high) // 2, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """count / mean / min / max / p50 / p90 / p99 / p999（微秒）"""
+        result = {
+            "count": self.count,
+            "mean_us": self.mean / 1e3,
+            "min_us": self.min / 1e3,
+        }
+        for name, q in QUANTILES:
+            result[f"{name}_us"] = self.value_at_quantile(q) / 1e3
+        result["max_us"] = self.max / 1e3
+        return result
+
+
+class LatencyRecorder:
+    """
+    按阶段名管理直方图
+
+    Args:
+        stages: 预先创建的阶段（输出按此顺序）
+    """
+
+    STAGES = ("feed", "dispatch", "risk", "compute", "submit", "tick_to_trade")
+
+    def __init__(self, stages=STAGES):
+        self.histograms: Dict[str, LatencyHistogram] = {name: LatencyHistogram() for name in stages}
+
+    def record(self, stage: str, value_ns: int):
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = LatencyHistogram()
+        histogram.record(value_ns)
+
+    def __getitem__(self, stage: str) -> LatencyHistogram:
+        return self.histograms[stage]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """有数据的阶段 → summary()"""
+        return {name: h.summary() for name, h in self.histograms.items() if h.count}
+
+    def reset(self):
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def format_table(self) -> str:
+        """文本表格（微秒）"""
+        header = f"{'stage':<14}{'count':>9}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'p999':>10}{'max':>10}"
+        lines = [header]
+        for name, s in self.snapshot().items():
+            lines.append(
+                f"{name:<14}{s['count']:>9}{s['mean_us']:>10.1f}{s['p50_us']:>10.1f}"
+                f"{s['p90_us']:>10.1f}{s['p99_us']:>10.1f}{s['p999_us']:>10.1f}{s['max_us']:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+def create_recorder(enabled: bool) -> Optional[LatencyRecorder]:
+    """配置关闭时返回 None（热路径上只多一次 is None 判断）"""
+    return LatencyRecorder() if enabled else None
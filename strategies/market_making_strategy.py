@@ -4,17 +4,23 @@
 充分利用 NautilusTrader 基础设施：
 - Portfolio 自动管理仓位
 - BettingAccount 自动计算盈亏
-- OCO 订单自动止盈止损
+- 报价管理器差分挂单（价格不变不重发订单）
 - RiskEngine 自动风险检查
 """
 
 from decimal import Decimal
-from typing import Optional
+from functools import partial
+from time import perf_counter_ns
+from typing import Dict, Optional
 
-from nautilus_trader.model.enums import OrderSide, BookType, TimeInForce
-from nautilus_trader.model.objects import Price, Quantity
+from nautilus_trader.model.enums import OrderSide, BookType, TimeInForce, order_side_to_str
+from nautilus_trader.model.identifiers import InstrumentId
 
 from .base_strategy import BaseStrategy
+from .market_slot import MarketSlot
+from .quote_manager import QuoteManager
+from .quote_math import TickGrid
+from .telemetry import INFO
 
 
 class MarketMakingStrategy(BaseStrategy):
@@ -31,6 +37,9 @@ class MarketMakingStrategy(BaseStrategy):
     - 不依赖价格方向
     - 提供流动性
     - 利用 Polymarket 大价差特性
+
+    多市场：配置 instrument_ids 时一个实例同时为多个品种报价，
+    每个品种的状态放在独立的 MarketSlot 中，账户和风控参数共享
     """
 
     # ========== 默认参数 ==========
@@ -44,6 +53,7 @@ class MarketMakingStrategy(BaseStrategy):
     DEFAULT_ORDER_SIZE = 20                 # 每单 20 个
     DEFAULT_MIN_ORDER_SIZE = 5
     DEFAULT_MAX_ORDER_SIZE = 50
+    DEFAULT_DEPTH_LEVELS = 5                # 订单大小参考的深度档位数
 
     # 库存参数
     DEFAULT_TARGET_INVENTORY = 0            # 目标库存（中性）
@@ -66,13 +76,23 @@ class MarketMakingStrategy(BaseStrategy):
     DEFAULT_MAX_DAILY_LOSS = Decimal("-100.0")  # -100 USDC
 
     # 行为参数
-    DEFAULT_UPDATE_INTERVAL_MS = 1000      # 1 秒更新间隔
+    DEFAULT_UPDATE_INTERVAL_MS = 1000      # 1 秒心跳重报间隔
+    DEFAULT_MIN_REQUOTE_INTERVAL_MS = 100  # 两次重报最小间隔（合并突发更新）
+    DEFAULT_REQUOTE_TRIGGER_TICKS = 1      # 盘口移动 N 个 tick 立即重报
+
+    # 挂单参数
+    DEFAULT_REQUOTE_TOLERANCE_TICKS = 0    # 价格变化超过 N 个 tick 才重挂
+    DEFAULT_REQUOTE_SIZE_TOLERANCE = 0     # 数量变化超过 N 个才重挂
+
+    # 日志参数
+    DEFAULT_LOG_EVERY_N_UPDATES = 10       # 报价无变化时每 N 次更新记录一次
 
     def __init__(self, config):
         super().__init__(config)
 
-        # 必需：instrument_id（BaseStrategy.on_start 需要）
-        self.instrument_id = getattr(config, 'instrument_id')
+        # 必需：instrument_id 或 instrument_ids（多市场）
+        self.instrument_ids = self._parse_instrument_ids(config)
+        self.instrument_id = self.instrument_ids[0]
 
         # 从配置读取参数，使用默认值
         self.base_spread = getattr(config, 'base_spread', self.DEFAULT_BASE_SPREAD)
@@ -82,6 +102,7 @@ class MarketMakingStrategy(BaseStrategy):
         self.order_size = getattr(config, 'order_size', self.DEFAULT_ORDER_SIZE)
         self.min_order_size = getattr(config, 'min_order_size', self.DEFAULT_MIN_ORDER_SIZE)
         self.max_order_size = getattr(config, 'max_order_size', self.DEFAULT_MAX_ORDER_SIZE)
+        self.depth_levels = getattr(config, 'depth_levels', self.DEFAULT_DEPTH_LEVELS)
 
         self.target_inventory = getattr(config, 'target_inventory', self.DEFAULT_TARGET_INVENTORY)
         self.max_inventory = getattr(config, 'max_inventory', self.DEFAULT_MAX_INVENTORY)
@@ -102,122 +123,501 @@ class MarketMakingStrategy(BaseStrategy):
         self.max_daily_loss = getattr(config, 'max_daily_loss', self.DEFAULT_MAX_DAILY_LOSS)
 
         self.update_interval_ms = getattr(config, 'update_interval_ms', self.DEFAULT_UPDATE_INTERVAL_MS)
+        self.min_requote_interval_ms = getattr(
+            config, 'min_requote_interval_ms', self.DEFAULT_MIN_REQUOTE_INTERVAL_MS
+        )
+        self.requote_trigger_ticks = getattr(
+            config, 'requote_trigger_ticks', self.DEFAULT_REQUOTE_TRIGGER_TICKS
+        )
         self.use_inventory_skew = getattr(config, 'use_inventory_skew', True)
         self.use_dynamic_spread = getattr(config, 'use_dynamic_spread', True)
 
-        # 内部状态
-        self._last_update_time_ns = 0
-        self._price_history = []  # 用于计算波动率
+        self.requote_tolerance_ticks = getattr(
+            config, 'requote_tolerance_ticks', self.DEFAULT_REQUOTE_TOLERANCE_TICKS
+        )
+        self.requote_size_tolerance = getattr(
+            config, 'requote_size_tolerance', self.DEFAULT_REQUOTE_SIZE_TOLERANCE
+        )
+        self.log_every_n_updates = getattr(
+            config, 'log_every_n_updates', self.DEFAULT_LOG_EVERY_N_UPDATES
+        )
+
+        # 内部状态（每个品种一个槽位，_slot 指向正在处理的品种）
+        self._slots = {
+            instrument_id: self._create_slot(instrument_id)
+            for instrument_id in self.instrument_ids
+        }
+        self._slot = self._slots[self.instrument_id]
+
+        # 已移除的品种 → 移除时是否平仓（处理撤单前已经发生的迟到成交）
+        self._retired: Dict[InstrumentId, bool] = {}
+        self._requote_alert_seq = 0  # 补报定时器序号（名字全局唯一）
         self._daily_start_pnl = Decimal("0")
         self._daily_start_balance = Decimal("0")
 
+        # 触发本次处理的订单簿增量 ts_init（0 表示不是由行情直接触发）
+        self._book_trigger_ns = 0
+
+    # ========== 多市场槽位 ==========
+
+    @staticmethod
+    def _parse_instrument_ids(config) -> list:
+        """读取品种列表（instrument_ids 优先，字符串转为 InstrumentId）"""
+        instrument_ids = getattr(config, 'instrument_ids', None)
+        if not isinstance(instrument_ids, (list, tuple)) or not instrument_ids:
+            instrument_ids = [getattr(config, 'instrument_id')]
+
+        return [
+            i if isinstance(i, InstrumentId) else InstrumentId.from_str(str(i))
+            for i in instrument_ids
+        ]
+
+    def _create_slot(self, instrument_id) -> MarketSlot:
+        """按策略参数创建品种槽位"""
+        return MarketSlot(
+            instrument_id=instrument_id,
+            volatility_window=self.volatility_window,
+            depth_levels=self.depth_levels,
+            requote_tolerance_ticks=self.requote_tolerance_ticks,
+            requote_size_tolerance=self.requote_size_tolerance,
+            requote_trigger_ticks=self.requote_trigger_ticks,
+            min_requote_interval_ns=self.min_requote_interval_ms * 1_000_000,
+            max_requote_interval_ns=self.update_interval_ms * 1_000_000,
+            log_every_n_updates=self.log_every_n_updates,
+        )
+
+    def _activate(self, instrument_id) -> Optional[MarketSlot]:
+        """
+        切换到指定品种
+
+        BaseStrategy 的仓位/订单簿/下单方法都基于 instrument_id，
+        切换品种时同步更新并使仓位快照失效
+
+        Returns:
+            MarketSlot | None: 不是本策略交易的品种时返回 None
+        """
+        slot = self._slots.get(instrument_id)
+        if slot is None:
+            return None
+
+        if slot is not self._slot:
+            self._slot = slot
+            self.instrument_id = slot.instrument_id
+            self.instrument = slot.instrument
+            self.invalidate_snapshots()
+
+        return slot
+
+    def trading_instrument_ids(self):
+        """策略交易的品种列表"""
+        return self.instrument_ids
+
+    def add_instrument(self, instrument) -> bool:
+        """
+        运行中加入新品种（每日市场滚动）
+
+        Returns:
+            bool: 已在交易时返回 False
+        """
+        instrument_id = instrument.id
+        if instrument_id in self._slots:
+            return False
+
+        self._retired.pop(instrument_id, None)
+
+        slot = self._create_slot(instrument_id)
+        slot.instrument = instrument
+        slot.grid = TickGrid.from_instrument(instrument)
+
+        self._slots[instrument_id] = slot
+        self.instrument_ids.append(instrument_id)
+        self.instruments[instrument_id] = instrument
+        self.subscribe_data(instrument)
+
+        self.log.info(f"[OK] 加入品种: {instrument_id}")
+        return True
+
+    def update_instrument(self, instrument) -> bool:
+        """
+        品种定义更新：替换槽位中的 Instrument 并重建 tick 网格
+
+        tick / 数量精度变化时，按旧网格挂出的订单会被交易所拒绝或与新网格错位：
+        撤单、清空报价跟踪、重置重报调度，下一次盘口更新按新网格重报
+
+        Returns:
+            bool: 不在交易时返回 False
+        """
+        instrument_id = instrument.id
+        slot = self._slots.get(instrument_id)
+        if slot is None:
+            return False
+
+        previous = slot.instrument
+        slot.instrument = instrument
+        slot.grid = TickGrid.from_instrument(instrument)
+        self.instruments[instrument_id] = instrument
+        if slot is self._slot:
+            self.instrument = instrument
+
+        if previous is not None and (
+            previous.price_increment != instrument.price_increment
+            or previous.size_increment != instrument.size_increment
+        ):
+            self.log.warning(
+                f"[WARN] 品种 tick 已变化，按新网格重报: {instrument_id} "
+                f"{previous.price_increment} → {instrument.price_increment}"
+            )
+            self.cancel_all_orders(instrument_id)
+            slot.quotes.clear()
+            slot.scheduler.reset()
+
+        return True
+
+    def on_instrument(self, instrument):
+        """品种定义更新（InstrumentRefresher 刷新快照后发布）"""
+        self.update_instrument(instrument)
+
+    def remove_instrument(self, instrument_id, flatten: bool = True) -> bool:
+        """
+        停止为品种报价：撤销挂单，可选市价平仓
+
+        不退订行情（Polymarket 不支持退订），之后收到的数据在 _activate 中被忽略；
+        与撤单竞争的迟到成交见 _on_retired_fill
+
+        Returns:
+            bool: 不在交易时返回 False
+        """
+        slot = self._slots.pop(instrument_id, None)
+        if slot is None:
+            return False
+
+        self.instrument_ids.remove(instrument_id)
+        self.instruments.pop(instrument_id, None)
+        self._retired[instrument_id] = flatten
+
+        self._cancel_requote_alert(slot)
+
+        self.cancel_all_orders(instrument_id)
+        slot.quotes.clear()
+
+        if flatten:
+            self.close_all_positions(instrument_id)
+
+        # 当前品种被移除时切换到剩余的任一品种
+        if slot is self._slot and self._slots:
+            self._activate(next(iter(self._slots)))
+
+        self.log.info(f"[OK] 移除品种: {instrument_id}")
+        return True
+
+    @property
+    def _price_history(self):
+        """当前品种的价格历史"""
+        return self._slot.price_history
+
     # ========== 核心逻辑 ==========
 
+    def on_order_book_deltas(self, deltas):
+        """订单簿增量（Cache 中的订单簿已由 DataEngine 更新）"""
+        slot = self._activate(deltas.instrument_id)
+        if slot is None:
+            return
+
+        slot.depth.apply_deltas(deltas)
+
+        order_book = self.cache.order_book(deltas.instrument_id)
+        if order_book is None:
+            return
+
+        if self.latency is None:
+            self.on_order_book(order_book)
+            return
+
+        self.latency.record("feed", deltas.ts_init - deltas.ts_event)
+        self._book_trigger_ns = deltas.ts_init
+        try:
+            self.on_order_book(order_book)
+        finally:
+            self._book_trigger_ns = 0
+
     def on_order_book(self, order_book):
         """处理订单簿更新（核心做市逻辑）"""
+        slot = self._activate(order_book.instrument_id)
+        if slot is None or slot.grid is None:
+            return
+
+        grid = slot.grid
+        scheduler = slot.scheduler
+
+        # 延迟统计：各阶段用 perf_counter_ns 计时（回测中 clock 不前进）
+        lat = self.latency
+        if lat is not None:
+            t_start = perf_counter_ns()
+
+        # 1. 重报调度：盘口移动立即重报，否则合并/心跳
+        best_bid = order_book.best_bid_price()
+        best_ask = order_book.best_ask_price()
+        if best_bid is None or best_ask is None:
+            return
 
-        # 1. 检查更新间隔
         now_ns = self.clock.timestamp_ns()
-        if now_ns - self._last_update_time_ns < self.update_interval_ms * 1_000_000:
+        if lat is not None and self._book_trigger_ns:
+            lat.record("dispatch", now_ns - self._book_trigger_ns)
+
+        bid_touch = grid.ticks(best_bid)
+        ask_touch = grid.ticks(best_ask)
+
+        if not scheduler.should_requote(now_ns, bid_touch, ask_touch):
+            if scheduler.pending:
+                self._schedule_pending_requote(slot)
             return
 
-        # 2. 风险检查
-        if not self._check_risk(order_book):
+        scheduler.mark(now_ns, bid_touch, ask_touch)
+
+        # 2. 新 tick：刷新仓位/账户快照（本次更新内共享）
+        self.invalidate_snapshots()
+
+        # 3. 风险检查
+        if lat is not None:
+            t_check = perf_counter_ns()
+        risk_ok = self._check_risk(order_book)
+        if lat is not None:
+            t_risk = perf_counter_ns()
+            lat.record("risk", t_risk - t_check)
+        if not risk_ok:
             return
 
-        # 3. 获取中间价
+        # 4. 获取中间价
         mid = order_book.midpoint()
         if not mid:
             return
 
-        mid_price = Decimal(mid)
+        # 5. 记录价格历史（用于波动率计算）
+        self._update_price_history(mid)
 
-        # 4. 记录价格历史（用于波动率计算）
-        self._update_price_history(mid_price)
-
-        # 5. 计算价差
+        # 6. 计算价差
         if self.use_dynamic_spread:
             spread = self._calculate_dynamic_spread(order_book)
         else:
             spread = self.base_spread
 
-        # 6. 计算库存倾斜
+        # 7. 计算库存倾斜
         if self.use_inventory_skew:
             skew = self._calculate_inventory_skew()
         else:
             skew = Decimal("0")
 
-        # 7. 计算挂单价格
-        half_spread = spread / 2
-        bid_price = mid_price * (Decimal("1") - half_spread - skew)
-        ask_price = mid_price * (Decimal("1") + half_spread + skew)
+        # 8. 计算挂单价格（整数 tick，参数只在这里转换一次）
+        quote = grid.quote_ticks(mid, float(spread) / 2, float(skew))
+        if quote is None:
+            return
+
+        bid_ticks, ask_ticks = quote
 
-        # 8. 计算订单大小
+        # 9. 计算订单大小
         order_size = self._calculate_order_size(order_book)
 
-        # 9. 提交订单
-        self._submit_market_quotes(bid_price, ask_price, order_size)
-
-        # 10. 更新时间戳
-        self._last_update_time_ns = now_ns
-
-        # 11. 记录日志
-        self.log.info(
-            f"\n{'='*60}\n"
-            f"做市参数:\n"
-            f"  中间价: {mid_price:.4f}\n"
-            f"  价差: {spread*100:.2f}%\n"
-            f"  倾斜: {skew*100:.2f}%\n"
-            f"  买价: {bid_price:.4f}\n"
-            f"  卖价: {ask_price:.4f}\n"
-            f"  订单大小: {order_size}个\n"
-            f"{'='*60}"
+        # 10. 提交订单
+        if lat is not None:
+            t_submit = perf_counter_ns()
+            lat.record("compute", t_submit - t_risk)
+
+        changed = self._submit_market_quotes(bid_ticks, ask_ticks, order_size)
+
+        if lat is not None:
+            t_done = perf_counter_ns()
+            lat.record("submit", t_done - t_submit)
+            # 由行情直接触发且发出了订单：排队 + 处理
+            if changed and self._book_trigger_ns:
+                lat.record("tick_to_trade", now_ns - self._book_trigger_ns + t_done - t_start)
+
+        # 11. 记录日志（采样：挂单变化或每 N 次更新）
+        if slot.log_sampler.should_emit(changed) and self.log_enabled(INFO):
+            self.log_kv(
+                "quote",
+                instrument=slot.instrument_id,
+                mid=mid,
+                spread=float(spread),
+                skew=float(skew),
+                bid=grid.to_float(bid_ticks),
+                ask=grid.to_float(ask_ticks),
+                size=order_size,
+                changed=changed,
+                n=slot.log_sampler.count,
+            )
+
+    def _schedule_pending_requote(self, slot: MarketSlot):
+        """被合并的盘口变化：在最小间隔结束时补报一次"""
+        if slot.requote_alert is not None:
+            return
+
+        # 每个定时器用唯一的名字，从不撤销或重复登记：
+        # LiveClock 的定时器在时钟线程上到期，先检查再撤销会与之竞争
+        self._requote_alert_seq += 1
+        name = f"{self.id}-requote-{slot.instrument_id}-{self._requote_alert_seq}"
+        slot.requote_alert = name
+        self.clock.set_time_alert_ns(
+            name=name,
+            alert_time_ns=slot.scheduler.next_allowed_ns(),
+            callback=partial(self._on_requote_alert, slot.instrument_id),
         )
 
+    def _cancel_requote_alert(self, slot: MarketSlot):
+        """作废补报定时器（不撤销：到期后回调发现名字不匹配直接忽略）"""
+        slot.requote_alert = None
+
+    def _on_requote_alert(self, instrument_id, event):
+        """补报定时器回调"""
+        slot = self._slots.get(instrument_id)
+        if slot is None or slot.requote_alert != event.name:
+            # 已作废的定时器（品种已移除、策略已停止或已被新定时器取代）
+            return
+
+        slot.requote_alert = None
+        self._activate(instrument_id)
+
+        order_book = self.cache.order_book(instrument_id)
+        if order_book is not None:
+            self.on_order_book(order_book)
+
     def on_order_filled(self, event):
         """订单成交时调用"""
+        if self._activate(event.instrument_id) is None:
+            # 不能落到当前品种上：对冲会下在别的市场
+            self._on_retired_fill(event)
+            return
+
         super().on_order_filled(event)
 
+        # 完全成交的挂单不再跟踪
+        order = self.cache.order(event.client_order_id)
+        if order is None or order.is_closed:
+            self._forget_quote(event)
+
         # 检查是否需要对冲
         if self._need_hedge():
             self.log.warning("检测到库存过多，执行对冲")
             self._hedge_inventory()
 
+    def _on_retired_fill(self, event):
+        """
+        已移除品种上的迟到成交（挂单在撤单生效前成交）
+
+        不走当前品种的对冲逻辑；移除时要求平仓的品种再次平仓
+        """
+        self.invalidate_snapshots()
+
+        instrument_id = event.instrument_id
+        flatten = self._retired.get(instrument_id)
+        if flatten is None:
+            return
+
+        self.log.warning(
+            f"[WARN] 已移除品种的迟到成交: {instrument_id} "
+            f"{order_side_to_str(event.order_side)} {event.last_qty} @ {event.last_px}"
+        )
+        if not flatten:
+            return
+
+        # 平仓市价单本身的成交也会走到这里：还有未完成的订单时不重复平仓
+        cache = self.cache
+        if cache.orders_open_count(instrument_id=instrument_id) or cache.orders_inflight_count(instrument_id=instrument_id):
+            return
+        self.close_all_positions(instrument_id)
+
+    def on_order_accepted(self, event):
+        """订单被交易所确认时调用（在途期间被推迟的重报现在补上）"""
+        slot = self._slots.get(event.instrument_id)
+        if slot is not None:
+            self._requote_if_pending(slot)
+
+    def on_order_canceled(self, event):
+        """订单取消时调用"""
+        super().on_order_canceled(event)
+        self._forget_quote(event)
+
+    def on_order_rejected(self, event):
+        """订单被拒绝时调用"""
+        super().on_order_rejected(event)
+        self._forget_quote(event)
+
+    def on_order_expired(self, event):
+        """订单过期时调用"""
+        self._forget_quote(event)
+
+    def on_order_denied(self, event):
+        """订单被 RiskEngine 拒绝时调用（例如限流）"""
+        self.log.warning(f"[X] 订单被风控拒绝: {event.client_order_id}, 原因: {event.reason}")
+        self._forget_quote(event)
+
+    def _forget_quote(self, event):
+        """订单结束：从所属品种的报价管理器中移除，该方向空出后补报"""
+        slot = self._slots.get(event.instrument_id)
+        if slot is not None and slot.quotes.forget(event.client_order_id):
+            self._requote_if_pending(slot)
+
+    def _requote_if_pending(self, slot: MarketSlot):
+        """有被推迟的重报时，在最小间隔结束后补报"""
+        if slot.scheduler.pending:
+            self._schedule_pending_requote(slot)
+
     # ========== 订单提交 ==========
 
     def _submit_market_quotes(
         self,
-        bid_price: Decimal,
-        ask_price: Decimal,
+        bid_ticks: int,
+        ask_ticks: int,
         order_size: int,
     ):
         """
-        提交做市订单（买单 + 卖单）
+        更新做市挂单（买单 + 卖单）
+
+        每个方向与当前挂单做差分：
+        - 价格/数量变化在容忍范围内：保留，不发消息
+        - 无挂单：新挂
+        - 超出容忍范围：撤单，撤单确认后重挂（挂单未确认时等确认后再处理）
+
+        价格以 tick 传入，直接用 raw 整数构造 Price/Quantity
 
-        使用 OCO 订单：一个成交，另一个自动取消
+        Returns:
+            bool: 是否有挂单发生变化
         """
-        # 创建买单
-        buy_order = self.order_factory.limit(
-            instrument_id=self.instrument.id,
-            price=Price.from_str(str(bid_price)),
-            order_side=OrderSide.BUY,
-            quantity=Quantity.from_int(order_size),
-            post_only=False,
-            time_in_force=TimeInForce.IOC,  # IOC：部分成交也可以
-        )
+        bid_changed = self._update_quote(OrderSide.BUY, bid_ticks, order_size)
+        ask_changed = self._update_quote(OrderSide.SELL, ask_ticks, order_size)
+        return bid_changed or ask_changed
+
+    def _update_quote(self, side: OrderSide, price_ticks: int, order_size: int) -> bool:
+        """更新单个方向的挂单，返回是否发送了订单"""
+        slot = self._slot
+        action = slot.quotes.plan(side, price_ticks, order_size)
 
-        # 创建卖单
-        sell_order = self.order_factory.limit(
+        if action == QuoteManager.KEEP:
+            return False
+
+        if action == QuoteManager.REPLACE:
+            live = slot.quotes.live(side)
+            order = self.cache.order(live.client_order_id)
+            if order is not None and not order.is_closed:
+                # 每个方向最多一个未结束的订单：未确认 / 撤单中的挂单等交易所回报，
+                # 已挂出的先撤单，撤单确认后再挂新价（回报到达时补报）
+                slot.scheduler.pending = True
+                if order.is_inflight:
+                    return False
+                self.cancel_order(order)
+                return True
+
+        order = self.order_factory.limit(
             instrument_id=self.instrument.id,
-            price=Price.from_str(str(ask_price)),
-            order_side=OrderSide.SELL,
-            quantity=Quantity.from_int(order_size),
+            price=slot.grid.price(price_ticks),
+            order_side=side,
+            quantity=slot.grid.quantity(order_size),
             post_only=False,
-            time_in_force=TimeInForce.IOC,
+            time_in_force=TimeInForce.GTC,  # GTC：挂单常驻，由管理器差分
         )
 
-        # 使用 OCO：一个成交，取消另一个
-        self.submit_oco_orders(buy_order, sell_order)
+        slot.quotes.track(side, order.client_order_id, price_ticks, order_size)
+        self.submit_order(order)
+        return True
 
     # ========== 计算方法 ==========
 
@@ -262,13 +662,17 @@ class MarketMakingStrategy(BaseStrategy):
 
     def _calculate_order_size(self, order_book) -> int:
         """动态调整订单大小"""
-        # 获取订单簿深度
-        bids = order_book.bids()
-        asks = order_book.asks()
+        # 获取订单簿深度（优先使用增量跟踪，O(1)）
+        depth = self._slot.depth
+        if depth.initialized:
+            avg_depth = depth.avg_depth
+        else:
+            bids = order_book.bids()
+            asks = order_book.asks()
 
-        bid_depth = sum(level.size() for level in bids[:5])
-        ask_depth = sum(level.size() for level in asks[:5])
-        avg_depth = (bid_depth + ask_depth) / 2
+            bid_depth = sum(level.size() for level in bids[:self.depth_levels])
+            ask_depth = sum(level.size() for level in asks[:self.depth_levels])
+            avg_depth = (bid_depth + ask_depth) / 2
 
         # 根据深度调整
         if avg_depth < 50:
@@ -280,28 +684,19 @@ class MarketMakingStrategy(BaseStrategy):
 
         return int(order_size)
 
-    def _calculate_volatility(self) -> Decimal:
-        """计算价格波动率"""
-        if len(self._price_history) < 10:
-            return Decimal("0")
-
-        # 取最近的 N 个价格
-        recent_prices = self._price_history[-self.volatility_window:]
+    def _calculate_volatility(self) -> float:
+        """计算价格波动率（滚动窗口增量维护，O(1)）"""
+        return self._slot.volatility.volatility
 
-        # 计算标准差
-        mean_price = sum(recent_prices) / len(recent_prices)
-        variance = sum((p - mean_price) ** 2 for p in recent_prices) / len(recent_prices)
-        volatility = (variance ** 0.5) / mean_price if mean_price > 0 else Decimal("0")
+    def _update_price_history(self, price):
+        """更新价格历史（预分配环形缓冲区，无分配；波动率共享同一缓冲区）"""
+        slot = self._slot
 
-        return volatility
+        # 窗口参数在运行中被修改时，价格历史和波动率一起调整
+        if slot.volatility.window != self.volatility_window:
+            slot.set_volatility_window(self.volatility_window)
 
-    def _update_price_history(self, price: Decimal):
-        """更新价格历史"""
-        self._price_history.append(price)
-
-        # 保持历史长度
-        if len(self._price_history) > self.volatility_window * 2:
-            self._price_history = self._price_history[-self.volatility_window * 2:]
+        slot.record_price(float(price))
 
     # ========== 风险检查 ==========
 
@@ -324,11 +719,9 @@ class MarketMakingStrategy(BaseStrategy):
         if not mid:
             return False
 
-        mid_price = Decimal(mid)
-
-        if mid_price < self.min_price or mid_price > self.max_price:
+        if mid < float(self.min_price) or mid > float(self.max_price):
             self.log.warning(
-                f"价格 {mid_price:.4f} 超出范围 "
+                f"价格 {mid:.4f} 超出范围 "
                 f"[{self.min_price:.4f}, {self.max_price:.4f}]"
             )
             return False
@@ -427,7 +820,7 @@ class MarketMakingStrategy(BaseStrategy):
             return
 
         current_inventory = position['quantity']
-        hedge_qty = min(abs(current_inventory) // 2, self.hedge_size)
+        hedge_qty = int(min(abs(current_inventory) // 2, self.hedge_size))
 
         if hedge_qty <= 0:
             return
@@ -437,7 +830,7 @@ class MarketMakingStrategy(BaseStrategy):
             self.log.info(f"对冲: 卖出 {hedge_qty} 个 YES")
             self.submit_market_order(
                 side=OrderSide.SELL,
-                quantity=Quantity.from_int(hedge_qty),
+                quantity=self._slot.grid.quantity(hedge_qty),
             )
 
         # 持有过多 NO，买入
@@ -445,7 +838,7 @@ class MarketMakingStrategy(BaseStrategy):
             self.log.info(f"对冲: 买入 {hedge_qty} 个 YES")
             self.submit_market_order(
                 side=OrderSide.BUY,
-                quantity=Quantity.from_int(hedge_qty),
+                quantity=self._slot.grid.quantity(hedge_qty),
             )
 
     # ========== 初始化 ==========
@@ -454,8 +847,24 @@ class MarketMakingStrategy(BaseStrategy):
         """策略启动"""
         super().on_start()
 
+        # 每个品种构建 tick 网格
+        for instrument_id, slot in self._slots.items():
+            slot.instrument = self.instruments.get(instrument_id)
+            if slot.instrument:
+                slot.grid = TickGrid.from_instrument(slot.instrument)
+
         # 记录初始余额
         account = self.get_account_info()
         if account:
             self._daily_start_balance = account['total_balance'].as_decimal()
             self._daily_start_pnl = account['realized_pnl'].as_decimal()
+
+    def on_stop(self):
+        """策略停止"""
+        # BaseStrategy.on_stop 会撤销所有订单
+        super().on_stop()
+
+        for slot in self._slots.values():
+            slot.quotes.clear()
+            self._cancel_requote_alert(slot)
+            slot.scheduler.reset()
@@ -0,0 +1,88 @@
+"""
+市场槽位 - 多市场做市时每个品种的独立状态
+
+一个策略实例同时为多个 Polymarket 品种报价，共享同一个 TradingNode、
+数据/执行客户端和账户；每个品种的价格历史、波动率、深度、挂单、
+重报调度放在各自的槽位里（__slots__，无实例字典）
+"""
+
+from .depth_tracker import DepthTracker
+from .quote_manager import QuoteManager
+from .requote_scheduler import RequoteScheduler
+from .ring_buffer import RingBuffer
+from .rolling_stats import RollingVolatility
+from .telemetry import UpdateSampler
+
+
+class MarketSlot:
+    """
+    单个品种的做市状态
+
+    Args:
+        instrument_id: 品种 ID
+        volatility_window: 波动率窗口（价格历史保留 2 倍）
+        depth_levels: 深度统计档位数
+        requote_tolerance_ticks: 挂单价格容忍（tick）
+        requote_size_tolerance: 挂单数量容忍
+        requote_trigger_ticks: 盘口移动触发阈值（tick）
+        min_requote_interval_ns: 最小重报间隔（纳秒）
+        max_requote_interval_ns: 心跳重报间隔（纳秒）
+        log_every_n_updates: 日志采样间隔
+    """
+
+    __slots__ = (
+        "instrument_id",
+        "instrument",
+        "grid",
+        "price_history",
+        "volatility",
+        "depth",
+        "quotes",
+        "scheduler",
+        "log_sampler",
+        "requote_alert",
+    )
+
+    def __init__(
+        self,
+        instrument_id,
+        volatility_window: int,
+        depth_levels: int,
+        requote_tolerance_ticks: int,
+        requote_size_tolerance: int,
+        requote_trigger_ticks: int,
+        min_requote_interval_ns: int,
+        max_requote_interval_ns: int,
+        log_every_n_updates: int,
+    ):
+        self.instrument_id = instrument_id
+        self.instrument = None  # on_start 时从 Cache 加载
+        self.grid = None        # 价格 tick 网格（随 Instrument 构建）
+
+        # 价格只存一份：波动率窗口取历史中最新的 volatility_window 个样本
+        self.price_history = RingBuffer(volatility_window * 2)
+        self.volatility = RollingVolatility(volatility_window, buffer=self.price_history)
+        self.depth = DepthTracker(depth_levels)
+        self.quotes = QuoteManager(
+            price_tolerance_ticks=requote_tolerance_ticks,
+            size_tolerance=requote_size_tolerance,
+        )
+        self.scheduler = RequoteScheduler(
+            trigger_ticks=requote_trigger_ticks,
+            min_interval_ns=min_requote_interval_ns,
+            max_interval_ns=max_requote_interval_ns,
+        )
+        self.log_sampler = UpdateSampler(log_every_n_updates)
+        self.requote_alert = None  # 当前补报定时器的名字
+
+    def set_volatility_window(self, volatility_window: int):
+        """调整波动率窗口（价格历史和波动率一起调整，保留最新的样本）"""
+        self.price_history.resize(volatility_window * 2)
+        self.volatility.resize(volatility_window)
+
+    def record_price(self, price: float):
+        """记录中间价（写入共享的价格历史并更新波动率）"""
+        self.volatility.update(price)
+
+    def __repr__(self):
+        return f"MarketSlot({self.instrument_id})"
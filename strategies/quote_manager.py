@@ -0,0 +1,108 @@
+"""
+报价管理器 - 跟踪挂单并做差分
+
+核心原则：
+1. 每个方向（买/卖）最多一个挂单
+2. 新目标与挂单比较：变化在容忍范围内则保留，不发任何消息
+3. 超出容忍范围才撤单重挂（Polymarket 不支持改单）
+
+管理器只做决策和记账，订单的创建、提交、撤销由策略完成
+"""
+
+from typing import Optional
+
+from nautilus_trader.model.enums import OrderSide
+
+
+class LiveQuote:
+    """一个方向上的挂单"""
+
+    __slots__ = ("client_order_id", "price_ticks", "size")
+
+    def __init__(self, client_order_id, price_ticks: int, size: int):
+        self.client_order_id = client_order_id
+        self.price_ticks = price_ticks
+        self.size = size
+
+    def __repr__(self):
+        return (
+            f"LiveQuote({self.client_order_id}, "
+            f"price_ticks={self.price_ticks}, size={self.size})"
+        )
+
+
+class QuoteManager:
+    """
+    报价管理器
+
+    Args:
+        price_tolerance_ticks: 价格变化不超过该 tick 数时保留挂单
+        size_tolerance: 数量变化不超过该值时保留挂单
+    """
+
+    # 决策结果
+    KEEP = "keep"        # 保留挂单
+    NEW = "new"          # 无挂单，新挂
+    REPLACE = "replace"  # 撤单重挂
+
+    def __init__(self, price_tolerance_ticks: int = 0, size_tolerance: int = 0):
+        self.price_tolerance_ticks = price_tolerance_ticks
+        self.size_tolerance = size_tolerance
+
+        self._quotes = {OrderSide.BUY: None, OrderSide.SELL: None}
+        self._sides = {}  # client_order_id -> side
+
+        # 统计
+        self.kept = 0
+        self.submitted = 0
+        self.replaced = 0
+
+    def plan(self, side: OrderSide, price_ticks: int, size: int) -> str:
+        """比较目标报价与挂单，返回 KEEP / NEW / REPLACE"""
+        live = self._quotes[side]
+
+        if live is None:
+            return self.NEW
+
+        if (
+            abs(price_ticks - live.price_ticks) <= self.price_tolerance_ticks
+            and abs(size - live.size) <= self.size_tolerance
+        ):
+            self.kept += 1
+            return self.KEEP
+
+        return self.REPLACE
+
+    def live(self, side: OrderSide) -> Optional[LiveQuote]:
+        """获取某方向的挂单"""
+        return self._quotes[side]
+
+    def track(self, side: OrderSide, client_order_id, price_ticks: int, size: int):
+        """记录新提交的挂单（替换该方向原有记录）"""
+        previous = self._quotes[side]
+        if previous is not None:
+            self._sides.pop(previous.client_order_id, None)
+            self.replaced += 1
+
+        self._quotes[side] = LiveQuote(client_order_id, price_ticks, size)
+        self._sides[client_order_id] = side
+        self.submitted += 1
+
+    def forget(self, client_order_id) -> bool:
+        """
+        订单结束（成交完/撤销/拒绝/过期）时移除记录
+
+        Returns:
+            bool: 是否是被跟踪的挂单
+        """
+        side = self._sides.pop(client_order_id, None)
+        if side is None:
+            return False
+
+        self._quotes[side] = None
+        return True
+
+    def clear(self):
+        """清空所有记录"""
+        self._quotes = {OrderSide.BUY: None, OrderSide.SELL: None}
+        self._sides.clear()
@@ -0,0 +1,124 @@
+"""
+报价计算 - 整数 tick 网格上的做市报价
+
+Polymarket 价格位于固定网格（0.01 / 0.001），热路径上：
+1. 中间价、价差、倾斜用 float 计算
+2. 买价向下、卖价向上取整到 tick（整数）
+3. 直接用 raw 整数构造 Price / Quantity，不经过 Decimal 和字符串
+
+Decimal 只保留在账户、盈亏等会计边界
+"""
+
+import math
+from typing import Optional, Tuple
+
+from nautilus_trader.model.objects import FIXED_PRECISION, Price, Quantity
+
+
+# float 除法误差容忍（0.588 / 0.001 可能得到 587.9999999）
+_TICK_EPSILON = 1e-9
+
+# 1 个数量单位对应的 raw 值
+_UNIT_RAW = 10 ** FIXED_PRECISION
+
+
+class TickGrid:
+    """
+    价格 tick 网格
+
+    Args:
+        tick_size: 最小价格变动（float）
+        price_precision: 价格精度
+        tick_raw: 一个 tick 对应的 Price raw 值
+        size_precision: 数量精度
+    """
+
+    def __init__(
+        self,
+        tick_size: float,
+        price_precision: int,
+        tick_raw: int,
+        size_precision: int = 0,
+    ):
+        if tick_size <= 0:
+            raise ValueError(f"tick_size 必须为正数: {tick_size}")
+
+        self.tick_size = float(tick_size)
+        self.price_precision = price_precision
+        self.tick_raw = tick_raw
+        self.size_precision = size_precision
+
+        # 二元市场价格在 (0, 1) 之间
+        self.max_ticks = int(round(1.0 / self.tick_size))
+
+    @classmethod
+    def from_instrument(cls, instrument) -> "TickGrid":
+        """从 Instrument 构建网格"""
+        increment = instrument.price_increment
+        return cls(
+            tick_size=increment.as_double(),
+            price_precision=instrument.price_precision,
+            tick_raw=increment.raw,
+            size_precision=instrument.size_precision,
+        )
+
+    # ========== 转换 ==========
+
+    def floor_ticks(self, price: float) -> int:
+        """价格向下取整到 tick"""
+        return math.floor(price / self.tick_size + _TICK_EPSILON)
+
+    def ceil_ticks(self, price: float) -> int:
+        """价格向上取整到 tick"""
+        return math.ceil(price / self.tick_size - _TICK_EPSILON)
+
+    def nearest_ticks(self, price: float) -> int:
+        """价格四舍五入到 tick"""
+        return int(round(price / self.tick_size))
+
+    def ticks(self, price: Price) -> int:
+        """Price 转 tick（raw 整数除法）"""
+        return price.raw // self.tick_raw
+
+    def to_float(self, ticks: int) -> float:
+        """tick 转 float 价格（日志/统计用）"""
+        return ticks * self.tick_size
+
+    def price(self, ticks: int) -> Price:
+        """tick 转 Price（raw 整数构造）"""
+        return Price.from_raw(ticks * self.tick_raw, self.price_precision)
+
+    def quantity(self, size: int) -> Quantity:
+        """整数数量转 Quantity（raw 整数构造）"""
+        return Quantity.from_raw(size * _UNIT_RAW, self.size_precision)
+
+    # ========== 报价 ==========
+
+    def quote_ticks(
+        self,
+        mid: float,
+        half_spread: float,
+        skew: float,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        计算买卖报价（tick）
+
+        买价向下取整、卖价向上取整（不会比理论价更激进），
+        并保证至少相差 1 个 tick、落在 (0, 1) 之内
+
+        Returns:
+            (bid_ticks, ask_ticks)，无法形成有效报价时返回 None
+        """
+        bid_ticks = self.floor_ticks(mid * (1.0 - half_spread - skew))
+        ask_ticks = self.ceil_ticks(mid * (1.0 + half_spread + skew))
+
+        if ask_ticks <= bid_ticks:
+            ask_ticks = bid_ticks + 1
+
+        bid_ticks = max(bid_ticks, 1)
+        ask_ticks = min(ask_ticks, self.max_ticks - 1)
+
+        if bid_ticks >= ask_ticks:
+            return None
+
+        return bid_ticks, ask_ticks
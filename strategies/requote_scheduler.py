@@ -0,0 +1,74 @@
+"""
+重报调度器 - 由盘口变化驱动的事件式重报
+
+规则：
+1. 最优买价/卖价相对上次报价时移动 >= trigger_ticks：立即重报
+2. 距上次重报不足 min_interval：合并（记为待处理，稍后补报）
+3. 距上次重报超过 max_interval：心跳重报（库存/波动率可能已变化）
+4. 其他情况：盘口没有实质变化，不重报
+
+时间全部来自策略时钟（clock.timestamp_ns），实盘和回放行为一致
+"""
+
+
+class RequoteScheduler:
+    """
+    重报调度器
+
+    Args:
+        trigger_ticks: 盘口移动触发阈值（tick）
+        min_interval_ns: 两次重报的最小间隔（纳秒）
+        max_interval_ns: 心跳间隔（纳秒），0 表示不做心跳
+    """
+
+    def __init__(self, trigger_ticks: int, min_interval_ns: int, max_interval_ns: int):
+        self.trigger_ticks = max(int(trigger_ticks), 1)
+        self.min_interval_ns = int(min_interval_ns)
+        self.max_interval_ns = int(max_interval_ns)
+
+        self._last_ns = None
+        self._last_bid_ticks = 0
+        self._last_ask_ticks = 0
+
+        # 被最小间隔合并、尚未处理的盘口变化
+        self.pending = False
+
+    def should_requote(self, now_ns: int, bid_ticks: int, ask_ticks: int) -> bool:
+        """判断本次盘口更新是否需要重报"""
+        if self._last_ns is None:
+            return True
+
+        elapsed = now_ns - self._last_ns
+
+        moved = (
+            abs(bid_ticks - self._last_bid_ticks) >= self.trigger_ticks
+            or abs(ask_ticks - self._last_ask_ticks) >= self.trigger_ticks
+        )
+
+        if elapsed < self.min_interval_ns:
+            if moved:
+                self.pending = True
+            return False
+
+        if moved or self.pending:
+            return True
+
+        return 0 < self.max_interval_ns <= elapsed
+
+    def next_allowed_ns(self) -> int:
+        """最早允许下一次重报的时间"""
+        if self._last_ns is None:
+            return 0
+        return self._last_ns + self.min_interval_ns
+
+    def mark(self, now_ns: int, bid_ticks: int, ask_ticks: int):
+        """记录一次重报（参考盘口）"""
+        self._last_ns = now_ns
+        self._last_bid_ticks = bid_ticks
+        self._last_ask_ticks = ask_ticks
+        self.pending = False
+
+    def reset(self):
+        """清空状态（下一次更新立即重报）"""
+        self._last_ns = None
+        self.pending = False
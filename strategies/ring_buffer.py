@@ -0,0 +1,123 @@
+"""
+环形缓冲区 - 预分配的 float64 样本序列
+
+核心原则：
+1. array('d') 连续存储，容量固定，内存恒定
+2. 追加 O(1)，不产生新对象（满时覆盖最旧样本）
+3. 读取最近 N 个样本可以零拷贝（memoryview 分段）或拷贝为列表
+
+波动率、动量、统计等模块共享同一份价格序列
+"""
+
+from array import array
+from typing import List, Optional, Tuple
+
+
+class RingBuffer:
+    """
+    float64 环形缓冲区
+
+    Args:
+        capacity: 最大样本数
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"capacity 必须为正数: {capacity}")
+
+        self._capacity = int(capacity)
+        self._data = array('d', bytes(8 * self._capacity))
+        self._head = 0      # 下一个写入位置
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> float:
+        """按时间顺序索引（0 为最旧，-1 为最新）"""
+        count = self._count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("RingBuffer index out of range")
+        return self._data[(self._head - count + index) % self._capacity]
+
+    def __iter__(self):
+        for view in self.segments(self._count):
+            yield from view
+
+    # ========== 写入 ==========
+
+    def append(self, value: float) -> Optional[float]:
+        """
+        追加样本（O(1)）
+
+        Returns:
+            被覆盖的最旧样本；缓冲区未满时返回 None
+        """
+        head = self._head
+        evicted = None
+
+        if self._count == self._capacity:
+            evicted = self._data[head]
+        else:
+            self._count += 1
+
+        self._data[head] = value
+        self._head = (head + 1) % self._capacity
+        return evicted
+
+    def clear(self):
+        """清空（不释放存储）"""
+        self._head = 0
+        self._count = 0
+
+    def resize(self, capacity: int):
+        """调整容量，保留最新的样本"""
+        if capacity <= 0:
+            raise ValueError(f"capacity 必须为正数: {capacity}")
+
+        keep = self.last(min(self._count, capacity))
+        self._capacity = int(capacity)
+        self._data = array('d', bytes(8 * self._capacity))
+        self._data[:len(keep)] = array('d', keep)
+        self._count = len(keep)
+        self._head = self._count % self._capacity
+
+    # ========== 读取 ==========
+
+    @property
+    def latest(self) -> Optional[float]:
+        """最新样本"""
+        if self._count == 0:
+            return None
+        return self._data[self._head - 1]
+
+    def segments(self, n: int) -> Tuple[memoryview, ...]:
+        """
+        最近 n 个样本的零拷贝视图（按时间顺序，最多两段）
+
+        视图在下一次写入前有效
+        """
+        n = min(n, self._count)
+        if n <= 0:
+            return ()
+
+        view = memoryview(self._data)
+        start = (self._head - n) % self._capacity
+        end = start + n
+
+        if end <= self._capacity:
+            return (view[start:end],)
+        return (view[start:], view[:end - self._capacity])
+
+    def last(self, n: int) -> List[float]:
+        """最近 n 个样本（拷贝为列表，按时间顺序）"""
+        result = []
+        for view in self.segments(n):
+            result.extend(view)
+        return result
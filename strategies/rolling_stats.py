@@ -0,0 +1,328 @@
+"""
+滚动统计 - 做市热路径使用的 O(1) 增量指标
+
+核心原则：
+1. 每个 tick 只做常数次浮点运算，不重新扫描窗口
+2. 固定大小环形缓冲区，内存恒定
+3. 结果与全窗口重算一致（数值误差在浮点范围内）
+
+长时间运行的统计（Paper Trading 多日浸泡）使用同样的原则：
+RunningStats（累计均值 / 方差）、QuantileSketch（分位数）、DrawdownTracker（高水位回撤）、
+DownsampledSeries（降采样时间序列），内存与运行时长无关
+"""
+
+from array import array
+from typing import List, Optional, Tuple
+
+from .latency import LatencyHistogram
+from .ring_buffer import RingBuffer
+
+
+class RollingVolatility:
+    """
+    滚动波动率（变异系数：标准差 / 均值）
+
+    使用滑动窗口 Welford 更新维护均值和二阶矩：
+    - 窗口未满：追加样本
+    - 窗口已满：用新样本替换最旧样本，一次更新完成
+
+    样本直接写入 buffer：传入共享的价格历史（容量 ≥ window）时价格只存一份，
+    窗口取其中最新的 window 个样本；不传时使用自己的缓冲区
+
+    Args:
+        window: 窗口大小（tick 数）
+        min_samples: 样本数少于该值时波动率视为 0
+        buffer: 共享的价格历史 RingBuffer
+    """
+
+    # 每替换这么多个窗口后从缓冲区重算一次，消除累积的浮点漂移
+    RESYNC_WINDOWS = 64
+
+    def __init__(self, window: int, min_samples: int = 10, buffer: Optional[RingBuffer] = None):
+        if window <= 0:
+            raise ValueError(f"window 必须为正数: {window}")
+
+        self.window = int(window)
+        self.min_samples = min_samples
+
+        if buffer is None:
+            buffer = RingBuffer(self.window)
+        elif buffer.capacity < self.window:
+            raise ValueError(f"buffer 容量 {buffer.capacity} 小于窗口 {self.window}")
+
+        self._buffer = buffer
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0      # 离差平方和
+        self._replaced = 0
+
+        if len(buffer):
+            self._resync()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def buffer(self) -> RingBuffer:
+        """样本缓冲区（可能与其他模块共享）"""
+        return self._buffer
+
+    def update(self, value: float):
+        """加入一个新样本（O(1)）"""
+        value = float(value)
+        buffer = self._buffer
+
+        # 离开窗口的样本（共享缓冲区更长时它不会被覆盖，写入前读出）
+        old = buffer[-self.window] if self._count == self.window else None
+        buffer.append(value)
+
+        if old is None:
+            # 窗口未满：标准 Welford 追加
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+            return
+
+        # 窗口已满：用新样本替换最旧样本
+        old_mean = self._mean
+        self._mean = old_mean + (value - old) / self._count
+        self._m2 += (value - old) * (value - self._mean + old - old_mean)
+
+        self._replaced += 1
+        if self._replaced >= self.window * self.RESYNC_WINDOWS:
+            self._resync()
+
+    def resize(self, window: int):
+        """
+        调整窗口，按缓冲区中最新的样本重算
+
+        共享缓冲区需要先由所有者扩容到不小于新窗口
+        """
+        if window <= 0:
+            raise ValueError(f"window 必须为正数: {window}")
+
+        window = int(window)
+        if self._buffer.capacity < window:
+            self._buffer.resize(window)
+
+        self.window = window
+        self._resync()
+
+    def reset(self):
+        """清空窗口（共享缓冲区一并清空）"""
+        self._buffer.clear()
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._replaced = 0
+
+    @property
+    def mean(self) -> float:
+        """窗口均值"""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """窗口总体方差"""
+        if self._count == 0:
+            return 0.0
+        # 浮点抵消可能产生极小的负数
+        return max(self._m2, 0.0) / self._count
+
+    @property
+    def volatility(self) -> float:
+        """当前波动率（标准差 / 均值）"""
+        if self._count < self.min_samples or self._mean <= 0:
+            return 0.0
+        return self.variance ** 0.5 / self._mean
+
+    def _resync(self):
+        """从缓冲区重算均值和二阶矩"""
+        self._count = min(len(self._buffer), self.window)
+        self._replaced = 0
+
+        if self._count == 0:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+
+        values = self._buffer.last(self._count)
+        mean = sum(values) / self._count
+        self._mean = mean
+        self._m2 = sum((v - mean) ** 2 for v in values)
+
+
+# ========== 累计统计 ==========
+
+class RunningStats:
+    """
+    累计均值 / 方差 / 极值（Welford 算法，不保存样本）
+    """
+
+    __slots__ = ("count", "_mean", "_m2", "min", "max")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def update(self, value: float):
+        """加入一个样本（O(1)）"""
+        value = float(value)
+        if self.count == 0:
+            self.min = self.max = value
+        elif value < self.min:
+            self.min = value
+        elif value > self.max:
+            self.max = value
+
+        self.count += 1
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """总体方差"""
+        if self.count == 0:
+            return 0.0
+        return max(self._m2, 0.0) / self.count
+
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+
+
+class QuantileSketch:
+    """
+    分位数草图
+
+    样本乘以 scale 取整后记入对数-线性直方图（与延迟统计相同的 LatencyHistogram），
+    桶数组固定，相对误差 < 1%；样本必须非负
+
+    Args:
+        scale: 定点倍数（1e6 表示分辨率 1e-6）
+    """
+
+    __slots__ = ("scale", "_histogram")
+
+    def __init__(self, scale: float = 1e6):
+        self.scale = scale
+        self._histogram = LatencyHistogram()
+
+    def __len__(self) -> int:
+        return self._histogram.count
+
+    def update(self, value: float):
+        """加入一个样本（O(1)）"""
+        self._histogram.record(round(value * self.scale))
+
+    def quantile(self, q: float) -> float:
+        """分位数（q ∈ [0, 1]；没有样本时为 0）"""
+        return self._histogram.value_at_quantile(q) / self.scale
+
+    def reset(self):
+        self._histogram.reset()
+
+
+class DrawdownTracker:
+    """
+    高水位回撤
+
+    记录权益（或累计盈亏）曲线的历史最高点，回撤 = 最高点 - 当前值；
+    数值类型不限（float / Decimal）
+
+    Args:
+        initial: 曲线起点（累计盈亏从 0 开始时，一开始就亏损也计入回撤）
+    """
+
+    def __init__(self, initial=None):
+        self.peak = initial
+        self.current = initial
+        self.max_drawdown = 0
+        self.max_drawdown_peak = initial      # 最大回撤开始时的高点
+
+    def update(self, equity):
+        """记录一个新的权益值（O(1)）"""
+        if self.peak is None or equity > self.peak:
+            self.peak = equity
+        self.current = equity
+
+        drawdown = self.peak - equity
+        if drawdown > self.max_drawdown:
+            self.max_drawdown = drawdown
+            self.max_drawdown_peak = self.peak
+
+    @property
+    def drawdown(self):
+        """当前回撤"""
+        if self.peak is None:
+            return 0
+        return self.peak - self.current
+
+
+class DownsampledSeries:
+    """
+    定长降采样时间序列
+
+    每 stride 个样本保留一个（保留第 0、stride、2×stride ... 个）；
+    点数达到 capacity 时隔一丢一、stride 翻倍。
+    内存固定，始终覆盖从开始到现在的整段时间，分辨率随时长降低
+
+    Args:
+        capacity: 最多保留的点数
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if capacity < 2:
+            raise ValueError(f"capacity 至少为 2: {capacity}")
+
+        self.capacity = int(capacity)
+        self.stride = 1
+        self.count = 0
+        self.last: Optional[float] = None
+        self._ts = array('q')
+        self._values = array('d')
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def append(self, value: float, ts: int = 0):
+        """加入一个样本（均摊 O(1)）"""
+        index = self.count
+        self.count += 1
+        self.last = value
+
+        if index % self.stride:
+            return
+
+        if len(self._values) == self.capacity:
+            self._ts = self._ts[::2]
+            self._values = self._values[::2]
+            self.stride *= 2
+            if index % self.stride:
+                return
+
+        self._ts.append(ts)
+        self._values.append(value)
+
+    def points(self) -> List[Tuple[int, float]]:
+        """保留的 (时间戳, 值)，按时间顺序"""
+        return list(zip(self._ts, self._values))
+
+    def reset(self):
+        self.stride = 1
+        self.count = 0
+        self.last = None
+        self._ts = array('q')
+        self._values = array('d')
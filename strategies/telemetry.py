@@ -0,0 +1,66 @@
+"""
+遥测日志 - 热路径上的惰性、分级、采样日志
+
+NautilusTrader 的 Logger 在 Python 侧不做级别判断，f-string 在调用前
+就已构建完成。这里在策略侧先判断级别和采样，只有真正输出时才格式化，
+输出紧凑的 key=value 记录，便于检索和解析
+"""
+
+# 日志级别（数值越大越重要）
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+_LEVELS = {
+    "DEBUG": DEBUG,
+    "INFO": INFO,
+    "WARNING": WARNING,
+    "WARN": WARNING,
+    "ERROR": ERROR,
+}
+
+
+def parse_level(name, default: int = INFO) -> int:
+    """解析级别名称（未知名称使用默认级别）"""
+    if isinstance(name, int):
+        return name
+    return _LEVELS.get(str(name).upper(), default)
+
+
+def format_kv(event: str, fields: dict) -> str:
+    """
+    格式化为 key=value 记录
+
+    float 保留 4 位小数，其余使用 str()
+
+    Example:
+        quote mid=0.6000 bid=0.594 ask=0.606 size=20
+    """
+    parts = [event]
+    for key, value in fields.items():
+        if isinstance(value, float):
+            parts.append(f"{key}={value:.4f}")
+        else:
+            parts.append(f"{key}={value}")
+    return " ".join(parts)
+
+
+class UpdateSampler:
+    """
+    更新采样器
+
+    每 N 次更新输出一次，或在发生实质变化时立即输出
+
+    Args:
+        every_n: 采样间隔（<= 1 表示每次都输出）
+    """
+
+    def __init__(self, every_n: int = 1):
+        self.every_n = max(int(every_n), 1)
+        self.count = 0
+
+    def should_emit(self, changed: bool = False) -> bool:
+        """记录一次更新，返回本次是否需要输出"""
+        self.count += 1
+        return changed or self.count % self.every_n == 0
@@ -1,13 +1,14 @@
 """
 Paper Trading 测试脚本
 
-目的：模拟真实交易环境，使用实时订单簿数据，不真实下单
-时间：可配置（默认 60 分钟）
+目的：在本地模拟 Polymarket 交易所上回放录制的订单簿数据，不真实下单
+撮合：价格穿过挂单时按订单簿成交；停在挂单价位时按排队位置成交
+时间：可配置（默认回放前 60 分钟的行情），回放速度不受墙钟限制
 
 运行方法：
-    python tests/test_paper_trading.py --duration=60
-    python tests/test_paper_trading.py --duration=240 --verbose
-    python tests/test_paper_trading.py --duration=60 --stats
+    python tests/test_paper_trading.py --catalog data/catalog --duration=60
+    python tests/test_paper_trading.py --catalog data/catalog --duration=240 --verbose
+    python tests/test_paper_trading.py --catalog data/catalog --duration=60 --stats
 """
 
 import os
@@ -24,11 +25,11 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 try:
-    from nautilus_trader.live.node import TradingNode
-    from nautilus_trader.config import TradingNodeConfig, LoggingConfig
-    from nautilus_trader.config import LiveExecClientConfig, LiveDataClientConfig
-    from nautilus_trader.model.enums import OrderSide, BookType
-    from strategies.market_making_strategy import MarketMakingStrategy
+    from nautilus_trader.model.enums import OrderSide, OrderType
+    from backtest.harness import load_catalog
+    from backtest.paper import run_paper_trading
+    from config.strategy_config import MarketMakingConfig
+    from strategies.rolling_stats import DownsampledSeries, DrawdownTracker, QuantileSketch, RunningStats
 except ImportError as e:
     print(f"❌ 导入失败: {e}")
     print("\n请确保已安装 NautilusTrader:")
@@ -38,9 +39,8 @@ except ImportError as e:
 
 # ========== 配置 ==========
 
-INSTRUMENT_ID = "POLY-BTC-USD.POLYMARKET"
-PRIVATE_KEY = os.getenv("POLYMARKET_PK", "0x" + "1" * 64)  # 可选
-SIGNATURE_TYPE = 0
+CATALOG_PATH = os.getenv("POLYMARKET_CATALOG", "data/catalog")  # 录制数据目录
+STARTING_BALANCE = Decimal("1000")
 
 # Paper Trading 配置
 PAPER_CONFIG = {
@@ -71,7 +71,14 @@ PAPER_CONFIG = {
 # ========== 统计类 ==========
 
 class PaperTradingStats:
-    """Paper Trading 统计"""
+    """
+    Paper Trading 统计
+
+    全部为流式统计，内存与运行时长无关，报告随时可以 O(1) 生成（多日浸泡也一样）：
+    价差为累计均值 / 方差 + 分位数草图，盈亏曲线跟踪高水位回撤，库存为降采样时间序列
+    """
+
+    INVENTORY_POINTS = 1024     # 库存序列最多保留的点数
 
     def __init__(self):
         self.start_time = None
@@ -90,19 +97,72 @@ class PaperTradingStats:
         self.total_pnl = Decimal("0")
 
         # 做市统计
-        self.spreads = []  # 记录每次交易的价差
-        self.inventory_history = []  # 记录库存历史
+        self.spread_stats = RunningStats()              # 每笔交易的价差
+        self.spread_quantiles = QuantileSketch()
+        self.pnl_drawdown = DrawdownTracker(initial=Decimal("0"))   # 累计已实现盈亏的回撤
+        self.inventory_history = DownsampledSeries(self.INVENTORY_POINTS)   # (时间戳, 库存)
 
         # 风险统计
         self.volatility_protection_triggered = 0
         self.hedge_triggered = 0
         self.max_inventory_reached = 0
+        self.max_inventory = 0  # 期间最大绝对库存
+
+        # 每个仓位上一次的数量（用于判断成交是开仓还是平仓）
+        self._position_qty = {}
+
+    # ========== 事件 ==========
+
+    def on_event(self, event):
+        """订单 / 仓位事件（来自模拟交易所的真实事件）"""
+        name = type(event).__name__
+
+        if name == "OrderSubmitted":
+            self.orders_placed += 1
+        elif name == "OrderInitialized":
+            self._record_order(event)
+        elif name == "OrderFilled":
+            self.orders_filled += 1
+        elif name in ("PositionOpened", "PositionChanged", "PositionClosed"):
+            self._record_position(event)
+
+    def _record_order(self, event):
+        """按方向 / 类型统计订单（市价单来自对冲）"""
+        if event.order_type == OrderType.MARKET:
+            self.hedge_triggered += 1
+        elif event.side == OrderSide.BUY:
+            self.bid_orders += 1
+        else:
+            self.ask_orders += 1
+
+    def _record_position(self, event):
+        """仓位变化：减仓部分记为一笔交易（盈亏取已实现盈亏的增量）"""
+        key = event.position_id
+        previous_qty, previous_pnl = self._position_qty.get(key, (0.0, Decimal("0")))
+
+        qty = float(event.signed_qty)
+        realized = event.realized_pnl.as_decimal() if event.realized_pnl is not None else Decimal("0")
+        self._position_qty[key] = (qty, realized)
+
+        if abs(qty) < abs(previous_qty) or qty * previous_qty < 0:
+            entry = event.avg_px_open
+            spread = abs(event.last_px.as_double() - entry) / entry if entry else 0.0
+            self.record_trade(realized - previous_pnl, Decimal(str(spread)))
+
+        self.record_inventory(qty, event.ts_event)
+
+    def record_inventory(self, qty: float, ts: int = 0):
+        """记录库存"""
+        self.inventory_history.append(qty, ts)
+        self.max_inventory = max(self.max_inventory, abs(qty))
 
     def record_trade(self, pnl: Decimal, spread: Decimal):
         """记录交易"""
         self.total_trades += 1
         self.total_pnl += pnl
-        self.spreads.append(float(spread))
+        self.spread_stats.update(float(spread))
+        self.spread_quantiles.update(float(spread))
+        self.pnl_drawdown.update(self.total_pnl)
 
         if pnl > 0:
             self.winning_trades += 1
@@ -123,14 +183,23 @@ class PaperTradingStats:
 
     def get_avg_spread(self) -> float:
         """获取平均价差"""
-        if not self.spreads:
-            return 0.0
-        return sum(self.spreads) / len(self.spreads)
+        return self.spread_stats.mean
+
+    def get_spread_std(self) -> float:
+        """获取价差标准差"""
+        return self.spread_stats.std
+
+    def get_spread_quantile(self, q: float) -> float:
+        """获取价差分位数（相对误差 < 1%）"""
+        return self.spread_quantiles.quantile(q)
 
     def get_max_drawdown(self) -> Decimal:
-        """获取最大回撤（简化计算）"""
-        # 这里简化处理，实际应该记录最高点和最低点
-        return Decimal("0")
+        """获取最大回撤（累计已实现盈亏相对历史最高点的最大回落）"""
+        return Decimal(self.pnl_drawdown.max_drawdown)
+
+    def get_final_inventory(self) -> float:
+        """获取最新库存"""
+        return self.inventory_history.last or 0.0
 
     def get_inventory_turnover(self, final_inventory: int) -> float:
         """获取库存周转率"""
@@ -144,14 +213,24 @@ class PaperTradingStats:
 class PaperTradingTester:
     """Paper Trading 测试器"""
 
-    def __init__(self, duration_minutes: int, verbose: bool = False, show_stats: bool = False):
+    def __init__(
+        self,
+        duration_minutes: int,
+        verbose: bool = False,
+        show_stats: bool = False,
+        catalog: str = CATALOG_PATH,
+        instrument_ids: Optional[List[str]] = None,
+        latency_ms: float = 0.0,
+    ):
         self.duration_minutes = duration_minutes
         self.verbose = verbose
         self.show_stats = show_stats
+        self.catalog = catalog
+        self.instrument_ids = instrument_ids
+        self.latency_ms = latency_ms
 
         self.stats = PaperTradingStats()
-        self.node = None
-        self.strategy = None
+        self.result = None
 
         self._last_stats_time = None
         self._stats_interval = 60  # 每 60 秒打印一次统计
@@ -162,8 +241,9 @@ class PaperTradingTester:
         print("Market Making Strategy - Paper Trading")
         print("=" * 80)
         print(f"\n开始时间: {datetime.utcnow()}")
-        print(f"运行时长: {self.duration_minutes} 分钟")
-        print(f"模式: Paper Trading (模拟交易，不真实下单)")
+        print(f"回放时长: {self.duration_minutes} 分钟行情")
+        print(f"数据: {self.catalog}")
+        print(f"模式: Paper Trading (本地模拟交易所，不真实下单)")
         print("\n" + "=" * 80)
 
     def print_config(self):
@@ -185,9 +265,10 @@ class PaperTradingTester:
                 return
 
         self._last_stats_time = now
+        elapsed = (datetime.utcnow() - self.stats.start_time).total_seconds()
 
         print(f"\n{'='*80}")
-        print(f"📊 实时统计 (运行 {int(now - self.stats.start_time)} 秒)")
+        print(f"📊 实时统计 (运行 {int(elapsed)} 秒)")
         print(f"{'='*80}")
 
         print(f"\n订单:")
@@ -221,6 +302,12 @@ class PaperTradingTester:
         print("=" * 80)
 
         print(f"\n时长: {duration:.1f} 分钟")
+        if self.result is not None:
+            print(
+                f"回放: {self.result.events} 条行情 "
+                f"({self.result.events_per_second:,.0f} 条/秒)"
+            )
+            print(f"总盈亏（含持仓估值）: {self.result.pnl:+.2f} USDC")
         print(f"已下单: {self.stats.orders_placed} ({self.stats.bid_orders} 买单, {self.stats.ask_orders} 卖单)")
         print(f"已成交: {self.stats.orders_filled} ({self.stats.get_fill_rate():.1f}% 成交率)")
 
@@ -230,11 +317,16 @@ class PaperTradingTester:
             print(f"  获胜: {self.stats.winning_trades} ({self.stats.get_win_rate():.1f}%)")
             print(f"  亏损: {self.stats.losing_trades}")
             print(f"  总盈亏: {self.stats.total_pnl:.2f} USDC")
-            print(f"  平均价差: {self.stats.get_avg_spread()*100:.2f}%")
+            print(f"  平均价差: {self.stats.get_avg_spread()*100:.2f}% (标准差 {self.stats.get_spread_std()*100:.2f}%)")
+            print(
+                f"  价差分位数: p50 {self.stats.get_spread_quantile(0.5)*100:.2f}% / "
+                f"p90 {self.stats.get_spread_quantile(0.9)*100:.2f}% / "
+                f"p99 {self.stats.get_spread_quantile(0.99)*100:.2f}%"
+            )
             print(f"  最大回撤: {self.stats.get_max_drawdown():.2f} USDC")
 
-            if self.stats.inventory_history:
-                final_inventory = self.stats.inventory_history[-1]
+            if self.stats.inventory_history.count:
+                final_inventory = self.stats.get_final_inventory()
                 turnover = self.stats.get_inventory_turnover(abs(final_inventory))
                 print(f"  库存周转率: {turnover:.2f}x")
 
@@ -270,26 +362,44 @@ class PaperTradingTester:
         self.print_banner()
         self.print_config()
 
-        print("\n⏳ 正在初始化 Paper Trading...")
-        print("提示: 这将连接到 Polymarket 实时 API，但不会真实下单\n")
-
-        # 注意：这里只是示例框架
-        # 实际实现需要完整的 NautilusTrader 集成
-        print("❌ Paper Trading 框架尚未完成")
-        print("\n原因:")
-        print("1. NautilusTrader 的 Paper Trading 模式需要额外配置")
-        print("2. 需要创建 MockExecutionClient 和 MockDataClient")
-        print("3. 需要实现订单簿模拟和订单成交模拟")
-        print("\n替代方案:")
-        print("1. 使用单元测试验证计算逻辑")
-        print("2. 使用快速验证脚本检查基本功能")
-        print("3. 直接使用真实 Paper Trading 模式（小资金测试）")
-        print("\n建议:")
-        print("  python tests/quick_validation.py")
-        print("  pytest tests/unit/test_market_making.py -v")
-        print("  python run_market_making.py --mode paper --duration=60")
+        print("\n⏳ 正在加载录制数据...")
+        instruments, data = load_catalog(self.catalog, self.instrument_ids)
+        data = self._limit_duration(data)
+        print(f"✅ {len(instruments)} 个品种, {len(data)} 条行情")
+
+        config = MarketMakingConfig(
+            instrument_ids=tuple(str(instrument.id) for instrument in instruments),
+            telemetry_level="INFO" if self.verbose else "WARNING",
+            **PAPER_CONFIG,
+        )
+
+        self.stats.start_time = datetime.utcnow()
+        self.result = run_paper_trading(
+            instruments,
+            data,
+            config,
+            on_event=self._on_event,
+            starting_balance=STARTING_BALANCE,
+            latency_ms=self.latency_ms,
+            log_level="INFO" if self.verbose else "ERROR",
+        )
+
+        self.print_final_report()
+        return 0
 
-        return 1
+    def _limit_duration(self, data):
+        """只保留前 duration_minutes 分钟的行情"""
+        if not data:
+            return data
+
+        data = sorted(data, key=lambda item: item.ts_init)
+        cutoff = data[0].ts_init + self.duration_minutes * 60 * 1_000_000_000
+        return [item for item in data if item.ts_init <= cutoff]
+
+    def _on_event(self, event):
+        self.stats.on_event(event)
+        if self.show_stats:
+            self.print_stats()
 
 
 # ========== 主函数 ==========
@@ -315,13 +425,32 @@ def main():
         action="store_true",
         help="显示实时统计"
     )
+    parser.add_argument(
+        "--catalog",
+        default=CATALOG_PATH,
+        help=f"录制数据目录（ParquetDataCatalog），默认 {CATALOG_PATH}"
+    )
+    parser.add_argument(
+        "--instrument",
+        action="append",
+        help="品种 ID（可多次指定，默认全部）"
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="模拟交易所延迟（毫秒）"
+    )
 
     args = parser.parse_args()
 
     tester = PaperTradingTester(
         duration_minutes=args.duration,
         verbose=args.verbose,
-        show_stats=args.stats
+        show_stats=args.stats,
+        catalog=args.catalog,
+        instrument_ids=args.instrument,
+        latency_ms=args.latency_ms,
     )
 
     try:
@@ -0,0 +1,175 @@
+"""
+回测框架单元测试
+
+测试范围：
+- 增量按 F_LAST 合并为批次
+- 回测结果可复现
+- 有交易所延迟时每个方向最多一个未结束的挂单
+- 从 ParquetDataCatalog 离线读取
+
+运行方法：
+    pytest tests/unit/test_backtest_harness.py -v
+"""
+
+import random
+
+import pytest
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.model.data import BookOrder, OrderBookDelta, TradeTick
+from nautilus_trader.model.enums import AggressorSide, BookAction, OrderSide, RecordFlag
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.objects import Price, Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.harness import group_deltas, load_catalog, run_backtest
+from config.strategy_config import MarketMakingConfig
+
+
+START_NS = 1_700_000_000_000_000_000
+STEP_NS = 100_000_000  # 100ms
+
+
+@pytest.fixture(scope="module")
+def instrument():
+    return TestInstrumentProvider.binary_option()
+
+
+def make_session(instrument, steps=300, seed=7):
+    """随机游走（含跳价）的 3 档订单簿 + 成交（逐条增量，未分批）"""
+    rng = random.Random(seed)
+    deltas, trades = [], []
+    mid = 500
+    ts = START_NS
+
+    for i in range(steps):
+        ts += STEP_NS
+        mid = max(200, min(800, mid + rng.choice([-15, -3, -1, 0, 0, 1, 3, 15])))
+
+        deltas.append(OrderBookDelta.clear(instrument.id, i, ts, ts))
+        for level in range(3):
+            for side, ticks in ((OrderSide.BUY, mid - 1 - level), (OrderSide.SELL, mid + 1 + level)):
+                last = level == 2 and side == OrderSide.SELL
+                deltas.append(OrderBookDelta(
+                    instrument.id,
+                    BookAction.ADD,
+                    BookOrder(side, Price(ticks / 1000, 3), Quantity(50, 2), 0),
+                    RecordFlag.F_LAST if last else 0,
+                    i,
+                    ts,
+                    ts,
+                ))
+
+        if i % 5 == 0:
+            aggressor = rng.choice([AggressorSide.BUYER, AggressorSide.SELLER])
+            ticks = mid + (15 if aggressor == AggressorSide.BUYER else -15)
+            trades.append(TradeTick(
+                instrument.id,
+                Price(ticks / 1000, 3),
+                Quantity(10, 2),
+                aggressor,
+                TradeId(str(i)),
+                ts + 1,
+                ts + 1,
+            ))
+
+    return deltas, trades
+
+
+def make_config(instrument, **kwargs):
+    return MarketMakingConfig(
+        instrument_id=str(instrument.id),
+        order_size=5,
+        min_order_size=1,
+        telemetry_level="ERROR",
+        **kwargs,
+    )
+
+
+def test_group_deltas_splits_on_f_last(instrument):
+    """每个 F_LAST 结束一个批次"""
+    deltas, _ = make_session(instrument, steps=4)
+    batches = group_deltas(deltas)
+
+    assert len(batches) == 4
+    assert all(len(batch.deltas) == 7 for batch in batches)
+
+
+def test_group_deltas_splits_on_timestamp(instrument):
+    """没有 F_LAST 时按时间戳切分"""
+    deltas = [OrderBookDelta.clear(instrument.id, 0, START_NS + i, START_NS + i) for i in range(3)]
+    assert len(group_deltas(deltas)) == 3
+
+
+def test_backtest_is_deterministic(instrument):
+    """同样的数据和参数得到同样的结果"""
+    deltas, trades = make_session(instrument)
+    data = group_deltas(deltas) + trades
+
+    first = run_backtest([instrument], data, make_config(instrument))
+    second = run_backtest([instrument], data, make_config(instrument))
+
+    assert first.orders > 0
+    assert first.fills > 0
+    assert (first.orders, first.fills, first.pnl) == (second.orders, second.fills, second.pnl)
+
+
+class OrderCounter(Actor):
+    """每次盘口更新时统计各方向未结束（已挂出或在途）的订单数，记录最大值"""
+
+    def __init__(self, instrument_id):
+        super().__init__()
+        self.instrument_id = instrument_id
+        self.max_working = {OrderSide.BUY: 0, OrderSide.SELL: 0}
+
+    def on_start(self):
+        self.subscribe_order_book_deltas(self.instrument_id)
+
+    def on_order_book_deltas(self, deltas):
+        cache = self.cache
+        for side in self.max_working:
+            # 撤单中的订单既是 open 又是 inflight，按订单 ID 去重
+            working = {
+                order.client_order_id
+                for order in cache.orders_open(instrument_id=self.instrument_id, side=side)
+                + cache.orders_inflight(instrument_id=self.instrument_id, side=side)
+            }
+            self.max_working[side] = max(self.max_working[side], len(working))
+
+
+@pytest.mark.parametrize("latency_ms", [50, 300])
+def test_one_working_order_per_side_with_latency(instrument, latency_ms):
+    """交易所延迟下，未确认的挂单不会被丢下而常驻盘口"""
+    deltas, trades = make_session(instrument)
+    counter = OrderCounter(instrument.id)
+
+    result = run_backtest(
+        [instrument],
+        group_deltas(deltas) + trades,
+        make_config(instrument),
+        latency_ms=latency_ms,
+        actors=[counter],
+    )
+
+    assert result.orders > 10
+    assert counter.max_working == {OrderSide.BUY: 1, OrderSide.SELL: 1}
+
+
+def test_backtest_from_catalog(instrument, tmp_path):
+    """从 catalog 离线读取并回测"""
+    from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+    deltas, trades = make_session(instrument, steps=100)
+    catalog = ParquetDataCatalog(str(tmp_path))
+    catalog.write_data([instrument])
+    catalog.write_data(deltas)
+    catalog.write_data(trades)
+
+    instruments, data = load_catalog(str(tmp_path))
+    assert [i.id for i in instruments] == [instrument.id]
+    assert len(data) == 100 + len(trades)
+
+    result = run_backtest(instruments, data, make_config(instrument))
+    assert result.events == len(deltas) + len(trades)
+    assert result.orders > 0
+    assert "回测结果" in result.summary()
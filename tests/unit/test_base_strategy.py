@@ -0,0 +1,117 @@
+"""
+BaseStrategy 快照单元测试
+
+测试范围：
+- 同一 tick 内多次查询仓位/账户只读取一次 Cache/Portfolio
+- 成交、撤单、仓位、账户状态事件使快照失效
+- 账户状态事件通过消息总线订阅，停止后退订
+
+运行方法：
+    pytest tests/unit/test_base_strategy.py -v
+"""
+
+import pytest
+
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.position import Position
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
+
+from backtest.harness import build_engine
+from strategies.market_making_strategy import MarketMakingStrategy
+from tests.unit.test_backtest_harness import make_config
+
+
+@pytest.fixture
+def instrument():
+    return TestInstrumentProvider.binary_option()
+
+
+@pytest.fixture
+def strategy(instrument):
+    engine = build_engine([instrument])
+    strategy = MarketMakingStrategy(make_config(instrument))
+    engine.add_strategy(strategy)
+    strategy.start()
+    yield strategy
+    if strategy.is_running:
+        strategy.stop()
+    engine.dispose()
+
+
+def count_loads(strategy, monkeypatch):
+    """统计 Cache/Portfolio 读取次数"""
+    loads = {"position": 0, "account": 0}
+
+    def wrap(name, key):
+        original = getattr(strategy, name)
+
+        def load():
+            loads[key] += 1
+            return original()
+
+        monkeypatch.setattr(strategy, name, load)
+
+    wrap("_load_current_position", "position")
+    wrap("_load_account_info", "account")
+    return loads
+
+
+def query(strategy, times=3):
+    for _ in range(times):
+        strategy.get_current_position()
+        strategy.get_account_info()
+
+
+def test_snapshot_is_read_once_per_tick(strategy, monkeypatch):
+    loads = count_loads(strategy, monkeypatch)
+
+    for tick in range(1, 4):
+        # 新 tick 开始
+        strategy.invalidate_snapshots()
+        query(strategy)
+        assert loads == {"position": tick, "account": tick}
+
+
+def test_events_invalidate_snapshot(strategy, instrument, monkeypatch):
+    order = TestExecStubs.limit_order(instrument=instrument)
+    fill = TestEventStubs.order_filled(order, instrument, position_id=PositionId("P-1"))
+    position = Position(instrument=instrument, fill=fill)
+    opened = TestEventStubs.position_opened(position)
+    changed = TestEventStubs.position_changed(position)
+
+    close = TestExecStubs.limit_order(instrument=instrument, order_side=OrderSide.SELL)
+    position.apply(TestEventStubs.order_filled(close, instrument, position_id=position.id))
+    account_state = TestEventStubs.cash_account_state()
+
+    events = [
+        (strategy.on_order_filled, fill),
+        (strategy.on_order_canceled, TestEventStubs.order_canceled(order)),
+        (strategy.on_position_opened, opened),
+        (strategy.on_position_changed, changed),
+        (strategy.on_position_closed, TestEventStubs.position_closed(position)),
+        # 账户状态由 Portfolio 发布到消息总线，而不是派发给 Strategy
+        (
+            lambda event: strategy.msgbus.publish(topic=f"events.account.{event.account_id}", msg=event),
+            account_state,
+        ),
+    ]
+
+    for handler, event in events:
+        query(strategy)
+        loads = count_loads(strategy, monkeypatch)
+
+        handler(event)
+        query(strategy)
+
+        assert loads == {"position": 1, "account": 1}, event
+        monkeypatch.undo()
+
+
+def test_account_topic_unsubscribed_on_stop(strategy):
+    assert strategy.msgbus.is_subscribed(topic=strategy.ACCOUNT_TOPIC, handler=strategy.on_account_state)
+
+    strategy.stop()
+    assert not strategy.msgbus.is_subscribed(topic=strategy.ACCOUNT_TOPIC, handler=strategy.on_account_state)
@@ -0,0 +1,70 @@
+"""
+微基准单元测试
+
+测试范围：
+- 循环次数自动确定、逐次采样
+- 基线读写与回归判断
+- 策略基准用例在合成订单簿上运行，命令行回归时返回 1
+
+运行方法：
+    pytest tests/unit/test_bench.py -v
+"""
+
+import json
+
+from diagnostics.bench import Timing, compare, from_samples, load_baseline, measure, save_baseline
+from diagnostics.strategy_bench import CASES, run_strategy_bench
+from run_benchmarks import main
+
+
+def test_measure_and_samples():
+    calls = []
+    timing = measure(lambda: calls.append(1), repeat=3, min_time=0.001)
+
+    assert timing.loops in {10**k * f for k in range(8) for f in (1, 2, 5)}
+    assert len(timing.samples) == 3
+    assert len(calls) >= timing.loops * 4          # 校准 + 3 轮
+    assert timing.value_ns == timing.min_ns
+
+    sampled = from_samples([1000] * 10 + [10, 20, 30, 40], warmup=0.5)
+    assert sampled.per_call
+    assert sampled.samples == [1000.0] * 3 + [10.0, 20.0, 30.0, 40.0]     # 丢弃前一半预热样本
+    assert sampled.value_ns == sampled.median_ns == 40.0
+
+
+def test_baseline_compare(tmp_path):
+    path = tmp_path / "baseline.json"
+    save_baseline(path, {"fast": Timing(10, [100.0, 120.0]), "slow": Timing(1, [50.0, 70.0, 90.0], per_call=True)})
+
+    baseline = load_baseline(path)
+    assert baseline["results"]["fast"]["value_ns"] == 100.0
+    assert baseline["results"]["slow"]["value_ns"] == 70.0
+    assert "python" in baseline["machine"]
+    assert load_baseline(tmp_path / "missing.json") is None
+
+    rows = compare(
+        {"fast": Timing(10, [125.0]), "slow": Timing(1, [95.0], per_call=True), "new": Timing(1, [1.0])},
+        baseline,
+        threshold=0.3,
+    )
+    status = {row.name: (round(row.ratio, 2) if row.ratio else None, row.regressed) for row in rows}
+    assert status == {"fast": (1.25, False), "slow": (1.36, True), "new": (None, False)}
+
+
+def test_strategy_bench_and_cli(tmp_path):
+    results = run_strategy_bench(updates=120, levels=10, repeat=2, min_time=0.001)
+
+    assert list(results) == list(CASES)
+    assert all(timing.value_ns > 0 for timing in results.values())
+    assert results["on_order_book"].per_call and len(results["on_order_book"].samples) >= 100
+
+    path = tmp_path / "baseline.json"
+    args = ["--baseline", str(path), "--updates", "120", "--levels", "10", "--repeat", "2", "--min-time", "0.001"]
+    assert main(args + ["--save", "--case", "check_risk"]) == 0
+
+    # 基线改为 1ns：必然回归
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+    baseline["results"]["check_risk"]["value_ns"] = 1.0
+    path.write_text(json.dumps(baseline), encoding="utf-8")
+    assert main(args + ["--case", "check_risk", "--retries", "0"]) == 1
+    assert main(args + ["--case", "bogus"]) == 2
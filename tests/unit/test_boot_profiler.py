@@ -0,0 +1,98 @@
+"""
+启动剖析单元测试
+
+测试范围：
+- 阶段 / 里程碑计时与报告输出
+- 导入计时（自身 / 累计耗时，loader 复原）
+- BootMarker 在事件循环中标记第一笔行情、报价和确认
+
+运行方法：
+    pytest tests/unit/test_boot_profiler.py -v
+"""
+
+import json
+import sys
+import time
+
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.harness import build_engine, group_deltas
+from diagnostics.boot import BootProfiler, ImportTimer, boot_marker
+from strategies.market_making_strategy import MarketMakingStrategy
+from tests.unit.test_backtest_harness import make_config, make_session
+
+
+def test_phases_and_milestones(tmp_path):
+    profiler = BootProfiler(started_at=time.perf_counter())
+
+    with profiler.phase("lookup"):
+        time.sleep(0.01)
+    first = profiler.mark("first_quote")
+    profiler.mark("first_quote")
+
+    (interpreter, _, _), (name, start, end) = profiler.phases
+    assert interpreter == "interpreter"
+    assert name == "lookup" and end - start >= 0.01
+    assert profiler.milestones == [("first_quote", first)]
+
+    lines = []
+    path = tmp_path / "boot" / "report.json"
+    assert profiler.finish(path, out=lines.append)
+    assert not profiler.finish(path, out=lines.append)     # 只输出一次
+
+    assert len(lines) == 1 and "lookup" in lines[0] and "@ first_quote" in lines[0]
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert [p["name"] for p in report["phases"]] == ["interpreter", "lookup"]
+    assert report["milestones"]["first_quote"] >= 10
+
+
+def test_import_timer(tmp_path, monkeypatch):
+    package = tmp_path / "slowpkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("import time\nfrom . import child\ntime.sleep(0.01)\n")
+    (package / "child.py").write_text("import time\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    timer = ImportTimer().install()
+    try:
+        import slowpkg
+    finally:
+        timer.uninstall()
+        sys.modules.pop("slowpkg.child", None)
+        sys.modules.pop("slowpkg", None)
+
+    records = {name: (self_time, cumulative, depth) for name, self_time, cumulative, depth in timer.records}
+    child_self, child_total, child_depth = records["slowpkg.child"]
+    parent_self, parent_total, parent_depth = records["slowpkg"]
+
+    assert (parent_depth, child_depth) == (0, 1)
+    assert child_self >= 0.02
+    assert 0.01 <= parent_self < parent_total
+    assert parent_total >= child_total + parent_self - 1e-6
+    assert timer.by_package()["slowpkg"] >= 0.03
+    assert timer not in sys.meta_path
+
+    # 模块上留下的是原 loader
+    assert type(slowpkg.__loader__).__name__ == "SourceFileLoader"
+    assert type(slowpkg.__spec__.loader).__name__ == "SourceFileLoader"
+
+
+def test_boot_marker_in_backtest():
+    instrument = TestInstrumentProvider.binary_option()
+    deltas, trades = make_session(instrument, steps=50)
+    profiler = BootProfiler(started_at=time.perf_counter())
+    ready = []
+
+    engine = build_engine([instrument])
+    try:
+        engine.add_strategy(MarketMakingStrategy(make_config(instrument)))
+        engine.add_actor(boot_marker(profiler, on_ready=lambda: ready.append(True)))
+        engine.add_data(group_deltas(deltas) + trades)
+        engine.run()
+    finally:
+        engine.dispose()
+
+    marks = dict(profiler.milestones)
+    assert list(marks) == ["node_started", "first_book", "first_quote", "first_ack"]
+    assert marks["node_started"] <= marks["first_book"] <= marks["first_quote"] <= marks["first_ack"]
+    assert ready == [True]
@@ -0,0 +1,132 @@
+"""
+深度跟踪单元测试
+
+测试范围：
+- 增量维护的前 N 档累计与全量重算一致
+- CLEAR / DELETE / UPDATE 处理
+- 深度失衡
+
+运行方法：
+    pytest tests/unit/test_depth_tracker.py -v
+"""
+
+import random
+
+import pytest
+
+from nautilus_trader.model.data import BookOrder, OrderBookDelta
+from nautilus_trader.model.enums import BookAction, OrderSide
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.objects import Price, Quantity
+
+from strategies.depth_tracker import DepthTracker
+
+
+INSTRUMENT_ID = InstrumentId.from_str("POLY-BTC-USD.POLYMARKET")
+
+
+def _delta(action, side, price, size):
+    """构造一条 L2 增量"""
+    order = BookOrder(side, Price(price, 3), Quantity(size, 2), 0)
+    return OrderBookDelta(INSTRUMENT_ID, action, order, 0, 0, 0, 0)
+
+
+def _top_depth(levels, depth, best_first):
+    """参考实现：排序后取前 N 档"""
+    prices = sorted(levels, reverse=best_first)[:depth]
+    return sum(levels[p] for p in prices)
+
+
+def test_empty_tracker():
+    """未收到增量时未初始化、深度为 0"""
+    tracker = DepthTracker(depth=5)
+
+    assert tracker.initialized is False
+    assert tracker.bid_depth == 0.0
+    assert tracker.imbalance == 0.0
+
+
+def test_top_levels_only():
+    """只统计前 N 档"""
+    tracker = DepthTracker(depth=2)
+
+    for price in (0.50, 0.49, 0.48):
+        tracker.apply(_delta(BookAction.ADD, OrderSide.BUY, price, 10))
+    for price in (0.52, 0.53, 0.54):
+        tracker.apply(_delta(BookAction.ADD, OrderSide.SELL, price, 20))
+
+    assert tracker.initialized is True
+    assert tracker.bid_depth == 20.0
+    assert tracker.ask_depth == 40.0
+    assert tracker.avg_depth == 30.0
+
+
+def test_better_level_pushes_out_worst():
+    """更优价位进入前 N 档时挤出最差档"""
+    tracker = DepthTracker(depth=2)
+    tracker.apply(_delta(BookAction.ADD, OrderSide.BUY, 0.50, 10))
+    tracker.apply(_delta(BookAction.ADD, OrderSide.BUY, 0.49, 20))
+    tracker.apply(_delta(BookAction.ADD, OrderSide.BUY, 0.51, 5))
+
+    assert tracker.bid_depth == 15.0
+
+
+def test_delete_and_clear():
+    """删除价位后下一档补入；CLEAR 清空两边"""
+    tracker = DepthTracker(depth=1)
+    tracker.apply(_delta(BookAction.ADD, OrderSide.SELL, 0.52, 10))
+    tracker.apply(_delta(BookAction.ADD, OrderSide.SELL, 0.53, 30))
+    tracker.apply(_delta(BookAction.DELETE, OrderSide.SELL, 0.52, 0))
+
+    assert tracker.ask_depth == 30.0
+
+    tracker.apply(OrderBookDelta.clear(INSTRUMENT_ID, 0, 0, 0))
+
+    assert tracker.ask_depth == 0.0
+
+
+def test_imbalance():
+    """买方深度更大时失衡为正"""
+    tracker = DepthTracker(depth=5)
+    tracker.apply(_delta(BookAction.ADD, OrderSide.BUY, 0.50, 30))
+    tracker.apply(_delta(BookAction.ADD, OrderSide.SELL, 0.52, 10))
+
+    assert tracker.imbalance == pytest.approx(0.5)
+
+
+def test_random_stream_matches_full_scan():
+    """随机增量流与全量重算一致"""
+    rng = random.Random(3)
+    depth = 5
+    tracker = DepthTracker(depth=depth)
+    bids, asks = {}, {}
+
+    for _ in range(3000):
+        side = rng.choice((OrderSide.BUY, OrderSide.SELL))
+        levels = bids if side == OrderSide.BUY else asks
+        ticks = rng.randint(400, 499) if side == OrderSide.BUY else rng.randint(501, 600)
+        price = ticks / 1000
+
+        if levels and rng.random() < 0.3:
+            ticks = rng.choice(list(levels))
+            price = ticks / 1000
+            tracker.apply(_delta(BookAction.DELETE, side, price, 0))
+            del levels[ticks]
+        else:
+            size = rng.randint(1, 500)
+            action = BookAction.UPDATE if ticks in levels else BookAction.ADD
+            tracker.apply(_delta(action, side, price, size))
+            levels[ticks] = size
+
+        assert tracker.bid_depth == pytest.approx(_top_depth(bids, depth, best_first=True))
+        assert tracker.ask_depth == pytest.approx(_top_depth(asks, depth, best_first=False))
+
+
+def test_invalid_depth():
+    """档位数必须为正数"""
+    with pytest.raises(ValueError):
+        DepthTracker(depth=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
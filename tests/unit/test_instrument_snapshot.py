@@ -0,0 +1,164 @@
+"""
+Instrument 快照单元测试
+
+测试范围：
+- 快照序列化往返、过期与到期处理、损坏文件
+- 加载函数包装（只加载缺失的品种）
+- InstrumentRefresher 在事件循环中保存 / 刷新快照
+- 刷新后 tick size 变化：策略重建 tick 网格并撤单重报
+
+运行方法：
+    pytest tests/unit/test_instrument_snapshot.py -v
+"""
+
+import json
+
+import pytest
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.instruments import BinaryOption
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.harness import build_engine, group_deltas
+from markets.instruments import InstrumentRefresher, InstrumentSnapshotStore
+from strategies.market_making_strategy import MarketMakingStrategy
+from tests.unit.test_backtest_harness import make_config, make_session
+
+FAR_FUTURE_NS = 4_102_444_800 * 10**9     # 2100-01-01
+
+
+def make_instrument(suffix="", expiration_ns=FAR_FUTURE_NS, **fields):
+    data = BinaryOption.to_dict(TestInstrumentProvider.binary_option())
+    data["id"] = data["id"].replace("-", f"-{suffix}", 1)
+    data["raw_symbol"] = data["raw_symbol"].replace("-", f"-{suffix}", 1)
+    data["expiration_ns"] = expiration_ns
+    data.update(fields)
+    return BinaryOption.from_dict(data)
+
+
+@pytest.fixture
+def instruments():
+    return [make_instrument(), make_instrument("9")]
+
+
+def test_snapshot_round_trip(tmp_path, instruments):
+    path = tmp_path / "instruments.json"
+    InstrumentSnapshotStore(path).put(instruments)
+
+    store = InstrumentSnapshotStore(path)
+    first, second = instruments
+    assert store.get(first.id) == first
+    assert store.get(first.id).price_increment == first.price_increment
+    assert store.get(first.id).min_quantity == first.min_quantity
+
+    found, missing = store.get_many([second.id, "0xnew-1.POLYMARKET"])
+    assert found == [second]
+    assert missing == ["0xnew-1.POLYMARKET"]
+
+
+def test_stale_expired_and_corrupt(tmp_path, instruments):
+    path = tmp_path / "instruments.json"
+    expired = make_instrument("7", expiration_ns=1)
+
+    store = InstrumentSnapshotStore(path, max_age_seconds=0)
+    store.put([*instruments, expired])
+
+    # 超过 max_age 的快照只在 allow_stale 时使用；已到期的品种写入时即被清理
+    assert store.get(instruments[0].id) is None
+    assert store.get(instruments[0].id, allow_stale=True) == instruments[0]
+    assert expired.id not in store
+    assert str(expired.id) not in json.loads(path.read_text(encoding="utf-8"))
+
+    path.write_text("{not json", encoding="utf-8")
+    assert InstrumentSnapshotStore(path).get_many([instruments[0].id]) == ([], [str(instruments[0].id)])
+
+
+def test_loader_only_fetches_missing(instruments):
+    first, second = instruments
+    store = InstrumentSnapshotStore(None)
+    store.put([first])
+    calls = []
+
+    def load(ids):
+        calls.append(list(ids))
+        return [second]
+
+    load_with_snapshot = store.loader(load)
+    assert load_with_snapshot([first.id, second.id]) == [first, second]
+    assert calls == [[str(second.id)]]
+
+    # 第二次全部命中快照
+    assert load_with_snapshot([second.id]) == [second]
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_refresher_saves_and_refreshes(tmp_path, instruments, background):
+    fresh, seeded = instruments
+    store = InstrumentSnapshotStore(tmp_path / "instruments.json")
+    calls = []
+
+    def load(ids):
+        calls.append(list(ids))
+        return [seeded]
+
+    deltas, trades = make_session(fresh, steps=100)
+    refresher = InstrumentRefresher(
+        store,
+        [fresh.id, seeded.id],
+        load,
+        seeded=[seeded.id],
+        background=background,
+    )
+
+    engine = build_engine(instruments)
+    try:
+        engine.add_strategy(MarketMakingStrategy(make_config(fresh)))
+        engine.add_actor(refresher)
+        engine.add_data(group_deltas(deltas) + trades)
+        engine.run()
+    finally:
+        engine.dispose()
+
+    assert calls == [[str(seeded.id)]]
+    assert refresher.refreshed == 1
+    saved = InstrumentSnapshotStore(store.path)
+    assert saved.get(fresh.id) == fresh
+    assert saved.get(seeded.id) == seeded
+
+
+def test_refresh_rebuilds_strategy_grid_on_tick_change(instruments, monkeypatch):
+    instrument = instruments[0]
+    # 快照中是 0.001，交易所已改为 0.01
+    refreshed = make_instrument(price_increment="0.01", price_precision=2)
+
+    engine = build_engine([instrument])
+    try:
+        strategy = MarketMakingStrategy(make_config(instrument))
+        refresher = InstrumentRefresher(InstrumentSnapshotStore(None), [instrument.id], lambda ids: [refreshed])
+        engine.add_strategy(strategy)
+        engine.add_actor(refresher)
+        strategy.start()
+
+        slot = strategy._slot
+        assert slot.grid.tick_raw == instrument.price_increment.raw
+        slot.quotes.track(OrderSide.BUY, "O-1", 480, 10)
+        slot.scheduler.mark(0, 480, 520)
+
+        canceled = []
+        monkeypatch.setattr(strategy, "cancel_all_orders", lambda instrument_id, *args, **kwargs: canceled.append(instrument_id))
+
+        refresher._apply([refreshed])
+
+        assert strategy.instrument is refreshed
+        assert slot.grid.tick_raw == refreshed.price_increment.raw
+        assert slot.grid.quantity(5) == refreshed.make_qty(5)
+        assert canceled == [instrument.id]
+        assert slot.quotes.live(OrderSide.BUY) is None
+        assert slot.scheduler.should_requote(1, 48, 52)
+
+        # 定义没变：只替换 Instrument，不撤单
+        refresher._apply([refreshed])
+        assert canceled == [instrument.id]
+        strategy.stop()
+    finally:
+        engine.dispose()
@@ -0,0 +1,108 @@
+"""
+延迟直方图单元测试
+
+测试范围：
+- 分桶边界与分位数精度（相对误差 < 2/SUB_BUCKETS）
+- 合并、重置、超范围值
+- 回测中做市策略记录各阶段延迟
+
+运行方法：
+    pytest tests/unit/test_latency.py -v
+"""
+
+import random
+
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.harness import build_engine, group_deltas
+from strategies.latency import (
+    MAX_VALUE,
+    SUB_BUCKETS,
+    LatencyHistogram,
+    LatencyRecorder,
+    bucket_bounds,
+    bucket_index,
+)
+from strategies.market_making_strategy import MarketMakingStrategy
+from tests.unit.test_backtest_harness import make_config, make_session
+
+
+def test_bucket_bounds_contain_value():
+    rng = random.Random(3)
+    values = list(range(0, 2 * SUB_BUCKETS)) + [rng.randrange(1, MAX_VALUE) for _ in range(2000)]
+
+    previous_high = -1
+    for index in range(bucket_index(MAX_VALUE) + 1):
+        low, high = bucket_bounds(index)
+        assert low == previous_high + 1        # 桶连续且不重叠
+        previous_high = high
+
+    for value in values:
+        low, high = bucket_bounds(bucket_index(value))
+        assert low <= value <= high
+        assert high - low <= max(1, value * 2 // SUB_BUCKETS)
+
+
+def test_quantiles_match_exact():
+    rng = random.Random(7)
+    values = [int(rng.lognormvariate(11, 1.2)) for _ in range(20_000)]
+
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.9, 0.99, 0.999):
+        exact = ordered[int(q * len(ordered) + 0.999999) - 1]
+        assert abs(histogram.value_at_quantile(q) - exact) <= exact * 2 / SUB_BUCKETS
+
+    assert histogram.count == len(values)
+    assert histogram.min == ordered[0] and histogram.max == ordered[-1]
+    assert histogram.value_at_quantile(1.0) == ordered[-1]
+
+
+def test_merge_reset_and_clamp():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    for value in (10, 20, 30):
+        first.record(value)
+    second.record(-5)
+    second.record(MAX_VALUE * 4)
+
+    first.merge(second)
+    assert first.count == 5
+    assert (first.min, first.max) == (0, MAX_VALUE)
+    assert first.value_at_quantile(0.5) == 20
+
+    first.reset()
+    assert first.count == 0 and first.value_at_quantile(0.99) == 0
+    assert first.summary()["p99_us"] == 0
+
+
+def test_strategy_records_stages():
+    instrument = TestInstrumentProvider.binary_option()
+    deltas, trades = make_session(instrument, steps=200)
+    strategy = MarketMakingStrategy(make_config(instrument, latency_stats=True))
+
+    engine = build_engine([instrument])
+    try:
+        engine.add_strategy(strategy)
+        engine.add_data(group_deltas(deltas) + trades)
+        engine.run()
+    finally:
+        engine.dispose()
+
+    snapshot = strategy.latency.snapshot()
+    assert set(snapshot) == set(LatencyRecorder.STAGES)
+
+    counts = {stage: s["count"] for stage, s in snapshot.items()}
+    assert counts["feed"] >= counts["dispatch"] >= counts["risk"] >= counts["compute"]
+    assert counts["compute"] == counts["submit"] >= counts["tick_to_trade"] > 0
+
+    # 回测中 ts_init 与策略时钟一致，tick-to-trade 只包含处理耗时
+    assert snapshot["dispatch"]["max_us"] == 0
+    assert 0 < snapshot["tick_to_trade"]["p50_us"] < snapshot["tick_to_trade"]["max_us"] + 1
+
+
+def test_disabled_by_default():
+    instrument = TestInstrumentProvider.binary_option()
+    assert MarketMakingStrategy(make_config(instrument)).latency is None
@@ -0,0 +1,128 @@
+"""
+市场发现单元测试
+
+测试范围：
+- Gamma API 响应解析
+- 批量查询的并发上限与重试
+- 磁盘 TTL 缓存（热缓存零请求、网络失败退回过期缓存）
+
+运行方法：
+    pytest tests/unit/test_market_discovery.py -v
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from markets.discovery import (
+    MarketCache,
+    MarketDiscovery,
+    MarketInfo,
+    MarketNotFound,
+    parse_market,
+)
+
+
+def gamma_market(slug):
+    return {
+        "conditionId": f"0x{slug}",
+        "clobTokenIds": json.dumps([f"{slug}-yes", f"{slug}-no"]),
+        "question": f"{slug}?",
+    }
+
+
+class FakeGamma:
+    """记录并发数的假 Gamma API"""
+
+    def __init__(self, failures=None, missing=()):
+        self.failures = dict(failures or {})   # slug → 前几次失败
+        self.missing = set(missing)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, client, slug):
+        self.calls.append(slug)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if slug in self.missing:
+                raise MarketNotFound(slug)
+            if self.failures.get(slug, 0) > 0:
+                self.failures[slug] -= 1
+                raise ConnectionError("reset")
+            return gamma_market(slug)
+        finally:
+            self.in_flight -= 1
+
+
+def lookup(discovery, slugs):
+    return asyncio.run(discovery.lookup_many(slugs))
+
+
+def test_parse_market():
+    market = parse_market("btc", gamma_market("btc"))
+
+    assert market == MarketInfo("btc", "0xbtc", ("btc-yes", "btc-no"), "btc?")
+    assert market.token_id == "btc-yes"
+
+    with pytest.raises(ValueError):
+        parse_market("btc", {"conditionId": "0x1", "clobTokenIds": "[]"})
+
+
+def test_batch_lookup_bounded_concurrency():
+    fake = FakeGamma()
+    discovery = MarketDiscovery(cache=MarketCache(None), max_concurrency=3, fetch=fake)
+    slugs = [f"m{i}" for i in range(10)]
+
+    markets, errors = lookup(discovery, slugs)
+
+    assert errors == {}
+    assert list(markets) == slugs
+    assert fake.max_in_flight == 3
+
+
+def test_retries_transient_errors_but_not_missing():
+    fake = FakeGamma(failures={"flaky": 2}, missing={"gone"})
+    discovery = MarketDiscovery(cache=MarketCache(None), retries=3, backoff=0, fetch=fake)
+
+    markets, errors = lookup(discovery, ["flaky", "gone"])
+
+    assert markets["flaky"].condition_id == "0xflaky"
+    assert isinstance(errors["gone"], MarketNotFound)
+    assert fake.calls.count("flaky") == 3
+    assert fake.calls.count("gone") == 1
+
+
+def test_warm_cache_makes_no_requests(tmp_path):
+    path = tmp_path / "markets.json"
+    lookup(MarketDiscovery(cache=MarketCache(path), fetch=FakeGamma()), ["a", "b"])
+
+    fake = FakeGamma()
+    markets, _ = lookup(MarketDiscovery(cache=MarketCache(path), fetch=fake), ["a", "b"])
+
+    assert fake.calls == []
+    assert markets["b"].token_ids == ("b-yes", "b-no")
+
+
+def test_expired_cache_refetches_and_falls_back_when_offline(tmp_path):
+    path = tmp_path / "markets.json"
+    lookup(MarketDiscovery(cache=MarketCache(path), fetch=FakeGamma()), ["a"])
+
+    # TTL 为 0：缓存过期，需要重新请求；请求全部失败时退回过期缓存
+    offline = FakeGamma(failures={"a": 99})
+    discovery = MarketDiscovery(cache=MarketCache(path, ttl_seconds=0), retries=2, backoff=0, fetch=offline)
+    markets, errors = lookup(discovery, ["a"])
+
+    assert offline.calls == ["a", "a"]
+    assert errors == {}
+    assert markets["a"].condition_id == "0xa"
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    path = tmp_path / "markets.json"
+    path.write_text("{not json")
+
+    assert MarketCache(path).get("a") is None
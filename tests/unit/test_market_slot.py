@@ -0,0 +1,95 @@
+"""
+多市场槽位单元测试
+
+测试范围：
+- 品种列表解析（instrument_ids 优先、字符串转换）
+- 槽位之间状态独立
+- 价格历史与波动率共享缓冲区，窗口一起调整
+
+运行方法：
+    pytest tests/unit/test_market_slot.py -v
+"""
+
+from types import SimpleNamespace
+
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import InstrumentId
+
+from strategies.market_making_strategy import MarketMakingStrategy
+from strategies.market_slot import MarketSlot
+
+
+YES = "0xabc-111.POLYMARKET"
+NO = "0xdef-222.POLYMARKET"
+
+
+def make_slot(instrument_id):
+    return MarketSlot(
+        instrument_id=InstrumentId.from_str(instrument_id),
+        volatility_window=10,
+        depth_levels=5,
+        requote_tolerance_ticks=0,
+        requote_size_tolerance=0,
+        requote_trigger_ticks=1,
+        min_requote_interval_ns=0,
+        max_requote_interval_ns=10**9,
+        log_every_n_updates=10,
+    )
+
+
+def test_parse_single_instrument_id():
+    """只配置 instrument_id 时为单品种"""
+    config = SimpleNamespace(instrument_id=YES)
+    ids = MarketMakingStrategy._parse_instrument_ids(config)
+    assert ids == [InstrumentId.from_str(YES)]
+
+
+def test_parse_instrument_ids_takes_precedence():
+    """instrument_ids 优先于 instrument_id，保持顺序"""
+    config = SimpleNamespace(instrument_id=YES, instrument_ids=(NO, YES))
+    ids = MarketMakingStrategy._parse_instrument_ids(config)
+    assert ids == [InstrumentId.from_str(NO), InstrumentId.from_str(YES)]
+
+
+def test_parse_empty_instrument_ids_falls_back():
+    """instrument_ids 为空时回退到 instrument_id"""
+    config = SimpleNamespace(instrument_id=YES, instrument_ids=())
+    assert len(MarketMakingStrategy._parse_instrument_ids(config)) == 1
+
+
+def test_slots_are_independent():
+    """各槽位的价格历史和挂单互不影响"""
+    a, b = make_slot(YES), make_slot(NO)
+
+    a.price_history.append(0.5)
+    a.quotes.track(OrderSide.BUY, "O-1", 50, 10)
+
+    assert len(b.price_history) == 0
+    assert b.quotes.live(OrderSide.BUY) is None
+    assert a.price_history.capacity == 20
+
+
+def test_price_history_shared_with_volatility():
+    """价格只存一份；调整窗口时价格历史和波动率一起调整"""
+    slot = make_slot(YES)
+    for i in range(30):
+        slot.record_price(0.5 + (i % 5) * 0.01)
+
+    assert slot.volatility.buffer is slot.price_history
+    assert len(slot.price_history) == 20
+    assert len(slot.volatility) == 10
+
+    slot.set_volatility_window(25)
+    assert slot.price_history.capacity == 50
+    assert slot.volatility.window == 25
+    assert len(slot.volatility) == 20
+
+    for i in range(40):
+        slot.record_price(0.5 + (i % 5) * 0.01)
+    assert len(slot.price_history) == 50
+    assert len(slot.volatility) == 25
+
+
+def test_slot_has_no_instance_dict():
+    """槽位使用 __slots__"""
+    assert not hasattr(make_slot(YES), "__dict__")
@@ -0,0 +1,155 @@
+"""
+运行配置单元测试
+
+测试范围：
+- 参数表与 MarketMakingConfig 字段一致
+- 档位 < 配置文件 < --set 的优先级
+- 类型转换和取值约束
+- --check 不导入 NautilusTrader
+- 格式错误的 --set 输出错误并返回 2
+- 遥测日志级别默认跟随节点日志级别
+
+运行方法：
+    pytest tests/unit/test_profiles.py -v
+"""
+
+import subprocess
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from nautilus_trader.config import StrategyConfig
+
+from config.profiles import PROFILES, STRATEGY_PARAMS, ConfigError, resolve
+from config.strategy_config import MarketMakingConfig
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_params_match_strategy_config():
+    defaults = MarketMakingConfig()
+    fields = (
+        set(MarketMakingConfig.__struct_fields__)
+        - set(StrategyConfig.__struct_fields__)
+        - {"instrument_id", "instrument_ids"}
+    )
+
+    assert set(STRATEGY_PARAMS) == fields
+    for name, kind in STRATEGY_PARAMS.items():
+        assert type(getattr(defaults, name)) is kind, name
+
+
+@pytest.mark.parametrize("name", sorted(PROFILES))
+def test_profiles_are_valid(name):
+    profile = resolve(name)
+
+    config = profile.strategy_config(["0xabc-123.POLYMARKET"])
+    assert config.instrument_ids == ("0xabc-123.POLYMARKET",)
+    for param, value in profile.strategy.items():
+        assert getattr(config, param) == value
+
+
+def test_file_and_overrides_take_precedence(tmp_path):
+    path = tmp_path / "run.toml"
+    path.write_text(
+        'profile = "standard"\n'
+        'markets = ["some-market"]\n'
+        "signature_type = 1\n"
+        "[strategy]\n"
+        'base_spread = "0.04"\n'
+        "order_size = 3\n"
+        "use_dynamic_spread = false\n",
+        encoding="utf-8",
+    )
+
+    profile = resolve(path=path, overrides={"order_size": 4})
+
+    assert profile.name == "standard"
+    assert profile.markets == ("some-market",)
+    assert profile.signature_type == 1
+    assert profile.strategy["base_spread"] == Decimal("0.04")
+    assert profile.strategy["order_size"] == 4
+    assert profile.strategy["use_dynamic_spread"] is False
+    assert profile.strategy["max_inventory"] == 20          # 档位默认值
+
+    # 命令行档位和市场优先于配置文件
+    profile = resolve("paper", path, markets=["other-market"])
+    assert profile.name == "paper"
+    assert profile.markets == ("other-market",)
+
+
+def test_json_config(tmp_path):
+    path = tmp_path / "run.json"
+    path.write_text('{"profile": "backtest", "strategy": {"base_spread": 0.025}}', encoding="utf-8")
+
+    profile = resolve(path=path)
+
+    assert profile.mode == "backtest"
+    assert profile.strategy["base_spread"] == Decimal("0.025")
+
+
+@pytest.mark.parametrize(
+    "overrides, message",
+    [
+        ({"base_sprad": "0.03"}, "未知的策略参数"),
+        ({"order_size": "two"}, "order_size"),
+        ({"order_size": 1.5}, "order_size"),
+        ({"use_inventory_skew": "yes"}, "use_inventory_skew"),
+        ({"min_spread": "0.5"}, "min_spread"),
+        ({"order_size": 9}, "max_order_size"),
+        ({"max_price": "1.2"}, "max_price"),
+        ({"max_daily_loss": "5"}, "max_daily_loss"),
+        ({"hedge_size": -1}, "hedge_size"),
+    ],
+)
+def test_invalid_overrides(overrides, message):
+    with pytest.raises(ConfigError, match=message):
+        resolve("standard", overrides=overrides)
+
+
+def test_telemetry_level_follows_log_level(tmp_path):
+    assert resolve("standard").strategy["telemetry_level"] == "INFO"
+    assert resolve("paper").strategy["telemetry_level"] == "ERROR"
+
+    path = tmp_path / "run.toml"
+    path.write_text('profile = "safe"\nlog_level = "ERROR"\n', encoding="utf-8")
+    assert resolve(path=path).strategy["telemetry_level"] == "ERROR"
+
+    # 显式给出时不覆盖
+    assert resolve(path=path, overrides={"telemetry_level": "DEBUG"}).strategy["telemetry_level"] == "DEBUG"
+
+
+def test_invalid_profile_and_file(tmp_path):
+    with pytest.raises(ConfigError, match="档位"):
+        resolve("aggressive")
+
+    path = tmp_path / "run.toml"
+    path.write_text("signature = 2\n", encoding="utf-8")
+    with pytest.raises(ConfigError, match="signature"):
+        resolve(path=path)
+
+    with pytest.raises(ConfigError, match="无法读取"):
+        resolve(path=tmp_path / "missing.toml")
+
+
+def test_malformed_set_is_a_config_error(capsys):
+    import run_market_making
+
+    assert run_market_making.main(["--profile", "standard", "--set", "foo", "--check"]) == 2
+    assert "[ERROR] 参数格式应为 NAME=VALUE: foo" in capsys.readouterr().out
+
+
+def test_check_does_not_import_nautilus():
+    code = (
+        "import sys, run_market_making\n"
+        "assert run_market_making.main(['--profile', 'standard', '--check']) == 0\n"
+        "assert not [m for m in sys.modules if m.startswith('nautilus_trader')]\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
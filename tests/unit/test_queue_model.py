@@ -0,0 +1,114 @@
+"""
+排队位置模型单元测试
+
+测试范围：
+- 成交先消耗前方排队量
+- 撤单按比例推进队列
+- 价格穿过挂单
+- 挂到模拟交易所上的排队成交
+
+运行方法：
+    pytest tests/unit/test_queue_model.py -v
+"""
+
+from nautilus_trader.model.enums import AggressorSide, OrderSide
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.harness import group_deltas, run_backtest
+from backtest.queue_model import QueuePositionModule, QueueTracker
+
+
+PRICE = 500
+
+
+def test_trade_consumes_queue_ahead_first():
+    """前方 30 个，成交 20 个不轮到我们"""
+    tracker = QueueTracker()
+    tracker.track("O-1", OrderSide.BUY, PRICE, ahead=30, leaves=10)
+
+    assert tracker.on_trade(AggressorSide.SELLER, PRICE, 20) == []
+    assert tracker.ahead("O-1") == 10
+
+    # 再成交 15 个：10 个消耗前方，5 个成交我们
+    assert tracker.on_trade(AggressorSide.SELLER, PRICE, 15) == [("O-1", 5)]
+    assert tracker.ahead("O-1") == 0
+
+
+def test_fill_limited_to_leaves():
+    """成交量不超过剩余数量，并在多次成交间累计"""
+    tracker = QueueTracker()
+    tracker.track("O-1", OrderSide.SELL, PRICE, ahead=0, leaves=10)
+
+    assert tracker.on_trade(AggressorSide.BUYER, PRICE, 6) == [("O-1", 6)]
+    assert tracker.on_trade(AggressorSide.BUYER, PRICE, 6) == [("O-1", 4)]
+    assert tracker.on_trade(AggressorSide.BUYER, PRICE, 6) == []
+
+
+def test_wrong_side_or_price_does_not_fill():
+    """同方向主动成交、未到挂单价的成交都不影响队列"""
+    tracker = QueueTracker()
+    tracker.track("O-1", OrderSide.BUY, PRICE, ahead=10, leaves=10)
+
+    assert tracker.on_trade(AggressorSide.BUYER, PRICE, 50) == []
+    assert tracker.on_trade(AggressorSide.SELLER, PRICE + 1, 50) == []
+    assert tracker.on_trade(AggressorSide.NO_AGGRESSOR, PRICE, 50) == []
+    assert tracker.ahead("O-1") == 10
+
+
+def test_trade_through_price_reaches_order():
+    """成交价低于买单价：价格穿过，同样按队列成交"""
+    tracker = QueueTracker()
+    tracker.track("O-1", OrderSide.BUY, PRICE, ahead=5, leaves=10)
+
+    assert tracker.on_trade(AggressorSide.SELLER, PRICE - 3, 20) == [("O-1", 10)]
+
+
+def test_better_priced_order_fills_first():
+    """价格更优的挂单先轮到"""
+    tracker = QueueTracker()
+    tracker.track("LOW", OrderSide.BUY, PRICE - 1, ahead=0, leaves=10)
+    tracker.track("HIGH", OrderSide.BUY, PRICE, ahead=0, leaves=10)
+
+    assert tracker.on_trade(AggressorSide.SELLER, PRICE - 1, 15) == [("HIGH", 10), ("LOW", 5)]
+
+
+def test_cancellations_advance_queue_pro_rata():
+    """价位 100 个中我们前方 40 个，撤单 50 个 → 前方减少 20 个"""
+    tracker = QueueTracker()
+    tracker.track("O-1", OrderSide.BUY, PRICE, ahead=40, leaves=10)
+
+    tracker.on_level_reduced(OrderSide.BUY, PRICE, old_size=100, reduced=50)
+    assert tracker.ahead("O-1") == 20
+
+    # 其他价位不受影响
+    tracker.on_level_reduced(OrderSide.BUY, PRICE + 1, old_size=100, reduced=100)
+    assert tracker.ahead("O-1") == 20
+
+
+def test_forget():
+    tracker = QueueTracker()
+    tracker.track("O-1", OrderSide.BUY, PRICE, ahead=0, leaves=10)
+    tracker.forget("O-1")
+
+    assert "O-1" not in tracker
+    assert tracker.on_trade(AggressorSide.SELLER, PRICE, 10) == []
+
+
+def test_module_fills_resting_orders_from_trades():
+    """挂到模拟交易所：成交数据通过排队模型成交挂单"""
+    from tests.unit.test_backtest_harness import make_config, make_session
+
+    instrument = TestInstrumentProvider.binary_option()
+    deltas, trades = make_session(instrument)
+    module = QueuePositionModule()
+
+    result = run_backtest(
+        [instrument],
+        group_deltas(deltas) + trades,
+        make_config(instrument),
+        modules=[module],
+        trade_execution=False,
+    )
+
+    assert module.queue_fills > 0
+    assert result.fills >= module.queue_fills
@@ -0,0 +1,91 @@
+"""
+报价管理器单元测试
+
+测试范围：
+- 挂单差分（保留 / 新挂 / 重挂）
+- 容忍范围
+- 订单结束后的记录清理
+
+运行方法：
+    pytest tests/unit/test_quote_manager.py -v
+"""
+
+import pytest
+
+from nautilus_trader.model.enums import OrderSide
+
+from strategies.quote_manager import QuoteManager
+
+
+@pytest.fixture
+def manager():
+    """1 tick 容忍的报价管理器"""
+    return QuoteManager(price_tolerance_ticks=1, size_tolerance=0)
+
+
+def test_plan_new_without_live_quote(manager):
+    """无挂单时新挂"""
+    assert manager.plan(OrderSide.BUY, 590, 20) == QuoteManager.NEW
+
+
+def test_plan_keep_within_tolerance(manager):
+    """价格变化在容忍范围内保留挂单"""
+    manager.track(OrderSide.BUY, "O-1", 590, 20)
+
+    assert manager.plan(OrderSide.BUY, 590, 20) == QuoteManager.KEEP
+    assert manager.plan(OrderSide.BUY, 591, 20) == QuoteManager.KEEP
+    assert manager.kept == 2
+
+
+def test_plan_replace_on_price_move(manager):
+    """价格超出容忍范围时重挂"""
+    manager.track(OrderSide.BUY, "O-1", 590, 20)
+
+    assert manager.plan(OrderSide.BUY, 592, 20) == QuoteManager.REPLACE
+
+
+def test_plan_replace_on_size_change(manager):
+    """数量变化时重挂"""
+    manager.track(OrderSide.SELL, "O-2", 610, 20)
+
+    assert manager.plan(OrderSide.SELL, 610, 10) == QuoteManager.REPLACE
+
+
+def test_sides_are_independent(manager):
+    """买卖方向互不影响"""
+    manager.track(OrderSide.BUY, "O-1", 590, 20)
+
+    assert manager.plan(OrderSide.SELL, 610, 20) == QuoteManager.NEW
+
+
+def test_track_replaces_previous(manager):
+    """重挂后旧订单不再被跟踪"""
+    manager.track(OrderSide.BUY, "O-1", 590, 20)
+    manager.track(OrderSide.BUY, "O-2", 595, 20)
+
+    assert manager.live(OrderSide.BUY).client_order_id == "O-2"
+    assert manager.forget("O-1") is False
+    assert manager.replaced == 1
+
+
+def test_forget_clears_side(manager):
+    """订单结束后该方向需要新挂"""
+    manager.track(OrderSide.BUY, "O-1", 590, 20)
+
+    assert manager.forget("O-1") is True
+    assert manager.live(OrderSide.BUY) is None
+    assert manager.plan(OrderSide.BUY, 590, 20) == QuoteManager.NEW
+
+
+def test_clear(manager):
+    """清空所有挂单记录"""
+    manager.track(OrderSide.BUY, "O-1", 590, 20)
+    manager.track(OrderSide.SELL, "O-2", 610, 20)
+    manager.clear()
+
+    assert manager.live(OrderSide.BUY) is None
+    assert manager.live(OrderSide.SELL) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
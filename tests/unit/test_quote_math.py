@@ -0,0 +1,86 @@
+"""
+报价 tick 网格单元测试
+
+测试范围：
+- 价格取整方向（买价向下、卖价向上）
+- raw 整数构造 Price / Quantity
+- 报价边界（至少 1 tick、落在 (0, 1) 内）
+
+运行方法：
+    pytest tests/unit/test_quote_math.py -v
+"""
+
+import pytest
+
+from nautilus_trader.model.objects import Price, Quantity
+
+from strategies.quote_math import TickGrid
+
+
+@pytest.fixture
+def grid():
+    """0.001 tick 网格"""
+    return TickGrid(
+        tick_size=0.001,
+        price_precision=3,
+        tick_raw=Price.from_str("0.001").raw,
+        size_precision=2,
+    )
+
+
+def test_floor_ceil_exact_price(grid):
+    """恰好落在网格上的价格不受浮点误差影响"""
+    assert grid.floor_ticks(0.588) == 588
+    assert grid.ceil_ticks(0.588) == 588
+
+
+def test_floor_ceil_between_ticks(grid):
+    """网格之间的价格按方向取整"""
+    assert grid.floor_ticks(0.5885) == 588
+    assert grid.ceil_ticks(0.5885) == 589
+
+
+def test_price_from_ticks(grid):
+    """tick 转 Price 与字符串构造一致"""
+    assert grid.price(588) == Price.from_str("0.588")
+    assert grid.price(588).precision == 3
+
+
+def test_quantity_from_int(grid):
+    """整数数量转 Quantity"""
+    assert grid.quantity(20) == Quantity.from_str("20.00")
+    assert grid.quantity(20).precision == 2
+
+
+def test_quote_ticks_symmetric(grid):
+    """无倾斜时报价围绕中间价"""
+    bid_ticks, ask_ticks = grid.quote_ticks(0.60, 0.01, 0.0)
+
+    # 0.60 * 0.99 = 0.594, 0.60 * 1.01 = 0.606
+    assert bid_ticks == 594
+    assert ask_ticks == 606
+
+
+def test_quote_ticks_min_one_tick(grid):
+    """价差过小时至少相差 1 个 tick"""
+    bid_ticks, ask_ticks = grid.quote_ticks(0.6004, 0.0, 0.0)
+
+    assert ask_ticks - bid_ticks >= 1
+
+
+def test_quote_ticks_bounded(grid):
+    """报价不会越过 (0, 1)"""
+    bid_ticks, ask_ticks = grid.quote_ticks(0.999, 0.05, 0.0)
+
+    assert bid_ticks >= 1
+    assert ask_ticks <= grid.max_ticks - 1
+
+
+def test_invalid_tick_size():
+    """tick 必须为正数"""
+    with pytest.raises(ValueError):
+        TickGrid(tick_size=0, price_precision=3, tick_raw=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
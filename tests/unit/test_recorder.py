@@ -0,0 +1,129 @@
+"""
+行情录制单元测试
+
+测试范围：
+- 按市场 / UTC 日轮转文件
+- 录制结果可以原样解码
+- 写入出错时写线程继续运行，写线程卡住时 close() 不无限等待
+- 在 BacktestEngine 中作为 Actor 运行
+
+运行方法：
+    pytest tests/unit/test_recorder.py -v
+"""
+
+import threading
+import time
+
+import pytest
+
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.harness import group_deltas, run_backtest
+from backtest.recorder import MarketDataRecorder, RecordWriter, recording_path
+from backtest.records import decode, open_records
+from tests.unit.test_backtest_harness import make_config, make_session
+
+
+DAY_NS = 86_400 * 1_000_000_000
+
+
+@pytest.fixture(scope="module")
+def instrument():
+    return TestInstrumentProvider.binary_option()
+
+
+def _shift(items, ns):
+    """把数据整体平移 ns（用 to_dict / from_dict 重建）"""
+    shifted = []
+    for item in items:
+        data = type(item).to_dict(item)
+        data["ts_event"] += ns
+        data["ts_init"] += ns
+        shifted.append(type(item).from_dict(data))
+    return shifted
+
+
+def test_writer_rotates_per_day(tmp_path, instrument):
+    deltas, trades = make_session(instrument, steps=20)
+    day1 = deltas + trades
+    day2 = _shift(day1, DAY_NS)
+
+    writer = RecordWriter(tmp_path)
+    writer.register(instrument.id, instrument.price_precision, instrument.size_precision)
+    writer.start()
+    writer.submit(day1[:50])
+    writer.submit(day1[50:] + day2)
+    writer.close()
+
+    files = sorted((tmp_path / str(instrument.id)).glob("*.bin"))
+    assert [f.name for f in files] == ["2023-11-14.bin", "2023-11-15.bin"]
+    assert writer.records_written == len(day1) + len(day2)
+
+    records, table = open_records(files[0])
+    assert decode(records, table) == day1
+    records, table = open_records(files[1])
+    assert decode(records, table) == day2
+
+
+def test_writer_drops_when_queue_full(tmp_path, instrument):
+    writer = RecordWriter(tmp_path, max_pending=1)
+    writer.register(instrument.id, instrument.price_precision, instrument.size_precision)
+
+    # 写线程未启动，第二批进不了队列
+    assert writer.submit([]) is True
+    assert writer.submit([]) is False
+    assert writer.batches_dropped == 1
+
+
+def test_writer_survives_write_errors(tmp_path, instrument):
+    deltas, _ = make_session(instrument, steps=10)
+    other = InstrumentId.from_str("0xother-1.POLYMARKET")
+
+    writer = RecordWriter(tmp_path)
+    writer.register(instrument.id, instrument.price_precision, instrument.size_precision)
+    writer.start()
+    writer.submit(deltas[:5])
+    writer.submit([OrderBookDelta.clear(other, 0, 1, 1)])   # 未登记的品种
+    writer.submit(deltas[5:])
+    writer.close()
+
+    assert writer.write_errors == 1
+    assert writer.records_written == len(deltas)
+
+
+def test_close_does_not_hang_on_stuck_writer(tmp_path, instrument, monkeypatch):
+    release = threading.Event()
+    writer = RecordWriter(tmp_path, max_pending=1, close_timeout=0.2)
+    monkeypatch.setattr(writer, "write", lambda batch: release.wait())
+
+    writer.start()
+    writer.submit([])
+    time.sleep(0.05)     # 写线程取走第一批后卡住
+    writer.submit([])    # 队列已满，结束标记放不进去
+
+    started = time.perf_counter()
+    writer.close()
+    assert time.perf_counter() - started < 2
+    release.set()
+
+
+def test_recorder_actor_captures_backtest_stream(tmp_path, instrument):
+    deltas, trades = make_session(instrument, steps=50)
+    recorder = MarketDataRecorder(tmp_path, [str(instrument.id)], batch_size=16)
+
+    run_backtest(
+        [instrument],
+        group_deltas(deltas) + trades,
+        make_config(instrument),
+        actors=[recorder],
+    )
+
+    assert recorder.writer.batches_dropped == 0
+    records, table = open_records(recording_path(tmp_path, instrument.id, "2023-11-14"))
+    recorded = decode(records, table)
+
+    assert table.ids == [InstrumentId.from_str(str(instrument.id))]
+    assert [d for d in recorded if hasattr(d, "order")] == deltas
+    assert [t for t in recorded if hasattr(t, "aggressor_side")] == trades
@@ -0,0 +1,112 @@
+"""
+行情记录格式单元测试
+
+测试范围：
+- 增量 / 成交 / 报价编码解码往返一致
+- 非数字成交 ID（十六进制）哈希后保持唯一、稳定
+- memmap 读取与品种旁注文件
+
+运行方法：
+    pytest tests/unit/test_records.py -v
+"""
+
+import numpy as np
+import pytest
+
+from nautilus_trader.model.data import QuoteTick, TradeTick
+from nautilus_trader.model.objects import Price, Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.records import (
+    KIND_DELTA,
+    KIND_TRADE,
+    RECORD_DTYPE,
+    TRADE_ID_HASHED,
+    InstrumentTable,
+    decode,
+    encode,
+    open_records,
+    write_records,
+)
+from tests.unit.test_backtest_harness import START_NS, make_session
+
+
+@pytest.fixture(scope="module")
+def instrument():
+    return TestInstrumentProvider.binary_option()
+
+
+@pytest.fixture(scope="module")
+def session(instrument):
+    deltas, trades = make_session(instrument, steps=20)
+    return deltas + trades
+
+
+def test_round_trip(instrument, session):
+    table = InstrumentTable.from_instruments([instrument])
+    records = encode(session, table)
+
+    assert records.dtype == RECORD_DTYPE
+    assert len(records) == len(session)
+    assert set(records["kind"]) == {KIND_DELTA, KIND_TRADE}
+    assert decode(records, table) == session
+
+
+def test_quote_round_trip(instrument):
+    quote = QuoteTick(
+        instrument.id,
+        Price(0.495, 3),
+        Price(0.505, 3),
+        Quantity(1234.5, 2),
+        Quantity(10, 2),
+        START_NS,
+        START_NS,
+    )
+    table = InstrumentTable.from_instruments([instrument])
+
+    assert decode(encode([quote], table), table) == [quote]
+
+
+def test_hex_trade_ids_stay_distinct(instrument, session):
+    trades = [item for item in session if isinstance(item, TradeTick)]
+    hex_ids = [f"0x{i:032x}" for i in range(len(trades))] + ["007"]
+    renamed = []
+    for trade, trade_id in zip(trades * 2, hex_ids):
+        data = TradeTick.to_dict(trade)
+        data["trade_id"] = trade_id
+        renamed.append(TradeTick.from_dict(data))
+
+    table = InstrumentTable.from_instruments([instrument])
+    records = encode(renamed, table)
+    decoded = decode(records, table)
+
+    assert np.all(records["flags"] == TRADE_ID_HASHED)
+    assert len({trade.trade_id for trade in decoded}) == len(renamed)
+    assert decode(encode(renamed, table), table) == decoded
+    # 数字 ID 原样保留
+    assert [trade.trade_id for trade in decode(encode(trades, table), table)] == [t.trade_id for t in trades]
+
+
+def test_prices_stored_as_integer_mantissa(instrument, session):
+    records = encode(session[1:2], InstrumentTable.from_instruments([instrument]))
+    delta = session[1]
+
+    assert records["price"][0] == round(delta.order.price.as_double() * 1000)
+    assert records["size"][0] == round(delta.order.size.as_double() * 100)
+
+
+def test_write_and_memmap(tmp_path, instrument, session):
+    table = InstrumentTable.from_instruments([instrument])
+    path = write_records(tmp_path / "session.bin", encode(session, table), table)
+
+    records, loaded = open_records(path)
+
+    assert isinstance(records, np.memmap)
+    assert path.stat().st_size == len(session) * RECORD_DTYPE.itemsize
+    assert loaded.ids == [instrument.id]
+    assert decode(records, loaded) == session
+
+
+def test_unknown_instrument_rejected(instrument, session):
+    with pytest.raises(KeyError):
+        encode(session, InstrumentTable([]))
@@ -0,0 +1,77 @@
+"""
+行情回放单元测试
+
+测试范围：
+- N 倍实时回放的节流（替换墙钟，不依赖机器快慢）
+- 回放速度不影响策略行为（时钟来自数据时间戳）
+
+运行方法：
+    pytest tests/unit/test_replay.py -v
+"""
+
+import pytest
+
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.harness import group_deltas
+from backtest.replay import ReplayPacer, run_replay
+from tests.unit.test_backtest_harness import make_config, make_session
+
+
+@pytest.fixture(scope="module")
+def session():
+    instrument = TestInstrumentProvider.binary_option()
+    deltas, trades = make_session(instrument, steps=100)  # 10 秒行情
+    return instrument, group_deltas(deltas) + trades
+
+
+def test_pacer_rejects_non_positive_speed():
+    with pytest.raises(ValueError):
+        ReplayPacer(0)
+
+
+class FakeTime:
+    """替代 backtest.replay.time：墙钟只随 sleep 前进，记录每次休眠"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, secs):
+        self.sleeps.append(secs)
+        self.now += secs
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr("backtest.replay.time", fake)
+    return fake
+
+
+def test_paced_replay_respects_speed(session, fake_time):
+    """20 倍实时：节流器按模拟时间休眠，10 秒行情累计休眠约 0.5 秒"""
+    instrument, data = session
+    pacer = ReplayPacer(20)
+    result = run_replay([instrument], data, make_config(instrument), actors=[pacer])
+
+    assert result.sim_seconds == pytest.approx(10.0, abs=0.2)
+    assert pacer.sleeps == len(fake_time.sleeps) > 0
+    # 最后一个时间片之后的行情不再休眠
+    slice_secs = pacer.slice_ms / 1000
+    assert sum(fake_time.sleeps) == pytest.approx(result.sim_seconds / 20, abs=slice_secs)
+
+
+def test_speed_does_not_change_strategy_behaviour(session, fake_time):
+    """尽可能快与节流回放的订单、成交完全一致"""
+    instrument, data = session
+
+    fast = run_replay([instrument], data, make_config(instrument))
+    paced = run_replay([instrument], data, make_config(instrument), speed=50)
+
+    assert fast.orders > 0
+    assert fake_time.sleeps
+    assert (fast.orders, fast.fills, fast.pnl) == (paced.orders, paced.fills, paced.pnl)
@@ -0,0 +1,130 @@
+"""
+重报调度器单元测试
+
+测试范围：
+- 首次更新立即重报
+- 盘口移动触发、最小间隔合并、心跳
+- 被合并的变化在间隔结束后补报
+- 策略的补报定时器名字唯一，作废的定时器到期后被忽略（不撤销定时器）
+
+运行方法：
+    pytest tests/unit/test_requote_scheduler.py -v
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.harness import build_engine
+from strategies.market_making_strategy import MarketMakingStrategy
+from strategies.requote_scheduler import RequoteScheduler
+from tests.unit.test_backtest_harness import make_config
+
+
+MS = 1_000_000
+
+
+@pytest.fixture
+def scheduler():
+    """1 tick 触发、100ms 最小间隔、1s 心跳"""
+    sched = RequoteScheduler(trigger_ticks=1, min_interval_ns=100 * MS, max_interval_ns=1000 * MS)
+    sched.mark(0, 590, 610)
+    return sched
+
+
+def test_first_update_requotes():
+    """未报价时立即重报"""
+    sched = RequoteScheduler(trigger_ticks=1, min_interval_ns=100 * MS, max_interval_ns=1000 * MS)
+
+    assert sched.should_requote(0, 590, 610) is True
+
+
+def test_unchanged_book_waits_for_heartbeat(scheduler):
+    """盘口不变时等待心跳"""
+    assert scheduler.should_requote(500 * MS, 590, 610) is False
+    assert scheduler.should_requote(1000 * MS, 590, 610) is True
+
+
+def test_touch_move_requotes_immediately(scheduler):
+    """盘口移动超过阈值立即重报"""
+    assert scheduler.should_requote(150 * MS, 591, 610) is True
+
+
+def test_move_below_trigger_ignored():
+    """移动不足阈值时不重报"""
+    sched = RequoteScheduler(trigger_ticks=3, min_interval_ns=0, max_interval_ns=0)
+    sched.mark(0, 590, 610)
+
+    assert sched.should_requote(10 * MS, 592, 608) is False
+    assert sched.should_requote(20 * MS, 593, 610) is True
+
+
+def test_burst_is_coalesced(scheduler):
+    """最小间隔内的变化被合并为待处理"""
+    assert scheduler.should_requote(50 * MS, 595, 612) is False
+    assert scheduler.pending is True
+    assert scheduler.next_allowed_ns() == 100 * MS
+
+    # 间隔结束后即使盘口回到原位也补报一次
+    assert scheduler.should_requote(100 * MS, 590, 610) is True
+
+
+def test_mark_clears_pending(scheduler):
+    """重报后清除待处理标记"""
+    scheduler.should_requote(50 * MS, 595, 612)
+    scheduler.mark(100 * MS, 595, 612)
+
+    assert scheduler.pending is False
+    assert scheduler.should_requote(150 * MS, 595, 612) is False
+
+
+def test_no_heartbeat_when_disabled():
+    """max_interval 为 0 时不做心跳"""
+    sched = RequoteScheduler(trigger_ticks=1, min_interval_ns=0, max_interval_ns=0)
+    sched.mark(0, 590, 610)
+
+    assert sched.should_requote(10_000 * MS, 590, 610) is False
+
+
+def test_reset(scheduler):
+    """重置后立即重报"""
+    scheduler.reset()
+
+    assert scheduler.should_requote(1 * MS, 590, 610) is True
+
+
+def test_strategy_requote_alerts_are_never_cancelled():
+    """每次补报用新名字；作废的定时器留在时钟上，到期时被忽略"""
+    instrument = TestInstrumentProvider.binary_option()
+    engine = build_engine([instrument])
+    strategy = MarketMakingStrategy(make_config(instrument))
+    engine.add_strategy(strategy)
+    strategy.start()
+
+    try:
+        slot = strategy._slot
+
+        strategy._schedule_pending_requote(slot)
+        first = slot.requote_alert
+        strategy._cancel_requote_alert(slot)
+        strategy._schedule_pending_requote(slot)
+        second = slot.requote_alert
+
+        assert first != second
+        assert {first, second} <= set(strategy.clock.timer_names)
+
+        # 作废的定时器到期：忽略，当前定时器不受影响
+        strategy._on_requote_alert(slot.instrument_id, SimpleNamespace(name=first))
+        assert slot.requote_alert == second
+
+        strategy._on_requote_alert(slot.instrument_id, SimpleNamespace(name=second))
+        assert slot.requote_alert is None
+    finally:
+        strategy.stop()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,98 @@
+"""
+环形缓冲区单元测试
+
+测试范围：
+- 追加、覆盖、索引顺序
+- 最近 N 个样本（零拷贝分段 / 列表）
+- 调整容量
+
+运行方法：
+    pytest tests/unit/test_ring_buffer.py -v
+"""
+
+import pytest
+
+from strategies.ring_buffer import RingBuffer
+
+
+def test_append_until_full():
+    """未满时不覆盖"""
+    buffer = RingBuffer(3)
+
+    assert buffer.append(1.0) is None
+    assert buffer.append(2.0) is None
+    assert len(buffer) == 2
+    assert buffer.latest == 2.0
+
+
+def test_append_evicts_oldest():
+    """满后覆盖并返回最旧样本"""
+    buffer = RingBuffer(3)
+    for value in (1.0, 2.0, 3.0):
+        buffer.append(value)
+
+    assert buffer.append(4.0) == 1.0
+    assert len(buffer) == 3
+    assert list(buffer) == [2.0, 3.0, 4.0]
+
+
+def test_indexing_chronological():
+    """索引按时间顺序（支持负索引）"""
+    buffer = RingBuffer(3)
+    for value in range(5):
+        buffer.append(float(value))
+
+    assert buffer[0] == 2.0
+    assert buffer[-1] == 4.0
+
+    with pytest.raises(IndexError):
+        buffer[3]
+
+
+def test_last_n_wrapped():
+    """跨越缓冲区末尾时分两段返回"""
+    buffer = RingBuffer(4)
+    for value in range(6):
+        buffer.append(float(value))
+
+    segments = buffer.segments(4)
+
+    assert len(segments) == 2
+    assert buffer.last(4) == [2.0, 3.0, 4.0, 5.0]
+    assert buffer.last(2) == [4.0, 5.0]
+    assert buffer.last(10) == [2.0, 3.0, 4.0, 5.0]
+
+
+def test_last_n_empty():
+    """空缓冲区"""
+    buffer = RingBuffer(4)
+
+    assert buffer.last(3) == []
+    assert buffer.latest is None
+
+
+def test_resize_keeps_newest():
+    """缩小容量保留最新样本，之后继续正常追加"""
+    buffer = RingBuffer(10)
+    for value in range(10):
+        buffer.append(float(value))
+
+    buffer.resize(3)
+
+    assert buffer.capacity == 3
+    assert list(buffer) == [7.0, 8.0, 9.0]
+    assert buffer.append(10.0) == 7.0
+    assert list(buffer) == [8.0, 9.0, 10.0]
+
+
+def test_clear():
+    """清空后长度为 0"""
+    buffer = RingBuffer(3)
+    buffer.append(1.0)
+    buffer.clear()
+
+    assert len(buffer) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,219 @@
+"""
+滚动统计单元测试
+
+测试范围：
+- 增量波动率与全窗口重算一致
+- 窗口滑动、最小样本数、重置
+- 与价格历史共享缓冲区、运行中调整窗口
+- 累计统计、分位数草图、高水位回撤、降采样序列（Paper Trading 统计）
+
+运行方法：
+    pytest tests/unit/test_rolling_stats.py -v
+"""
+
+import random
+import statistics
+from decimal import Decimal
+
+import pytest
+
+from strategies.rolling_stats import (
+    DownsampledSeries,
+    DrawdownTracker,
+    QuantileSketch,
+    RollingVolatility,
+    RunningStats,
+)
+from strategies.ring_buffer import RingBuffer
+
+
+def _full_window_volatility(prices):
+    """参考实现：全窗口两遍扫描"""
+    mean = sum(prices) / len(prices)
+    variance = sum((p - mean) ** 2 for p in prices) / len(prices)
+    return variance ** 0.5 / mean
+
+
+def test_volatility_below_min_samples():
+    """样本不足时波动率为 0"""
+    vol = RollingVolatility(window=100)
+
+    for _ in range(9):
+        vol.update(0.60)
+
+    assert vol.volatility == 0.0
+
+
+def test_volatility_constant_prices():
+    """稳定价格波动率接近 0"""
+    vol = RollingVolatility(window=50)
+
+    for _ in range(500):
+        vol.update(0.60)
+
+    assert vol.volatility == pytest.approx(0.0, abs=1e-9)
+
+
+def test_volatility_matches_full_window():
+    """滑动窗口结果与全窗口重算一致"""
+    rng = random.Random(7)
+    window = 100
+    vol = RollingVolatility(window=window)
+    prices = []
+
+    for _ in range(1000):
+        price = 0.5 + rng.uniform(-0.2, 0.2)
+        prices.append(price)
+        vol.update(price)
+
+        if len(prices) >= 10:
+            expected = _full_window_volatility(prices[-window:])
+            assert vol.volatility == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+
+def test_volatility_resync_keeps_window():
+    """定期重算后窗口内容不变"""
+    window = 4
+    vol = RollingVolatility(window=window, min_samples=1)
+    prices = [0.1 * (i % 7 + 1) for i in range(window * vol.RESYNC_WINDOWS + 3)]
+
+    for price in prices:
+        vol.update(price)
+
+    expected = _full_window_volatility(prices[-window:])
+    assert len(vol) == window
+    assert vol.volatility == pytest.approx(expected, rel=1e-12)
+
+
+def test_volatility_reset():
+    """重置后清空窗口"""
+    vol = RollingVolatility(window=20)
+
+    for i in range(20):
+        vol.update(0.5 + i * 0.01)
+    vol.reset()
+
+    assert len(vol) == 0
+    assert vol.volatility == 0.0
+
+
+def test_volatility_shares_price_history():
+    """共享缓冲区：价格只写一次，窗口取历史中最新的样本"""
+    rng = random.Random(3)
+    history = RingBuffer(40)
+    vol = RollingVolatility(window=20, buffer=history)
+    prices = [0.5 + rng.uniform(-0.2, 0.2) for _ in range(100)]
+
+    for price in prices:
+        vol.update(price)
+
+    assert vol.buffer is history
+    assert history.last(40) == prices[-40:]
+    assert len(vol) == 20
+    assert vol.volatility == pytest.approx(_full_window_volatility(prices[-20:]), rel=1e-9)
+
+    with pytest.raises(ValueError):
+        RollingVolatility(window=50, buffer=history)
+
+
+def test_volatility_resize():
+    """调整窗口后按最新样本重算，之后继续增量更新"""
+    rng = random.Random(5)
+    history = RingBuffer(40)
+    vol = RollingVolatility(window=20, min_samples=1, buffer=history)
+    prices = [0.5 + rng.uniform(-0.2, 0.2) for _ in range(60)]
+
+    for price in prices[:50]:
+        vol.update(price)
+
+    vol.resize(8)
+    assert len(vol) == 8
+    assert vol.volatility == pytest.approx(_full_window_volatility(prices[42:50]), rel=1e-9)
+
+    history.resize(60)
+    vol.resize(30)
+    for price in prices[50:]:
+        vol.update(price)
+    assert len(vol) == 30
+    assert vol.volatility == pytest.approx(_full_window_volatility(prices[-30:]), rel=1e-9)
+
+
+def test_invalid_window():
+    """窗口必须为正数"""
+    with pytest.raises(ValueError):
+        RollingVolatility(window=0)
+
+
+def test_running_stats_and_quantiles():
+    """累计均值 / 方差与两遍扫描一致，分位数相对误差 < 1%"""
+    rng = random.Random(3)
+    values = [rng.lognormvariate(-4, 0.8) for _ in range(20000)]
+    stats = RunningStats()
+    sketch = QuantileSketch()
+
+    for value in values:
+        stats.update(value)
+        sketch.update(value)
+
+    assert stats.count == len(sketch) == len(values)
+    assert stats.mean == pytest.approx(statistics.fmean(values), rel=1e-9)
+    assert stats.std == pytest.approx(statistics.pstdev(values), rel=1e-9)
+    assert (stats.min, stats.max) == (min(values), max(values))
+
+    ordered = sorted(values)
+    for q in (0.5, 0.9, 0.99):
+        assert sketch.quantile(q) == pytest.approx(ordered[int(q * len(values)) - 1], rel=0.01)
+    assert QuantileSketch().quantile(0.5) == 0.0
+
+
+def test_drawdown_tracks_high_water_mark():
+    """回撤相对历史最高点，最大回撤不会因创新高而缩小"""
+    tracker = DrawdownTracker(initial=Decimal("0"))
+
+    for pnl in ("-2", "5", "3", "8", "1", "4", "9"):
+        tracker.update(Decimal(pnl))
+
+    assert tracker.max_drawdown == Decimal("7")           # 8 → 1
+    assert tracker.max_drawdown_peak == Decimal("8")
+    assert tracker.peak == Decimal("9")
+    assert tracker.drawdown == 0
+
+    tracker.update(Decimal("6"))
+    assert tracker.drawdown == Decimal("3")
+    assert tracker.max_drawdown == Decimal("7")
+
+
+def test_downsampled_series_is_bounded():
+    """点数不超过容量，覆盖整个时间段，间隔均匀"""
+    series = DownsampledSeries(capacity=64)
+
+    for i in range(100_000):
+        series.append(float(i), ts=i * 10)
+
+    points = series.points()
+    assert len(points) <= 64
+    assert points[0] == (0, 0.0)
+    assert points[-1][1] >= 100_000 - series.stride
+    assert {b[1] - a[1] for a, b in zip(points, points[1:])} == {series.stride}
+    assert series.last == 99_999.0 and series.count == 100_000
+
+
+def test_paper_trading_stats_are_streaming():
+    """PaperTradingStats 不保存逐笔样本，报告来自流式统计"""
+    from tests.test_paper_trading import PaperTradingStats
+
+    stats = PaperTradingStats()
+    for i in range(50_000):
+        stats.record_trade(Decimal("1") if i % 3 else Decimal("-2"), Decimal("0.02"))
+        stats.record_inventory(float(i % 100), ts=i)
+
+    assert len(stats.inventory_history) <= stats.INVENTORY_POINTS
+    assert stats.get_avg_spread() == pytest.approx(0.02)
+    assert stats.get_spread_quantile(0.5) == pytest.approx(0.02, rel=0.01)
+    assert stats.get_max_drawdown() == Decimal("2")
+    assert stats.get_final_inventory() == 99.0
+    assert stats.max_inventory == 99
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,164 @@
+"""
+每日市场滚动单元测试
+
+测试范围：
+- slug 生成与报价时间窗口
+- 回测中热加入下一个市场、收尾到期市场（撤单、平仓）
+- 移除后到达的迟到成交不会在当前市场上对冲
+
+运行方法：
+    pytest tests/unit/test_rollover.py -v
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from nautilus_trader.model.enums import OrderType
+from nautilus_trader.model.instruments import BinaryOption
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
+
+from backtest.harness import build_engine, group_deltas
+from markets.discovery import MarketInfo
+from markets.rollover import MarketRollover
+from markets.schedule import RolloverPlan, daily_slug
+from strategies.market_making_strategy import MarketMakingStrategy
+from tests.unit.test_backtest_harness import START_NS, make_config, make_session
+
+
+ET = ZoneInfo("America/New_York")
+
+
+def test_daily_slug():
+    assert daily_slug(date(2026, 1, 28)) == "bitcoin-up-or-down-on-january-28"
+    assert daily_slug(date(2026, 3, 1), "btc-{year}-{month}-{day}") == "btc-2026-march-1"
+
+
+def test_plan_rolls_at_wind_down():
+    plan = RolloverPlan()
+
+    morning = datetime(2026, 1, 28, 10, 0, tzinfo=ET)
+    assert [m.slug for m in plan.upcoming(morning)] == [
+        "bitcoin-up-or-down-on-january-28",
+        "bitcoin-up-or-down-on-january-29",
+    ]
+
+    # 结算前 30 分钟起进入收尾，当前市场换成下一天
+    late = datetime(2026, 1, 28, 11, 45, tzinfo=ET)
+    assert plan.current(late).slug == "bitcoin-up-or-down-on-january-29"
+    assert plan.should_wind_down(late, plan.market(date(2026, 1, 28)).expiry)
+
+
+def test_plan_quote_windows_overlap():
+    plan = RolloverPlan()
+    jan29 = plan.market(date(2026, 1, 29))
+
+    # 下一天的市场在当前市场收尾前 30 分钟开始报价
+    assert not plan.should_quote(datetime(2026, 1, 28, 10, 59, tzinfo=ET), jan29.expiry)
+    assert plan.should_quote(datetime(2026, 1, 28, 11, 0, tzinfo=ET), jan29.expiry)
+    assert jan29.expiry == datetime(2026, 1, 29, 17, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def instruments():
+    first = TestInstrumentProvider.binary_option()
+    data = BinaryOption.to_dict(first)
+    data["id"] = data["id"].replace("-", "-9", 1)
+    return [first, BinaryOption.from_dict(data)]
+
+
+def test_rollover_in_backtest(instruments):
+    today, tomorrow = instruments
+    start = datetime.fromtimestamp(START_NS / 1e9, tz=timezone.utc)   # 2023-11-14 22:13:20
+
+    # 结算时刻设在回放区间内：今天的市场 +15s 收尾，明天的市场 +10s 开始报价
+    plan = RolloverPlan(
+        quote_window=timedelta(days=1, seconds=10),
+        wind_down=timedelta(seconds=5),
+        template="{month}-{day}",
+        expiry_time=time(22, 13, 40),
+        tz="UTC",
+    )
+    ids = {"november-14": today.id, "november-15": tomorrow.id}
+    lookups = []
+
+    def lookup(slugs):
+        lookups.append(list(slugs))
+        found = {s: MarketInfo(s, "0x1", (s,)) for s in slugs if s in ids}
+        return found, {s: LookupError(s) for s in slugs if s not in ids}
+
+    data = []
+    for seed, instrument in enumerate(instruments):
+        deltas, trades = make_session(instrument, steps=300, seed=seed)
+        data += group_deltas(deltas) + trades
+
+    engine = build_engine(instruments)
+    try:
+        strategy = MarketMakingStrategy(make_config(today))
+        engine.add_strategy(strategy)
+        engine.add_actor(MarketRollover(
+            strategy,
+            plan,
+            lookup=lookup,
+            instrument_id_for=lambda market: ids[market.slug],
+            check_interval_secs=1,
+            background=False,
+        ))
+        engine.add_data(data)
+        engine.run()
+
+        cache = engine.cache
+        roll_in = start + timedelta(seconds=10)
+        wind_down = start + timedelta(seconds=15 + 1)    # 最多晚一个检查间隔
+
+        tomorrow_orders = cache.orders(instrument_id=tomorrow.id)
+        assert tomorrow_orders
+        assert min(o.init_event.ts_init for o in tomorrow_orders) >= roll_in.timestamp() * 1e9
+
+        today_quotes = [o for o in cache.orders(instrument_id=today.id) if o.order_type == OrderType.LIMIT]
+        assert today_quotes
+        assert max(o.init_event.ts_init for o in today_quotes) <= wind_down.timestamp() * 1e9
+        assert cache.orders_open(instrument_id=today.id) == []
+        assert engine.portfolio.is_flat(today.id)
+
+        assert strategy.trading_instrument_ids() == [tomorrow.id]
+        assert lookups[0] == ["november-14", "november-15"]
+        assert all(slugs == ["november-16"] for slugs in lookups[1:])
+    finally:
+        engine.dispose()
+
+
+def test_late_fill_after_removal_stays_on_retired_market(instruments, monkeypatch):
+    today, tomorrow = instruments
+    engine = build_engine(instruments)
+    try:
+        strategy = MarketMakingStrategy(make_config(today, instrument_ids=(str(today.id), str(tomorrow.id))))
+        engine.add_strategy(strategy)
+        strategy.start()
+
+        assert strategy.remove_instrument(today.id)
+        assert strategy.instrument_id == tomorrow.id
+
+        hedged, closed = [], []
+        monkeypatch.setattr(strategy, "_need_hedge", lambda: True)
+        monkeypatch.setattr(strategy, "_hedge_inventory", lambda: hedged.append(strategy.instrument_id))
+        monkeypatch.setattr(strategy, "close_all_positions", lambda instrument_id, *args, **kwargs: closed.append(instrument_id))
+
+        # 撤单生效前成交的挂单：成交事件在移除之后才到达
+        order = TestExecStubs.limit_order(instrument=today)
+        strategy.on_order_filled(TestEventStubs.order_filled(order, today, strategy_id=strategy.id))
+
+        assert hedged == []
+        assert closed == [today.id]
+        assert strategy.instrument_id == tomorrow.id
+
+        # 当前市场的成交照常对冲
+        order = TestExecStubs.limit_order(instrument=tomorrow)
+        strategy.on_order_filled(TestEventStubs.order_filled(order, tomorrow, strategy_id=strategy.id))
+        assert hedged == [tomorrow.id]
+        strategy.stop()
+    finally:
+        engine.dispose()
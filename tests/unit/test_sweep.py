@@ -0,0 +1,85 @@
+"""
+参数扫描单元测试
+
+测试范围：
+- 网格 / 随机搜索的参数空间
+- 多进程结果与单进程一致
+- 结果表排序
+
+运行方法：
+    pytest tests/unit/test_sweep.py -v
+"""
+
+import pytest
+
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from backtest.harness import group_deltas
+from backtest.sweep import format_table, grid, random_search, run_sweep, sort_rows
+from tests.unit.test_backtest_harness import make_config, make_session
+
+
+@pytest.fixture(scope="module")
+def session():
+    instrument = TestInstrumentProvider.binary_option()
+    deltas, trades = make_session(instrument, steps=150)
+    return instrument, group_deltas(deltas) + trades
+
+
+def test_grid_is_cartesian_product():
+    param_sets = grid({"base_spread": ["0.01", "0.02"], "order_size": [5, 10, 15]})
+
+    assert len(param_sets) == 6
+    assert {"base_spread": "0.02", "order_size": 15} in param_sets
+
+
+def test_random_search_is_seeded_and_bounded():
+    space = {"hedge_threshold": (20, 120), "base_spread": (0.005, 0.05), "use_dynamic_spread": [True, False]}
+
+    first = random_search(space, 20, seed=3)
+
+    assert first == random_search(space, 20, seed=3)
+    assert all(isinstance(p["hedge_threshold"], int) and 20 <= p["hedge_threshold"] <= 120 for p in first)
+    assert all(0.005 <= p["base_spread"] <= 0.05 for p in first)
+
+
+def test_parallel_matches_inline(session):
+    instrument, data = session
+    param_sets = grid({"base_spread": ["0.01", "0.03"], "order_size": [5, 8]})
+
+    inline = run_sweep([instrument], data, make_config(instrument), param_sets, workers=1)
+    parallel = run_sweep([instrument], data, make_config(instrument), param_sets, workers=2)
+
+    assert parallel == inline
+    assert all(row["error"] is None for row in inline)
+    assert any(row["fills"] > 0 for row in inline)
+
+
+def test_invalid_parameter_reported_per_row(session):
+    instrument, data = session
+
+    rows = run_sweep([instrument], data, make_config(instrument), [{"no_such_field": 1}], workers=1)
+
+    assert rows[0]["pnl"] is None
+    assert "no_such_field" in rows[0]["error"]
+
+
+def test_sort_rows():
+    rows = [
+        {"pnl": 1.0, "max_drawdown": 0.5},
+        {"pnl": None, "max_drawdown": None, "error": "x"},
+        {"pnl": 3.0, "max_drawdown": 0.9},
+    ]
+
+    assert [row["pnl"] for row in sort_rows(rows, "pnl")] == [3.0, 1.0, None]
+    assert [row["max_drawdown"] for row in sort_rows(rows, "max_drawdown")] == [0.5, 0.9, None]
+
+
+def test_format_table_lists_parameters_and_metrics():
+    rows = [{"base_spread": "0.02", "pnl": 1.5, "fill_rate": 0.1, "max_drawdown": 0.2,
+             "turnover": 3.0, "fills": 4, "orders": 40, "error": None}]
+
+    table = format_table(rows)
+
+    assert "base_spread" in table.splitlines()[0]
+    assert "1.5000" in table
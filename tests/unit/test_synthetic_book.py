@@ -0,0 +1,119 @@
+"""
+合成行情单元测试
+
+测试范围：
+- 同一 seed 结果相同，块之间序号和时间连续
+- 价格在 (0, 1) 内且落在 tick 上，回放的订单簿（跨块）不交叉、深度集中在中间价附近
+- YES / NO 镜像，新闻冲击期间更新更密集
+- 合成数据可直接回测
+
+运行方法：
+    pytest tests/unit/test_synthetic_book.py -v
+"""
+
+import numpy as np
+import pytest
+
+from nautilus_trader.model.book import OrderBook
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.enums import BookType
+
+from backtest.harness import run_backtest
+from backtest.records import KIND_TRADE
+from backtest.synthetic import (
+    SyntheticBookConfig,
+    SyntheticMarket,
+    binary_market,
+    chunks,
+    engine_data,
+    generate,
+    generate_markets,
+)
+from tests.unit.test_backtest_harness import make_config
+
+
+@pytest.fixture(scope="module", params=["0.01", "0.001"])
+def market(request):
+    return binary_market(request.param)
+
+
+def test_seeded_and_chunked(market, monkeypatch):
+    yes, no = market
+
+    first, _ = generate(yes, 2000, seed=3, no_instrument=no)
+    second, _ = generate(yes, 2000, seed=3, no_instrument=no)
+    other, _ = generate(yes, 2000, seed=4, no_instrument=no)
+    assert np.array_equal(first, second)
+    assert not np.array_equal(first[:len(other)], other[:len(first)])
+
+    # 分块生成延续状态：序号（= 更新次数）和时间跨块连续
+    monkeypatch.setattr("backtest.synthetic.CHUNK_UPDATES", 300)
+    pieces = list(SyntheticMarket(yes, seed=3, no_instrument=no).iter_records(2000))
+    assert len(pieces) == 7
+    for previous, piece in zip(pieces, pieces[1:]):
+        assert piece["sequence"][0] == previous["sequence"][-1] + 1
+        assert piece["ts_init"][0] > previous["ts_init"][-1]
+    assert pieces[-1]["sequence"][-1] == first["sequence"][-1] == 2000
+
+
+def test_books_stay_valid(market, monkeypatch):
+    yes, no = market
+    monkeypatch.setattr("backtest.synthetic.CHUNK_UPDATES", 700)
+    records, table = generate(yes, 3000, seed=1, no_instrument=no)
+    tick = int(round(float(yes.price_increment) * 10 ** yes.price_precision))
+
+    assert np.all(np.diff(records["ts_init"].astype(np.int64)) >= 0)
+    priced = records[records["price"] > 0]
+    assert np.all(priced["price"] % tick == 0)
+    assert np.all(priced["price"] < 10 ** yes.price_precision)
+
+    books = {yes.id: OrderBook(yes.id, BookType.L2_MBP), no.id: OrderBook(no.id, BookType.L2_MBP)}
+    top_sizes, bottom_sizes = [], []
+    for item in engine_data(records, table):
+        if not isinstance(item, OrderBookDeltas):
+            continue
+        book = books[item.instrument_id]
+        book.apply_deltas(item)
+        assert book.best_bid_price() < book.best_ask_price()
+        assert len(book.bids()) <= 20 and len(book.asks()) <= 20
+
+        if item.instrument_id == no.id:
+            # NO 买盘 = 1 - YES 卖盘，数量相同
+            mirror = books[yes.id]
+            assert [1 - level.price.as_double() for level in mirror.asks()] == pytest.approx(
+                [level.price.as_double() for level in book.bids()]
+            )
+            assert [level.size() for level in mirror.asks()] == [level.size() for level in book.bids()]
+        elif len(book.bids()) == 20:
+            top_sizes.append(book.bids()[0].size())
+            bottom_sizes.append(book.bids()[-1].size())
+
+    assert np.mean(top_sizes) > 3 * np.mean(bottom_sizes)
+
+
+def test_news_bursts_are_denser():
+    yes, _ = binary_market()
+    config = SyntheticBookConfig(news_probability=0.002, burst_updates=200, volatility=0.0, trade_probability=0.0)
+    market = SyntheticMarket(yes, config, seed=5)
+    records = market.records(20_000)
+
+    # 每次更新的最后一条增量带 F_LAST，其时间间隔即更新间隔
+    ts = records["ts_event"][records["flags"] > 0].astype(np.int64)
+    gaps = np.diff(ts)
+    assert np.median(gaps) < 1e9 / config.updates_per_second
+    assert gaps.min() < 1e9 / config.updates_per_second / config.burst_rate
+    assert not np.any(records["kind"] == KIND_TRADE)
+
+
+def test_backtest_on_synthetic_markets():
+    instruments, records, table = generate_markets(2, 1500, seed=2)
+
+    assert len(instruments) == 4
+    assert len(table.ids) == 4
+    assert set(np.unique(records["instrument"])) == {0, 1, 2, 3}
+
+    streamed = [item for chunk in chunks(records, table, chunk_size=500) for item in chunk]
+    assert len(streamed) == len(engine_data(records, table))
+
+    result = run_backtest(instruments, streamed, make_config(instruments[0]))
+    assert result.orders > 0
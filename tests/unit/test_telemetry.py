@@ -0,0 +1,58 @@
+"""
+遥测日志单元测试
+
+测试范围：
+- 级别解析
+- key=value 格式化
+- 更新采样
+
+运行方法：
+    pytest tests/unit/test_telemetry.py -v
+"""
+
+import pytest
+
+from strategies.telemetry import DEBUG, INFO, WARNING, UpdateSampler, format_kv, parse_level
+
+
+def test_parse_level():
+    """级别名称不区分大小写，未知名称使用默认值"""
+    assert parse_level("debug") == DEBUG
+    assert parse_level("WARN") == WARNING
+    assert parse_level("unknown") == INFO
+    assert parse_level(WARNING) == WARNING
+
+
+def test_format_kv():
+    """float 保留 4 位小数，其余使用 str()"""
+    record = format_kv("quote", {"mid": 0.6, "size": 20, "changed": True})
+
+    assert record == "quote mid=0.6000 size=20 changed=True"
+
+
+def test_sampler_every_n():
+    """无变化时每 N 次输出一次"""
+    sampler = UpdateSampler(every_n=3)
+
+    emitted = [sampler.should_emit() for _ in range(6)]
+
+    assert emitted == [False, False, True, False, False, True]
+
+
+def test_sampler_changed_always_emits():
+    """发生变化时立即输出"""
+    sampler = UpdateSampler(every_n=100)
+
+    assert sampler.should_emit(changed=True) is True
+    assert sampler.should_emit() is False
+
+
+def test_sampler_every_update():
+    """every_n <= 1 时每次都输出"""
+    sampler = UpdateSampler(every_n=0)
+
+    assert all(sampler.should_emit() for _ in range(5))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,105 @@
+"""
+端到端吞吐基准单元测试
+
+测试范围：
+- 本地 TradingNode 按速率阶梯运行，策略收到并处理合成行情
+- 过载需要持续的状态（多数窗口跟不上或 p99 超限 / 积压持续增长），同一速率连续过载才确认饱和
+- 饱和判定与报告
+- 命令行：JSON 输出，低于 --min-rate 时返回 1
+
+运行方法：
+    pytest tests/unit/test_throughput.py -v
+"""
+
+import json
+
+from diagnostics.throughput import StepResult, ThroughputReport, _backlog_growing, rss_bytes, run_throughput
+from run_throughput import main
+
+
+def make_step(rate, processed, p99_ms=1.0, overloaded=False, saturated=False):
+    return StepResult(
+        target_rate=rate,
+        offered_rate=rate,
+        processed_rate=processed,
+        dispatch_p50_ms=0.5,
+        dispatch_p99_ms=p99_ms,
+        dispatch_max_ms=p99_ms,
+        tick_to_trade_p50_ms=0.5,
+        tick_to_trade_p99_ms=p99_ms,
+        max_backlog=0,
+        cpu_percent=50.0,
+        rss_mb=100.0,
+        overloaded=overloaded or saturated,
+        saturated=saturated,
+    )
+
+
+def test_report_saturation_rate():
+    report = ThroughputReport(markets=2, instruments=4, steps=[
+        make_step(100, 100),
+        make_step(200, 180, p99_ms=80.0, overloaded=True),    # 瞬时抖动，重测通过
+        make_step(200, 199),
+        make_step(400, 250, p99_ms=80.0, saturated=True),
+        make_step(400, 240, p99_ms=90.0, saturated=True),
+        make_step(800, 800),    # --no-stop：确认饱和之后的结果不计入
+    ])
+
+    assert report.saturation_rate == 199
+    assert report.steps[3].ratio == 250 / 400
+    table = report.format_table()
+    assert "SATURATED" in table and "retry" in table
+    assert report.to_dict()["steps"][0]["processed_rate"] == 100
+
+    assert ThroughputReport(markets=1, instruments=2).saturation_rate is None
+    assert rss_bytes() > 0
+
+
+def test_overload_needs_sustained_condition():
+    step = make_step(1000, 1000)
+    step.windows = 6
+
+    # 一个窗口跟不上 / 一次停顿推高 p99 不算过载，多数窗口如此才算
+    step.windows_behind = step.windows_slow = 1
+    assert not step.is_overloaded(max_p99_ms=50.0, min_ratio=0.9)
+    step.windows_behind = 4
+    assert step.is_overloaded(max_p99_ms=50.0, min_ratio=0.9)
+    step.windows_behind, step.windows_slow = 0, 4
+    assert step.is_overloaded(max_p99_ms=50.0, min_ratio=0.9)
+
+    # 停顿后排空的积压不算增长；持续增长的积压算
+    drained = [(0.5, 500, 500, 0, 0), (0.5, 500, 100, 400, 0), (0.5, 500, 900, 0, 0), (0.5, 500, 500, 0, 0)]
+    growing = [(0.5, 500, 400, 100, 0), (0.5, 500, 300, 300, 0), (0.5, 500, 100, 700, 0), (0.5, 500, 100, 1100, 0)]
+    assert not _backlog_growing(drained, 1000)
+    assert _backlog_growing(growing, 1000)
+
+
+def test_node_processes_synthetic_feed():
+    report = run_throughput(markets=2, rates=(100, 200), step_secs=0.6, warmup_secs=0.2)
+
+    assert report.instruments == 4
+    assert [step.target_rate for step in report.steps if step.attempt == 1] == [100, 200]
+    for step in report.steps:
+        assert step.offered_rate > 0.5 * step.target_rate
+        assert 0 < step.processed_rate <= step.offered_rate * 1.25
+        assert step.dispatch_p50_ms > 0
+        assert step.windows > 0
+        assert step.cpu_percent > 0 and step.rss_mb > 0
+
+    # dispatch p99 上限为 0：每次都过载，同一速率连续两次后确认饱和，不再加压
+    saturated = run_throughput(markets=1, rates=(100, 200), step_secs=0.3, warmup_secs=0, max_p99_ms=0)
+    assert [(step.target_rate, step.attempt) for step in saturated.steps] == [(100, 1), (100, 2)]
+    assert all(step.saturated for step in saturated.steps)
+    assert saturated.saturation_rate is None
+
+
+def test_cli_writes_json_and_gates(tmp_path):
+    path = tmp_path / "throughput.json"
+    args = ["--rates", "100", "--step-secs", "0.3", "--warmup-secs", "0", "--json", str(path)]
+
+    assert main(args + ["--min-rate", "1000000"]) == 1
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload[0]["markets"] == 1
+    # 过载时会以同一速率重测
+    assert {step["target_rate"] for step in payload[0]["steps"]} == {100}